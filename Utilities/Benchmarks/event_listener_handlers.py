@@ -0,0 +1,295 @@
+"""
+Latency benchmark for the editor hot paths of VictoriaEventListener:
+on_query_completions, on_hover, on_selection_modified_async and on_post_save_async.
+
+The plugin is started outside of sublime with the stand-ins in fake_sublime.py and
+loads the game and mod objects like it does on startup. Then a session of caret moves,
+keystrokes, hovers and saves is replayed over script files of the first mod, each
+event calling the handlers sublime would call for it, and the p50 and p99 latency of
+every handler is reported. Work a handler queues with set_timeout_async is timed
+separately as "<handler> async".
+
+Sessions are json lists of events, a session can be recorded with --record and
+replayed with --session so runs before and after a change replay the same events.
+Without --session a session is generated from the largest script files of the mod.
+
+The mods are copied to a temporary directory first so saves don't touch the real
+files. JominiTools has to be installed next to this package, as it is in sublime's
+Packages directory, or its parent directory has to be passed with --packages.
+
+Usage: python event_listener_handlers.py --game <game dir> --mod <mod dir>
+"""
+
+import argparse
+import importlib
+import json
+import math
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+import types
+from typing import Callable, Dict, List
+
+import fake_sublime
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+package_path = os.path.dirname(os.path.dirname(benchmarks_path))
+package_name = "victoria3tools_benchmark"
+
+# Syntax of the files the plugin handles, by extension
+syntaxes = {
+    ".txt": fake_sublime.Syntax("Victoria Script", "source.victoria3"),
+    ".gui": fake_sublime.Syntax("Victoria Gui", "source.victoria3.gui"),
+    ".yml": fake_sublime.Syntax("Victoria Localization", "source.victoria3.yml"),
+}
+
+# How often each kind of event is generated
+event_weights = {"move": 30, "type": 50, "hover": 15, "save": 5}
+
+identifier_pattern = re.compile(r"\b[a-z_][a-z_0-9]{3,}\b")
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which registers every command of the plugin.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.join(package_path, "src")]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+def largest_files(mod: str, count: int) -> List[str]:
+    """Get the largest script and gui files of a mod, relative to the mod"""
+    files = list()
+    for root, _, names in os.walk(mod):
+        for name in names:
+            if os.path.splitext(name)[1] in (".txt", ".gui"):
+                path = os.path.join(root, name)
+                files.append((os.path.getsize(path), os.path.relpath(path, mod)))
+    return [x[1] for x in sorted(files, reverse=True)[:count]]
+
+
+def generate_session(mod: str, files: List[str], events: int, seed: int) -> list:
+    """Generate events that look like someone editing files, spread over files"""
+    rng = random.Random(seed)
+    session = list()
+    for relative in files:
+        with open(os.path.join(mod, relative), "r", encoding="utf-8-sig") as file:
+            text = file.read()
+        words = list(identifier_pattern.finditer(text)) or None
+        length = len(text)
+
+        generated = 0
+        while generated < events:
+            kind = rng.choices(list(event_weights), list(event_weights.values()))[0]
+            if kind in ("move", "hover"):
+                if words:
+                    point = rng.choice(words).start() + 1
+                else:
+                    point = rng.randrange(length + 1)
+                session.append({"file": relative, "event": kind, "point": point})
+                generated += 1
+            elif kind == "type":
+                # Type a word that is used in the file on a new line, one key at a time
+                point = text.find("\n", rng.randrange(length + 1))
+                point = length if point == -1 else point
+                word = rng.choice(words).group() if words else "value"
+                typed = "\n\t" + word
+                for char in typed:
+                    session.append(
+                        {"file": relative, "event": kind, "point": point, "text": char}
+                    )
+                    point += 1
+                text = text[: point - len(typed)] + typed + text[point - len(typed) :]
+                length = len(text)
+                generated += len(typed)
+            else:
+                session.append({"file": relative, "event": "save"})
+                generated += 1
+    return session
+
+
+class Replay:
+    def __init__(self, listener, mod: str):
+        self.listener = listener
+        self.mod = mod
+        self.views: Dict[str, fake_sublime.FakeView] = dict()
+        self.timings: Dict[str, List[float]] = dict()
+
+    def view(self, relative: str) -> fake_sublime.FakeView:
+        if relative not in self.views:
+            path = os.path.join(self.mod, relative)
+            with open(path, "r", encoding="utf-8-sig") as file:
+                text = file.read()
+            syntax = syntaxes[os.path.splitext(relative)[1]]
+            self.views[relative] = fake_sublime.FakeView(path, text, syntax)
+        return self.views[relative]
+
+    def measure(self, handler: str, call: Callable[[], object]):
+        t0 = time.perf_counter()
+        call()
+        self.timings.setdefault(handler, list()).append(time.perf_counter() - t0)
+
+        if fake_sublime.pending:
+            t0 = time.perf_counter()
+            run_pending()
+            seconds = time.perf_counter() - t0
+            self.timings.setdefault(f"{handler} async", list()).append(seconds)
+
+    def run(self, event: dict):
+        view = self.view(event["file"])
+        listener = self.listener
+        kind = event["event"]
+        if kind == "move":
+            region = fake_sublime.Region(event["point"])
+            view.selection = fake_sublime.Selection([region])
+            self.measure(
+                "on_selection_modified_async",
+                lambda: listener.on_selection_modified_async(view),
+            )
+        elif kind == "hover":
+            self.measure("on_hover", lambda: listener.on_hover(view, event["point"], 1))
+        elif kind == "type":
+            view.insert_text(event["point"], event["text"])
+            point = view.sel()[0].a
+            prefix = view.substr(fake_sublime.Region(view.word(point).a, point))
+            self.measure(
+                "on_selection_modified_async",
+                lambda: listener.on_selection_modified_async(view),
+            )
+            self.measure(
+                "on_query_completions",
+                lambda: listener.on_query_completions(view, prefix, [point]),
+            )
+        elif kind == "save":
+            with open(view.file_name(), "w", encoding="utf-8-sig") as file:
+                file.write(view.text)
+            self.measure(
+                "on_post_save_async", lambda: listener.on_post_save_async(view)
+            )
+
+    def report(self) -> str:
+        lines = [
+            f"{'handler':<36}{'calls':>7}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+        ]
+        for handler in sorted(self.timings):
+            timings = sorted(self.timings[handler])
+            lines.append(
+                f"{handler:<36}{len(timings):>7}"
+                f"{percentile(timings, 0.5) * 1e3:>10.3f}"
+                f"{percentile(timings, 0.99) * 1e3:>10.3f}"
+                f"{timings[-1] * 1e3:>10.3f}"
+            )
+
+        missing = set()
+        for view in self.views.values():
+            missing.update(view.missing)
+        if missing:
+            missing_methods = ", ".join(sorted(missing))
+            lines.append(f"\nView methods that were not emulated: {missing_methods}")
+        return "\n".join(lines)
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    """Nearest rank percentile of sorted timings"""
+    return timings[max(0, math.ceil(fraction * len(timings)) - 1)]
+
+
+def run_pending():
+    """Run everything queued with set_timeout, including what those callbacks queue"""
+    while fake_sublime.pending:
+        callbacks = list(fake_sublime.pending)
+        fake_sublime.pending.clear()
+        for callback in callbacks:
+            callback()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", required=True, help="the Victoria 3 game directory")
+    parser.add_argument(
+        "--mod", action="append", required=True, help="a mod directory, can be repeated"
+    )
+    parser.add_argument(
+        "--packages",
+        default=os.path.dirname(package_path),
+        help="directory that JominiTools is installed in",
+    )
+    parser.add_argument("--session", help="replay the events in this session file")
+    parser.add_argument("--record", help="write the replayed session to this file")
+    parser.add_argument(
+        "--files", type=int, default=3, help="number of files to generate events for"
+    )
+    parser.add_argument("--events", type=int, default=500, help="events per file")
+    parser.add_argument("--seed", type=int, default=0, help="seed of generated events")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    work_path = tempfile.mkdtemp(prefix="victoria3tools_benchmark_")
+    try:
+        mods = list()
+        for index, mod in enumerate(args.mod):
+            mods.append(os.path.join(work_path, "mods", str(index)))
+            shutil.copytree(mod, mods[-1])
+
+        if args.session:
+            with open(args.session, "r", encoding="utf-8") as file:
+                session = json.load(file)
+        else:
+            files = largest_files(mods[0], args.files)
+            session = generate_session(mods[0], files, args.events, args.seed)
+        if args.record:
+            with open(args.record, "w", encoding="utf-8") as file:
+                json.dump(session, file, indent=0)
+
+        fake_sublime.install(os.path.join(work_path, "cache"), args.packages)
+        sys.path.insert(0, args.packages)
+        settings = fake_sublime.read_settings_file(
+            os.path.join(package_path, "Victoria.sublime-settings")
+        )
+        settings.update(
+            {
+                "GameFilesPath": args.game,
+                "PathsToModFiles": mods,
+                "LazyObjectLoading": False,
+                "WatchObjectFiles": False,
+            }
+        )
+        fake_sublime.settings_files["Victoria.sublime-settings"] = (
+            fake_sublime.Settings(settings)
+        )
+
+        event_listener = import_module("event_listener")
+        # The benchmark must not rewrite the plugin's syntax files
+        import_module("game_objects").write_data_to_syntax = lambda *args: None
+        event_listener.write_data_to_syntax = lambda *args: None
+        listener = event_listener.VictoriaEventListener()
+        listener.write_data_to_syntax = lambda *args: None
+
+        t0 = time.perf_counter()
+        listener.on_init([])
+        run_pending()
+        print(f"Plugin started in {time.perf_counter() - t0:.3f} seconds")
+
+        replay = Replay(listener, mods[0])
+        t0 = time.perf_counter()
+        for event in session:
+            replay.run(event)
+        print(
+            f"Replayed {len(session)} events over {len(replay.views)} files in "
+            f"{time.perf_counter() - t0:.3f} seconds\n"
+        )
+        print(replay.report())
+    finally:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
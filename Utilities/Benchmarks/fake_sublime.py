@@ -0,0 +1,403 @@
+"""
+In-memory stand-ins for the sublime and sublime_plugin modules used by the editor
+benchmarks, so the plugin's event listener can run outside of sublime.
+
+FakeView holds the text of a file and implements the parts of the View API that the
+plugin and JominiTools use for completion and hover. There is no syntax definition
+behind it, so selector matching only knows about comments. Methods it doesn't
+implement return None and are recorded in FakeView.missing so a benchmark can tell
+which calls weren't measured faithfully.
+
+Callbacks passed to set_timeout and set_timeout_async are queued instead of run, the
+benchmark runs them after each event and times them separately.
+"""
+
+import json
+import re
+import sys
+import types
+from typing import Callable, Dict, List, Optional, Set, Union
+
+# Callbacks queued by set_timeout and set_timeout_async
+pending: List[Callable[[], None]] = list()
+
+# Settings returned by load_settings, by file name
+settings_files: Dict[str, "Settings"] = dict()
+
+cache_directory = ""
+packages_directory = ""
+
+
+class Region:
+    def __init__(self, a: int, b: Optional[int] = None):
+        self.a = a
+        self.b = a if b is None else b
+
+    def begin(self) -> int:
+        return min(self.a, self.b)
+
+    def end(self) -> int:
+        return max(self.a, self.b)
+
+    def size(self) -> int:
+        return self.end() - self.begin()
+
+    def empty(self) -> bool:
+        return self.a == self.b
+
+    def contains(self, x: Union["Region", int]) -> bool:
+        if isinstance(x, Region):
+            return self.begin() <= x.begin() and x.end() <= self.end()
+        return self.begin() <= x <= self.end()
+
+    def intersects(self, other: "Region") -> bool:
+        return self.begin() < other.end() and other.begin() < self.end()
+
+    def cover(self, other: "Region") -> "Region":
+        return Region(min(self.begin(), other.begin()), max(self.end(), other.end()))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Region) and (self.a, self.b) == (other.a, other.b)
+
+    def __len__(self) -> int:
+        return self.size()
+
+    def __repr__(self) -> str:
+        return f"Region({self.a}, {self.b})"
+
+
+class Selection(list):
+    def add(self, region: Region):
+        self.append(region)
+
+
+class Settings:
+    def __init__(self, values: Optional[dict] = None):
+        self.values = dict(values or ())
+
+    def get(self, key: str, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key: str, value):
+        self.values[key] = value
+
+    def has(self, key: str) -> bool:
+        return key in self.values
+
+    def erase(self, key: str):
+        self.values.pop(key, None)
+
+    def add_on_change(self, tag: str, callback):
+        pass
+
+    def clear_on_change(self, tag: str):
+        pass
+
+
+class Syntax:
+    def __init__(self, name: str, scope: str):
+        self.name = name
+        self.scope = scope
+        self.path = ""
+        self.hidden = False
+
+
+class CompletionItem:
+    def __init__(self, trigger: str, annotation: str = "", completion: str = "", **kw):
+        self.trigger = trigger
+        self.annotation = annotation
+        self.completion = completion or trigger
+        self.details = kw.get("details", "")
+        self.kind = kw.get("kind")
+
+
+class CompletionList:
+    def __init__(self, completions=None, flags: int = 0):
+        self.completions = list(completions or ())
+        self.flags = flags
+
+    def set_completions(self, completions, flags: int = 0):
+        self.completions = list(completions)
+        self.flags = flags
+
+
+word_pattern = re.compile(r"[\w.\-:@$']+")
+
+
+class FakeView:
+    next_id = 1
+
+    def __init__(self, file_name: str, text: str, syntax: Syntax):
+        self.path = file_name
+        self.text = text
+        self.view_syntax = syntax
+        self.selection = Selection([Region(0)])
+        self.view_settings = Settings()
+        self.commands: List[str] = list()
+        self.missing: Set[str] = set()
+        self.view_id = FakeView.next_id
+        FakeView.next_id += 1
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def missing(*args, **kwargs):
+            self.missing.add(name)
+            return None
+
+        return missing
+
+    def __bool__(self) -> bool:
+        return True
+
+    def id(self) -> int:
+        return self.view_id
+
+    def buffer_id(self) -> int:
+        return self.view_id
+
+    def is_valid(self) -> bool:
+        return True
+
+    def is_loading(self) -> bool:
+        return False
+
+    def is_dirty(self) -> bool:
+        return False
+
+    def file_name(self) -> str:
+        return self.path
+
+    def syntax(self) -> Syntax:
+        return self.view_syntax
+
+    def settings(self) -> Settings:
+        return self.view_settings
+
+    def window(self):
+        return None
+
+    def size(self) -> int:
+        return len(self.text)
+
+    def sel(self) -> Selection:
+        return self.selection
+
+    def substr(self, x: Union[Region, int]) -> str:
+        if isinstance(x, Region):
+            return self.text[x.begin() : x.end()]
+        return self.text[x] if 0 <= x < len(self.text) else "\0"
+
+    def word(self, x: Union[Region, int]) -> Region:
+        point = x.begin() if isinstance(x, Region) else x
+        line = self.line(point)
+        for match in word_pattern.finditer(self.text, line.a, line.b):
+            if match.start() <= point <= match.end():
+                return Region(match.start(), match.end())
+        return Region(point)
+
+    def line(self, x: Union[Region, int]) -> Region:
+        point = x.begin() if isinstance(x, Region) else x
+        start = self.text.rfind("\n", 0, point) + 1
+        end = self.text.find("\n", point)
+        return Region(start, len(self.text) if end == -1 else end)
+
+    def full_line(self, x: Union[Region, int]) -> Region:
+        line = self.line(x)
+        return Region(line.a, min(line.b + 1, len(self.text)))
+
+    def lines(self, region: Region) -> List[Region]:
+        lines = list()
+        point = region.begin()
+        while True:
+            line = self.line(point)
+            lines.append(line)
+            if line.b >= region.end() or line.b >= len(self.text):
+                return lines
+            point = line.b + 1
+
+    def split_by_newlines(self, region: Region) -> List[Region]:
+        return self.lines(region)
+
+    def rowcol(self, point: int):
+        row = self.text.count("\n", 0, point)
+        return row, point - (self.text.rfind("\n", 0, point) + 1)
+
+    def text_point(self, row: int, col: int) -> int:
+        point = 0
+        for _ in range(row):
+            point = self.text.find("\n", point) + 1
+            if point == 0:
+                return len(self.text)
+        return min(point + col, len(self.text))
+
+    def find(self, pattern: str, start_pt: int, flags: int = 0) -> Region:
+        match = re.compile(pattern).search(self.text, start_pt)
+        return Region(match.start(), match.end()) if match else Region(-1)
+
+    def find_all(self, pattern: str, flags: int = 0, *args) -> List[Region]:
+        return [Region(x.start(), x.end()) for x in re.finditer(pattern, self.text)]
+
+    def in_comment(self, point: int) -> bool:
+        line = self.line(point)
+        comment = self.text.find("#", line.a, point)
+        return comment != -1
+
+    def scope_name(self, point: int) -> str:
+        scope = self.view_syntax.scope + " "
+        if self.in_comment(point):
+            scope += "comment.line "
+        return scope
+
+    def match_selector(self, point: int, selector: str) -> bool:
+        return any(
+            x.strip() and x.strip() in self.scope_name(point)
+            for x in selector.split(",")
+        )
+
+    def score_selector(self, point: int, selector: str) -> int:
+        return 1 if self.match_selector(point, selector) else 0
+
+    def extract_scope(self, point: int) -> Region:
+        return self.word(point)
+
+    def visible_region(self) -> Region:
+        return Region(0, len(self.text))
+
+    def run_command(self, command: str, args=None):
+        self.commands.append(command)
+
+    def is_popup_visible(self) -> bool:
+        return False
+
+    def show_popup(self, *args, **kwargs):
+        pass
+
+    def update_popup(self, *args, **kwargs):
+        pass
+
+    def hide_popup(self):
+        pass
+
+    def add_regions(self, *args, **kwargs):
+        pass
+
+    def erase_regions(self, *args, **kwargs):
+        pass
+
+    def get_regions(self, key: str) -> List[Region]:
+        return list()
+
+    def add_phantom(self, *args, **kwargs) -> int:
+        return 0
+
+    def erase_phantoms(self, key: str):
+        pass
+
+    def insert_text(self, point: int, text: str):
+        """Type text at point like a keystroke would, the caret ends up after it"""
+        self.text = self.text[:point] + text + self.text[point:]
+        self.selection = Selection([Region(point + len(text))])
+
+
+# sublime.View is used in annotations and isinstance checks
+View = FakeView
+
+
+def set_timeout(callback: Callable[[], None], delay: int = 0):
+    pending.append(callback)
+
+
+def set_timeout_async(callback: Callable[[], None], delay: int = 0):
+    pending.append(callback)
+
+
+def load_settings(name: str) -> Settings:
+    if name not in settings_files:
+        settings_files[name] = Settings()
+    return settings_files[name]
+
+
+def cache_path() -> str:
+    return cache_directory
+
+
+def packages_path() -> str:
+    return packages_directory
+
+
+def installed_packages_path() -> str:
+    return packages_directory
+
+
+def version() -> str:
+    return "4180"
+
+
+def platform() -> str:
+    return sys.platform
+
+
+def arch() -> str:
+    return "x64"
+
+
+def windows() -> list:
+    return list()
+
+
+def active_window():
+    return None
+
+
+def status_message(message: str):
+    pass
+
+
+def error_message(message: str):
+    print(message)
+
+
+def read_settings_file(path: str) -> dict:
+    """Read a .sublime-settings file, which is json with comments and trailing commas"""
+    with open(path, "r", encoding="utf-8") as file:
+        text = file.read()
+    text = re.sub(
+        r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/',
+        lambda x: x.group(1) or "",
+        text,
+        flags=re.DOTALL,
+    )
+    text = re.sub(r",(\s*[}\]])", r"\1", text)
+    return json.loads(text)
+
+
+class FakeModule(types.ModuleType):
+    """Anything that isn't defined above is a constant, a class or a no-op function"""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.isupper():
+            value = 0
+        elif name[:1].isupper():
+            value = type(name, (), {"__init__": lambda self, *args, **kwargs: None})
+        else:
+            value = lambda *args, **kwargs: None  # noqa: E731
+        setattr(self, name, value)
+        return value
+
+
+def install(cache: str, packages: str):
+    """Add this module as sublime and a stand-in for sublime_plugin to sys.modules"""
+    global cache_directory, packages_directory
+    cache_directory = cache
+    packages_directory = packages
+
+    sublime = FakeModule("sublime")
+    sublime.__dict__.update(
+        {k: v for k, v in globals().items() if not k.startswith("__")}
+    )
+    sys.modules["sublime"] = sublime
+    sys.modules["sublime_plugin"] = FakeModule("sublime_plugin")
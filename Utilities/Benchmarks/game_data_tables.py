@@ -0,0 +1,59 @@
+"""
+Micro-benchmark for accessing the documentation tables of VictoriaGameData.
+
+Compares building the whole dict on every access, which is what the old @property
+tables in game_data.py did by evaluating a dict literal, with the tables that are read
+from game_docs.bin once and only decode the entries that are looked up.
+
+Usage: python game_data_tables.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+src_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+sys.path.append(src_path)
+from doc_tables import read_doc_tables  # noqa: E402
+
+table_names = ["game_effects", "game_triggers", "game_scopes", "game_modifiers"]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    docs_path = os.path.join(src_path, "game_docs.bin")
+
+    load_time = timeit.timeit(lambda: read_doc_tables(docs_path), number=20) / 20
+    print(f"Reading game_docs.bin: {load_time * 1e3:.2f} ms\n")
+
+    tables = read_doc_tables(docs_path)
+    print(f"{'table':<16}{'entries':>9}{'old us/access':>16}{'new us/access':>16}")
+    for name in table_names:
+        table = tables[name]
+        keys, values = list(table), [table[x] for x in table]
+        key = keys[0]
+        old_time = timeit.timeit(
+            lambda: dict(zip(keys, values))[key], number=iterations
+        )
+        new_time = timeit.timeit(lambda: table[key], number=iterations)
+        print(
+            f"{name:<16}{len(table):>9}"
+            f"{old_time / iterations * 1e6:>16.2f}{new_time / iterations * 1e6:>16.3f}"
+        )
+
+    # The completion loop in on_query_completions looks up every effect
+    effects = read_doc_tables(docs_path)["game_effects"]
+    keys, values = list(effects), [effects[x] for x in effects]
+    old_time = timeit.timeit(
+        lambda: [dict(zip(keys, values))[x] for x in keys[:200]], number=5
+    )
+    effects = read_doc_tables(docs_path)["game_effects"]
+    new_time = timeit.timeit(lambda: [effects[x] for x in keys[:200]], number=5)
+    print(
+        f"\n200 effect lookups: old {old_time / 5 * 1e3:.2f} ms, "
+        f"new {new_time / 5 * 1e3:.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
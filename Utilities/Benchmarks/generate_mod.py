@@ -0,0 +1,358 @@
+"""
+Generator of synthetic mods for scaling tests of the object loading and the editor
+handlers.
+
+Writes a mod tree with buildings, production methods and their groups, state regions,
+localization and gui files that look like the game's own, plus a few objects of every
+other object type in the registry, all in the directories the plugin loads them from.
+Every count can be set on its own and --scale multiplies all of them, so the same
+tree can be generated at several sizes:
+
+    python generate_mod.py synthetic_x1 --scale 1
+    python generate_mod.py synthetic_x8 --scale 8
+
+The generated mods can be loaded with ../ObjectIndexer/index_objects.py to chart
+startup time and memory and replayed with event_listener_handlers.py to chart save
+latency against the size of the mod.
+
+Usage: python generate_mod.py <output dir> [--scale <factor>] [--buildings <count>]...
+"""
+
+import argparse
+import importlib
+import os
+import random
+import sys
+import types
+from typing import Callable, Dict, List
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+package_path = os.path.dirname(os.path.dirname(benchmarks_path))
+package_name = "victoria3tools_generator"
+
+# Types that have their own generator below, every other type gets generic objects
+generated_types = {"buildings", "pms", "pm_groups", "state_regions"}
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which imports the sublime API.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.join(package_path, "src")]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+class ModWriter:
+    def __init__(self, path: str, objects_per_file: int, rng: random.Random):
+        self.path = path
+        self.objects_per_file = objects_per_file
+        self.rng = rng
+        self.files = 0
+        self.bytes = 0
+        # Localization keys of everything generated so far
+        self.keys: List[str] = list()
+
+    def write(self, relative: str, text: str, encoding: str = "utf-8"):
+        path = os.path.join(self.path, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding=encoding, newline="\n") as file:
+            file.write(text)
+        self.files += 1
+        self.bytes += os.path.getsize(path)
+
+    def write_objects(
+        self,
+        directory: str,
+        prefix: str,
+        names: List[str],
+        write_object: Callable[[str, int], str],
+    ):
+        """Write the objects in names to files of objects_per_file objects each"""
+        for start in range(0, len(names), self.objects_per_file):
+            file_names = names[start : start + self.objects_per_file]
+            blocks = [
+                write_object(name, start + index)
+                for index, name in enumerate(file_names)
+            ]
+            number = start // self.objects_per_file
+            text = f"# Synthetic {prefix} {number}, generated by generate_mod.py\n\n"
+            self.write(
+                os.path.join(directory, f"synthetic_{prefix}_{number:03}.txt"),
+                text + "\n".join(blocks),
+            )
+        self.keys.extend(names)
+        self.keys.extend(f"{x}_desc" for x in names)
+
+
+def province(rng: random.Random) -> str:
+    return "x" + "".join(rng.choice("0123456789ABCDEF") for _ in range(6))
+
+
+def generate_buildings(writer: ModWriter, buildings: int, pms: int):
+    rng = writer.rng
+    building_names = [f"building_synthetic_{x}" for x in range(buildings)]
+    pm_names = [f"pm_synthetic_{x}" for x in range(pms)]
+    # Every building has up to four groups that split its production methods
+    groups: Dict[str, List[List[str]]] = {x: list() for x in building_names}
+    for index, pm in enumerate(pm_names):
+        building = building_names[index % len(building_names)]
+        building_groups = groups[building]
+        if not building_groups or (len(building_groups) < 4 and rng.random() < 0.3):
+            building_groups.append(list())
+        building_groups[-1].append(pm)
+    group_names = {
+        x: [f"pmg_{x[len('building_') :]}_{y}" for y in range(len(groups[x]))]
+        for x in building_names
+    }
+
+    def building(name: str, index: int) -> str:
+        pm_groups = "".join(f"\t\t{x}\n" for x in group_names[name])
+        return (
+            f"{name} = {{\n"
+            f"\tbuilding_group = bg_synthetic_{index % 20}\n"
+            '\ttexture = "gfx/interface/icons/building_icons/building_synthetic.dds"\n'
+            "\tcity_type = city\n"
+            "\tlevels_per_mesh = 5\n"
+            f"\tunlocking_technologies = {{ technology_synthetic_{index % 50} }}\n"
+            "\trequired_construction = construction_cost_medium\n"
+            "\tproduction_method_groups = {\n"
+            f"{pm_groups}"
+            "\t}\n"
+            "}\n"
+        )
+
+    def pm(name: str, index: int) -> str:
+        inputs = "".join(
+            f"\t\t\tgoods_input_goods_synthetic_{rng.randrange(50)}_add = "
+            f"{rng.randrange(5, 60)}\n"
+            for _ in range(rng.randrange(1, 4))
+        )
+        return (
+            f"{name} = {{\n"
+            '\ttexture = "gfx/interface/icons/production_method_icons/synthetic.dds"\n'
+            "\tbuilding_modifiers = {\n"
+            "\t\tworkforce_scaled = {\n"
+            f"{inputs}"
+            f"\t\t\tgoods_output_goods_synthetic_{index % 50}_add = "
+            f"{rng.randrange(10, 90)}\n"
+            "\t\t}\n"
+            "\t\tlevel_scaled = {\n"
+            f"\t\t\tbuilding_employment_laborers_add = {rng.randrange(1, 9) * 500}\n"
+            "\t\t}\n"
+            "\t}\n"
+            "}\n"
+        )
+
+    pm_group_pms = {
+        group: building_groups[index]
+        for building, building_groups in groups.items()
+        for index, group in enumerate(group_names[building])
+    }
+
+    def pm_group(name: str, index: int) -> str:
+        production_methods = "".join(f"\t\t{x}\n" for x in pm_group_pms[name])
+        return (
+            f"{name} = {{\n"
+            '\ttexture = "gfx/interface/icons/generic_icons/placeholder.dds"\n'
+            "\tproduction_methods = {\n"
+            f"{production_methods}"
+            "\t}\n"
+            "}\n"
+        )
+
+    writer.write_objects("common/buildings", "buildings", building_names, building)
+    writer.write_objects("common/production_methods", "pms", pm_names, pm)
+    writer.write_objects(
+        "common/production_method_groups",
+        "pm_groups",
+        list(pm_group_pms),
+        pm_group,
+    )
+
+
+def generate_state_regions(writer: ModWriter, state_regions: int):
+    rng = writer.rng
+
+    def state_region(name: str, index: int) -> str:
+        provinces = [province(rng) for _ in range(rng.randrange(8, 60))]
+        province_lines = "".join(
+            "\t\t" + " ".join(f'"{x}"' for x in provinces[y : y + 8]) + "\n"
+            for y in range(0, len(provinces), 8)
+        )
+        return (
+            f"{name} = {{\n"
+            f"\tid = {index + 1}\n"
+            '\tsubsistence_building = "building_subsistence_farms"\n'
+            "\tprovinces = {\n"
+            f"{province_lines}"
+            "\t}\n"
+            f'\ttraits = {{ "state_trait_synthetic_{index % 30}" }}\n'
+            f'\tcity = "{provinces[0]}"\n'
+            f'\tfarm = "{provinces[-1]}"\n'
+            f'\tmine = "{rng.choice(provinces)}"\n'
+            f"\tarable_land = {rng.randrange(10, 200)}\n"
+            '\tarable_resources = { "bg_wheat_farms" "bg_livestock_ranches" }\n'
+            "\tcapped_resources = {\n"
+            f"\t\tbg_iron_mining = {rng.randrange(5, 40)}\n"
+            f"\t\tbg_logging = {rng.randrange(5, 40)}\n"
+            "\t}\n"
+            "}\n"
+        )
+
+    names = [f"STATE_SYNTHETIC_{x}" for x in range(state_regions)]
+    writer.write_objects("map_data/state_regions", "state_regions", names, state_region)
+
+
+def generate_other_types(writer: ModWriter, object_types, count: int):
+    """Write count plain objects of every type without a generator of its own"""
+    for object_type in object_types.values():
+        if object_type.name in generated_types or object_type.directory == "gui":
+            continue
+        names = [f"{object_type.name}_synthetic_{x}" for x in range(count)]
+        kind, level = object_type.options.kind, object_type.options.level
+        if kind == "value":
+            writer.write_objects(
+                object_type.directory,
+                object_type.name,
+                names,
+                lambda name, index: f"{name} = {index}\n",
+            )
+        elif level == 1:
+            # Named colors are defined inside of a colors block
+            writer.write_objects(
+                object_type.directory,
+                object_type.name,
+                names,
+                lambda name, index: (
+                    f"colors = {{\n\t{name} = rgb {{ {index % 256} 0 0 }}\n}}\n"
+                ),
+            )
+        else:
+            writer.write_objects(
+                object_type.directory,
+                object_type.name,
+                names,
+                lambda name, index: f"{name} = {{\n\tvalue = {index}\n}}\n",
+            )
+
+
+def generate_gui(writer: ModWriter, gui_files: int):
+    rng = writer.rng
+    for number in range(gui_files):
+        lines = [f"# Synthetic gui {number}, generated by generate_mod.py", ""]
+        type_names = [
+            f"synthetic_widget_{number}_{x}" for x in range(rng.randrange(5, 20))
+        ]
+        templates = [
+            f"synthetic_template_{number}_{x}" for x in range(rng.randrange(3, 10))
+        ]
+
+        lines.append(f"types synthetic_types_{number}")
+        lines.append("{")
+        for name in type_names:
+            width, height = rng.randrange(50, 500), rng.randrange(20, 200)
+            lines.extend(
+                [
+                    f"\ttype {name} = widget {{",
+                    f"\t\tsize = {{ {width} {height} }}",
+                    "\t\ttextbox = {",
+                    f'\t\t\ttext = "{name.upper()}"',
+                    "\t\t\tusing = default_format",
+                    "\t\t}",
+                    "\t}",
+                ]
+            )
+        lines.extend(["}", ""])
+
+        for name in templates:
+            lines.extend(
+                [
+                    f"template {name}",
+                    "{",
+                    '\ttexture = "gfx/interface/backgrounds/default_bg.dds"',
+                    "\tspriteType = Corneredtiled",
+                    "\tspriteborder = { 16 16 }",
+                    "}",
+                    "",
+                ]
+            )
+
+        lines.extend(
+            [
+                "window = {",
+                f"\tname = synthetic_window_{number}",
+                "\tflowcontainer = {",
+                "\t\tdirection = vertical",
+            ]
+        )
+        lines.extend(f"\t\t{x} = {{}}" for x in type_names)
+        lines.extend(["\t}", "}", ""])
+        writer.write(f"gui/synthetic_{number:03}.gui", "\n".join(lines))
+
+
+def generate_localization(writer: ModWriter, keys: int, keys_per_file: int):
+    rng = writer.rng
+    words = ["the", "synthetic", "building", "state", "market", "production", "of"]
+    all_keys = writer.keys + [f"synthetic_loc_{x}" for x in range(keys)]
+    for start in range(0, len(all_keys), keys_per_file):
+        lines = ["l_english:"]
+        for key in all_keys[start : start + keys_per_file]:
+            text = " ".join(rng.choice(words) for _ in range(rng.randrange(2, 25)))
+            lines.append(f' {key}:0 "{text.capitalize()}"')
+        number = start // keys_per_file
+        writer.write(
+            f"localization/english/synthetic_{number:03}_l_english.yml",
+            "\n".join(lines) + "\n",
+            encoding="utf-8-sig",
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("output", help="directory the mod is written to")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply every count by this factor"
+    )
+    parser.add_argument("--buildings", type=int, default=250)
+    parser.add_argument("--pms", type=int, default=1500, help="production methods")
+    parser.add_argument("--state-regions", type=int, default=700)
+    parser.add_argument(
+        "--localization", type=int, default=40000, help="localization keys"
+    )
+    parser.add_argument("--gui", type=int, default=150, help="gui files")
+    parser.add_argument(
+        "--other", type=int, default=50, help="objects of every other object type"
+    )
+    parser.add_argument("--objects-per-file", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if os.path.exists(args.output) and os.listdir(args.output):
+        sys.exit(f"{args.output} is not empty")
+
+    def scaled(count: int) -> int:
+        return max(1, round(count * args.scale))
+
+    object_types = import_module("object_registry").object_types
+    rng = random.Random(args.seed)
+    writer = ModWriter(args.output, args.objects_per_file, rng)
+
+    generate_buildings(writer, scaled(args.buildings), scaled(args.pms))
+    generate_state_regions(writer, scaled(args.state_regions))
+    generate_other_types(writer, object_types, scaled(args.other))
+    generate_gui(writer, scaled(args.gui))
+    generate_localization(writer, scaled(args.localization), 2000)
+
+    print(
+        f"Wrote {writer.files} files, {writer.bytes / 1024 / 1024:.1f} MB "
+        f"to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
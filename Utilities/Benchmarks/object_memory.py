@@ -0,0 +1,115 @@
+"""
+Memory report comparing the two ways loaded game objects can be stored: a
+PdxScriptObject per object, and the CompactScriptObject records that are used with the
+CompactObjectStorage setting.
+
+Loads the game and mod files once, then builds every object type from the parsed
+files in both representations and measures the memory each one keeps alive with
+tracemalloc. The compact numbers include the shared table of file paths.
+
+JominiTools has to be installed next to this package, as it is in sublime's Packages
+directory, or its parent directory has to be passed with --packages.
+
+Usage: python object_memory.py --game <game dir> [--mod <mod dir>]...
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import tracemalloc
+import types
+from typing import Dict, List, Tuple
+
+import fake_sublime
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+package_path = os.path.dirname(os.path.dirname(benchmarks_path))
+package_name = "victoria3tools_memory"
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which registers every command of the plugin.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.join(package_path, "src")]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+def measure(loader, type_names: List[str]) -> Tuple[Dict[str, int], list]:
+    """Build every type and get the memory each one keeps alive"""
+    sizes = dict()
+    game_objects = list()
+    for type_name in type_names:
+        before = tracemalloc.get_traced_memory()[0]
+        game_objects.append(loader.build(type_name))
+        sizes[type_name] = tracemalloc.get_traced_memory()[0] - before
+    return sizes, game_objects
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", required=True, help="the Victoria 3 game directory")
+    parser.add_argument(
+        "--mod", action="append", default=[], help="a mod directory, can be repeated"
+    )
+    parser.add_argument(
+        "--packages",
+        default=os.path.dirname(package_path),
+        help="directory that JominiTools is installed in",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fake_sublime.install(tempfile.gettempdir(), args.packages)
+    sys.path.insert(0, args.packages)
+    object_cache = import_module("object_cache")
+    object_loader = import_module("object_loader")
+    object_registry = import_module("object_registry")
+
+    type_names = list(object_registry.object_types)
+    cache = object_cache.ObjectCache(os.path.join(tempfile.gettempdir(), "unused"))
+    loader = object_loader.ObjectLoader(
+        args.game, args.mod, cache, os.cpu_count() or 1, object_loader.find_python()
+    )
+    game_objects = loader.load_all(type_names)
+    counts = {x: len(game_objects[x].keys()) for x in type_names}
+    del game_objects
+
+    # Both sets of game objects are kept alive until everything is measured
+    tracemalloc.start()
+    loader.compact = False
+    standard, standard_objects = measure(loader, type_names)
+    loader.compact = True
+    compact, compact_objects = measure(loader, type_names)
+    tracemalloc.stop()
+
+    print(
+        f"{'type':<30}{'objects':>9}{'standard KB':>13}{'compact KB':>12}{'saved':>8}"
+    )
+    for type_name in sorted(type_names, key=lambda x: -standard[x]):
+        saved = 0.0
+        if standard[type_name]:
+            saved = 1 - compact[type_name] / standard[type_name]
+        print(
+            f"{type_name:<30}{counts[type_name]:>9}"
+            f"{standard[type_name] / 1024:>13.1f}{compact[type_name] / 1024:>12.1f}"
+            f"{saved:>8.0%}"
+        )
+
+    total, total_compact = sum(standard.values()), sum(compact.values())
+    print(
+        f"\n{'total':<30}{sum(counts.values()):>9}"
+        f"{total / 1024:>13.1f}{total_compact / 1024:>12.1f}"
+        f"{1 - total_compact / total if total else 0:>8.0%}"
+    )
+    del standard_objects, compact_objects
+
+
+if __name__ == "__main__":
+    main()
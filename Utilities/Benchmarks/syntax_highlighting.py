@@ -0,0 +1,203 @@
+"""
+Benchmark of the keyword patterns the plugin generates for the script syntax, comparing
+the flat alternations written by JominiTools' write_syntax, with every dynamic modifier
+written out, with the prefix-factored and template patterns of syntax_patterns.py.
+
+Loads the game and mod objects, generates both versions of the syntax from them and
+matches the generated patterns against the largest script files, and against lines of
+the generated keywords themselves, each followed by a word that only differs from it
+in the last character. Script files mostly spend their time on words that fail on
+their first characters, keywords and words like them are where the two kinds of
+patterns differ.
+
+Python's re module stands in for sublime's regex engine: at the start of every word
+each pattern is tried in the order of the syntax until one matches, which is what
+sublime does for these patterns. Both versions have to highlight the same words, the
+benchmark checks that.
+
+With --output both syntax files are written there so they can be tried in sublime.
+
+JominiTools has to be installed next to this package, as it is in sublime's Packages
+directory, or its parent directory has to be passed with --packages.
+
+Usage: python syntax_highlighting.py --game <game dir> [--mod <mod dir>]...
+"""
+
+import argparse
+import importlib
+import os
+import re
+import sys
+import tempfile
+import time
+import types
+from typing import List, Tuple
+
+import fake_sublime
+
+benchmarks_path = os.path.dirname(os.path.abspath(__file__))
+package_path = os.path.dirname(os.path.dirname(benchmarks_path))
+package_name = "victoria3tools_syntax"
+
+fake_syntax_path = os.path.join(
+    package_path, "Vic3 Script", "VictoriaScript.fake-sublime-syntax"
+)
+
+match_pattern = re.compile(r"^\s*- match: (.*)$\n^\s*scope: (.*)$", re.MULTILINE)
+word_pattern = re.compile(r"(?<![\w.\-])[\w.\-]")
+
+Patterns = List[Tuple["re.Pattern[str]", str]]
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which registers every command of the plugin.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.join(package_path, "src")]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+def generated_patterns(syntax: str, fake_syntax: str) -> Tuple[Patterns, float]:
+    """Compile the patterns the plugin added to a syntax, with the compile time"""
+    t0 = time.perf_counter()
+    patterns = [
+        (re.compile(x.group(1)), x.group(2))
+        for x in match_pattern.finditer(syntax, len(fake_syntax))
+    ]
+    return patterns, time.perf_counter() - t0
+
+
+def highlight(patterns: Patterns, lines: List[str]) -> Tuple[list, float]:
+    """Get the scope of every word matched by patterns, with the matching time"""
+    matches = list()
+    t0 = time.perf_counter()
+    for line_number, line in enumerate(lines):
+        for word in word_pattern.finditer(line):
+            position = word.start()
+            for pattern, scope in patterns:
+                match = pattern.match(line, position)
+                if match and match.end() > position:
+                    matches.append((line_number, position, scope))
+                    break
+    return matches, time.perf_counter() - t0
+
+
+def script_lines(roots: List[str], count: int) -> List[str]:
+    """Read the lines of the largest script files of roots"""
+    files = list()
+    for root in roots:
+        for directory, _, names in os.walk(os.path.join(root, "common")):
+            for name in names:
+                if name.endswith(".txt"):
+                    path = os.path.join(directory, name)
+                    files.append((os.path.getsize(path), path))
+
+    lines = list()
+    for _, path in sorted(files, reverse=True)[:count]:
+        with open(path, "r", encoding="utf-8-sig", errors="ignore") as file:
+            lines.extend(file.read().splitlines())
+    return lines
+
+
+def keyword_lines(sections, count: int) -> List[str]:
+    """Lines of generated keywords, each followed by a near miss of it"""
+    keys = [x for section in sections for x in section.names()]
+    step = max(1, len(keys) // count)
+    return [f"{x} = {x[:-1]}_" for x in keys[::step]]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", required=True, help="the Victoria 3 game directory")
+    parser.add_argument(
+        "--mod", action="append", default=[], help="a mod directory, can be repeated"
+    )
+    parser.add_argument(
+        "--packages",
+        default=os.path.dirname(package_path),
+        help="directory that JominiTools is installed in",
+    )
+    parser.add_argument(
+        "--files", type=int, default=20, help="number of script files to highlight"
+    )
+    parser.add_argument(
+        "--keywords", type=int, default=2000, help="number of keyword lines"
+    )
+    parser.add_argument("--output", help="write both syntax files to this directory")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    fake_sublime.install(tempfile.gettempdir(), args.packages)
+    sys.path.insert(0, args.packages)
+    from JominiTools.src import write_syntax
+
+    object_cache = import_module("object_cache")
+    object_loader = import_module("object_loader")
+    object_registry = import_module("object_registry")
+    game_objects = import_module("game_objects")
+    syntax_file = import_module("syntax_file")
+
+    type_names = list(object_registry.object_types)
+    cache = object_cache.ObjectCache(os.path.join(tempfile.gettempdir(), "unused"))
+    loader = object_loader.ObjectLoader(
+        args.game, args.mod, cache, os.cpu_count() or 1, object_loader.find_python()
+    )
+    objects = game_objects.object_names(loader.load_all(type_names))
+    sections = syntax_file.syntax_sections(objects)
+
+    with open(fake_syntax_path, "r") as file:
+        fake_syntax = file.read()
+    syntaxes = {
+        "flat": fake_syntax
+        + "".join(write_syntax(x.names(), x.header, x.scope) for x in sections),
+        "trie": fake_syntax + "".join(x.text() for x in sections),
+    }
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        for name, syntax in syntaxes.items():
+            path = os.path.join(args.output, f"VictoriaScript.{name}.sublime-syntax")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(syntax)
+
+    workloads = {
+        "script files": script_lines([args.game] + args.mod, args.files),
+        "keywords": keyword_lines(sections, args.keywords),
+    }
+    keywords = sum(len(x.names()) for x in sections)
+    print(f"{keywords} keywords in {len(sections)} sections\n")
+    print(f"{'syntax':<8}{'pattern KB':>12}{'compile ms':>12}")
+    patterns = dict()
+    for name, syntax in syntaxes.items():
+        patterns[name], compile_seconds = generated_patterns(syntax, fake_syntax)
+        size = sum(len(x[0].pattern) for x in patterns[name])
+        print(f"{name:<8}{size / 1024:>12.1f}{compile_seconds * 1e3:>12.1f}")
+
+    different = False
+    for workload, lines in workloads.items():
+        print(f"\n{workload}, {len(lines)} lines")
+        print(f"{'syntax':<8}{'highlight ms':>14}{'us per line':>13}{'matches':>9}")
+        results = dict()
+        for name in syntaxes:
+            matches, seconds = highlight(patterns[name], lines)
+            results[name] = (matches, seconds)
+            print(
+                f"{name:<8}{seconds * 1e3:>14.1f}"
+                f"{seconds * 1e6 / max(1, len(lines)):>13.2f}{len(matches):>9}"
+            )
+
+        if results["flat"][0] != results["trie"][0]:
+            print("The syntaxes highlight different words!")
+            different = True
+            continue
+        speedup = results["flat"][1] / max(results["trie"][1], 1e-9)
+        print(f"Same words highlighted, trie patterns are {speedup:.1f}x as fast")
+
+    if different:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+import os
 import re
+import sys
 from typing import Dict
 
+# doc_tables.py is shared with the plugin, which reads the tables this script writes
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src"))
+from doc_tables import write_doc_tables
+
 def make_minihtml(string):
     return string.replace("<=", "&le;").replace(">=", "&ge;").replace("<", "&lt;").replace(">", "&gt;")
 
@@ -75,15 +81,6 @@ def get_modifiers(input_string):
 
     return out_dict
 
-def write_full_descriptions(desc_dict: dict, fd: str):
-    file = open(f"output_lists/{fd}_dict.txt", "w")
-
-    file.write(f"{fd} = {{\n")
-    for i in desc_dict:
-        file.write(f'\t"{i}": "{desc_dict[i].replace("\"", "'")}",\n')
-    file.write("}")
-    file.close()
-
 def create_sublime_completions(
     game, syntax_scope, scopes
 ):
@@ -165,20 +162,25 @@ if __name__ == "__main__":
     triggers_log = "docs/triggers.log"
     event_targets_log = "docs/event_targets.log"
 
-    effects_log_data = get_markdown_log_data(effects_log)    
-    write_full_descriptions(effects_log_data, effects_log.replace("docs/", "").replace(".log", ""))
-
-    trigger_log_data = get_markdown_log_data(triggers_log)    
-    write_full_descriptions(trigger_log_data, triggers_log.replace("docs/", "").replace(".log", ""))
-
-    scope_log_data = get_markdown_log_data(event_targets_log)    
-    write_full_descriptions(scope_log_data, event_targets_log.replace("docs/", "").replace(".log", ""))
+    effects_log_data = get_markdown_log_data(effects_log)
+    trigger_log_data = get_markdown_log_data(triggers_log)
+    scope_log_data = get_markdown_log_data(event_targets_log)
     create_sublime_completions("Victoria", "text.vic.script", scope_log_data)
 
     with open("docs/modifiers.log", "r") as file:
         modifier_text = "".join(file.readlines())
     modifiers = get_modifiers(modifier_text)
-    write_full_descriptions(modifiers, "modifiers")
+
+    # Hover documentation read by VictoriaGameData, copy it to src/game_docs.bin
+    write_doc_tables(
+        "output/game_docs.bin",
+        {
+            "game_effects": effects_log_data,
+            "game_triggers": trigger_log_data,
+            "game_scopes": scope_log_data,
+            "game_modifiers": modifiers,
+        },
+    )
 
     on_actions = get_on_actions()
     with open("output_lists/on_actions.txt", "w") as file:
@@ -0,0 +1,167 @@
+"""
+Headless indexer for the game objects, runs the plugin's object loader outside of
+sublime against a game directory and any number of mod directories.
+
+Writes the object cache and the vanilla index of the game version in the same layout
+the plugin uses in sublime's cache directory (Cache/Victoria3Tools), so the output
+directory can be copied there to pre-warm the plugin, and prints how long each step
+took. Loading can be profiled with the standard tools, for example:
+
+    python -m cProfile -s cumtime index_objects.py --game <game> --mod <mod>
+
+JominiTools has to be installed next to this package, as it is in sublime's Packages
+directory, or its parent directory has to be passed with --packages.
+
+Usage: python index_objects.py --game <game dir> [--mod <mod dir>]... [--output <dir>]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+import types
+
+import sublime_stub
+
+utilities_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+package_path = os.path.dirname(utilities_path)
+src_path = os.path.join(package_path, "src")
+package_name = "victoria3tools_indexer"
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which imports every sublime command and event listener of the plugin.
+        package = types.ModuleType(package_name)
+        package.__path__ = [src_path]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--game", required=True, help="the Victoria 3 game directory")
+    parser.add_argument(
+        "--mod", action="append", default=[], help="a mod directory, can be repeated"
+    )
+    parser.add_argument(
+        "--output",
+        default="Victoria3Tools",
+        help="directory the object cache and vanilla index are written to",
+    )
+    parser.add_argument(
+        "--packages",
+        default=os.path.dirname(package_path),
+        help="directory that JominiTools is installed in",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="number of workers"
+    )
+    parser.add_argument(
+        "--processes", action="store_true", help="parse in processes, not threads"
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="load objects as compact records"
+    )
+    parser.add_argument(
+        "--game-version",
+        help="version the game files are indexed as, by default the version in "
+        "launcher/launcher-settings.json",
+    )
+    parser.add_argument(
+        "--type", action="append", default=[], help="only load this object type"
+    )
+    parser.add_argument(
+        "--report",
+        default="parse time",
+        help="column the object loading report is sorted by",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    sublime_stub.install(os.path.dirname(os.path.abspath(args.output)))
+    sys.path.insert(0, args.packages)
+
+    object_cache = import_module("object_cache")
+    object_loader = import_module("object_loader")
+    object_registry = import_module("object_registry")
+    vanilla_index = import_module("vanilla_index")
+    load_stats = import_module("load_stats")
+
+    type_names = args.type or list(object_registry.object_types)
+    unknown = [x for x in type_names if x not in object_registry.object_types]
+    if unknown:
+        sys.exit(f"Unknown object types: {', '.join(unknown)}")
+    if args.report not in load_stats.sort_keys:
+        columns = ", ".join(load_stats.sort_keys)
+        sys.exit(f"Unknown report column, use one of: {columns}")
+
+    python = object_loader.find_python() if args.processes else None
+    cache = object_cache.ObjectCache(os.path.join(args.output, "object_cache.json"))
+    cache.load()
+
+    version = args.game_version or vanilla_index.game_version(args.game)
+    index_file, vanilla = None, None
+    if version is not None:
+        index_file = vanilla_index.index_path(
+            os.path.join(args.output, "vanilla_index"), version
+        )
+        vanilla = vanilla_index.VanillaIndex.load(index_file)
+    else:
+        print("No game version found, the game files won't be indexed")
+
+    def load(vanilla):
+        t0 = time.perf_counter()
+        loader = object_loader.ObjectLoader(
+            args.game,
+            args.mod,
+            cache,
+            args.workers,
+            python,
+            vanilla,
+            compact=args.compact,
+        )
+        game_objects = loader.load_all(type_names)
+        objects = sum(len(x.keys()) for x in game_objects.values())
+        print(
+            f"Loaded {objects} objects of {len(game_objects)} types in "
+            f"{time.perf_counter() - t0:.3f} seconds"
+        )
+        return loader
+
+    indexed = vanilla is not None and all(vanilla.has(x) for x in type_names)
+    print(f"Loading {'mod' if indexed else 'game and mod'} files")
+    loader = load(vanilla)
+    # The report is of the first load, later loads don't parse the game files
+    stats = loader.stats
+
+    if index_file is not None and not indexed:
+        t0 = time.perf_counter()
+        index = vanilla_index.VanillaIndex(version)
+        if vanilla is not None:
+            index.types.update(vanilla.types)
+            index.keys.update(vanilla.keys)
+        unindexed = [x for x in type_names if vanilla is None or not vanilla.has(x)]
+        vanilla_index.build_index(args.game, version, unindexed, cache, index)
+        index.save(index_file)
+        print(
+            f"Indexed the game files of version {version} in "
+            f"{time.perf_counter() - t0:.3f} seconds"
+        )
+
+        # Load again like the plugin will, which only keeps the mod files cached
+        print("Loading mod files with the new index")
+        load(index)
+
+    t0 = time.perf_counter()
+    cache.save()
+    print(f"Wrote {args.output} in {time.perf_counter() - t0:.3f} seconds\n")
+    print(stats.report(args.report), end="")
+
+
+if __name__ == "__main__":
+    main()
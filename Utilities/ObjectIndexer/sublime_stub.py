@@ -0,0 +1,48 @@
+"""
+Stand-ins for the sublime and sublime_plugin modules so the plugin's object loading
+code and JominiTools can be imported outside of sublime's plugin host.
+
+Nothing in them does anything: constants are 0, functions return None and classes
+only exist so that modules can subclass them and use them in annotations.
+"""
+
+import sys
+import types
+
+
+class Stub:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def stub_function(*args, **kwargs):
+    return None
+
+
+class StubModule(types.ModuleType):
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.isupper():
+            value = 0
+        elif name[:1].isupper():
+            value = type(name, (Stub,), dict())
+        else:
+            value = stub_function
+        setattr(self, name, value)
+        return value
+
+
+def install(cache_path: str = ""):
+    """Add the stub modules to sys.modules, already imported modules are kept"""
+    for name in ("sublime", "sublime_plugin"):
+        if name in sys.modules:
+            continue
+        module = StubModule(name)
+        module.__dict__["stub"] = True
+        sys.modules[name] = module
+
+    sublime = sys.modules["sublime"]
+    if getattr(sublime, "stub", False):
+        sublime.cache_path = lambda: cache_path  # type: ignore
+        sublime.version = lambda: "4000"  # type: ignore
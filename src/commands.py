@@ -7,6 +7,7 @@ import sublime_plugin
 
 from JominiTools.src.utils import open_path
 from .game_data import VictoriaGameData
+from .load_stats import LoadStats, sort_keys
 
 
 class BrowseBinkVideosCommand(sublime_plugin.TextCommand):
@@ -131,3 +132,34 @@ class FoldingInputHandler(sublime_plugin.ListInputHandler):
     def list_items(self):
         keys = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "Unfold All"]
         return keys
+
+
+class V3ObjectLoadReportCommand(sublime_plugin.WindowCommand):
+    """Show how long each game object type took to load and what it cost"""
+
+    def input_description(self):
+        return "Sort By"
+
+    def input(self, args):
+        if "sort_by" not in args:
+            return ReportSortInputHandler()
+
+    def run(self, sort_by: str = "parse time"):  # type: ignore
+        stats = LoadStats.latest
+        if stats is None:
+            sublime.status_message("Victoria 3 game objects have not been loaded yet")
+            return
+
+        report_view = self.window.new_file()
+        report_view.set_name("Victoria 3 Object Loading")
+        report_view.set_scratch(True)
+        report_view.run_command("append", {"characters": stats.report(sort_by)})
+        report_view.set_read_only(True)
+
+
+class ReportSortInputHandler(sublime_plugin.ListInputHandler):
+    def name(self):
+        return "sort_by"
+
+    def list_items(self):
+        return list(sort_keys)
@@ -0,0 +1,150 @@
+"""
+Compact binary storage for the documentation tables generated by parse_docs.py.
+
+File layout, every integer is a little endian uint32:
+    header: magic, version, table count, offset of the string data
+    per table: name offset, name length, entry count, offset of the table index
+    per table index, sorted by encoded key: key offset, key length, value offset,
+        value length
+    string data: every distinct utf-8 string stored once, offsets are relative to it
+
+Opening a table decodes no strings. Keys are found with a binary search over the
+encoded bytes and values are only decoded, and then kept, when they are looked up.
+
+This module must not import sublime, parse_docs.py uses it to write the tables.
+"""
+
+import struct
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+
+MAGIC = b"V3DT"
+VERSION = 1
+
+header_format = struct.Struct("<4s3I")
+table_format = struct.Struct("<4I")
+
+
+class DocTable(Mapping):
+    def __init__(
+        self,
+        data: bytes,
+        strings_offset: int,
+        index_offset: int,
+        count: int,
+        extra: Optional[Dict[str, str]] = None,
+    ):
+        """extra entries are added on top of the entries stored in data"""
+        self.data = data
+        self.strings_offset = strings_offset
+        self.index = struct.unpack_from(f"<{count * 4}I", data, index_offset)
+        self.count = count
+        self.extra = extra or dict()
+        self.decoded: Dict[str, str] = dict()
+
+    def with_entries(self, extra: Dict[str, str]) -> "DocTable":
+        table = DocTable.__new__(DocTable)
+        table.__dict__.update(self.__dict__)
+        table.extra = {**self.extra, **extra}
+        table.decoded = dict()
+        return table
+
+    def string(self, offset: int, length: int) -> bytes:
+        start = self.strings_offset + offset
+        return self.data[start : start + length]
+
+    def find(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            current = self.string(self.index[middle * 4], self.index[middle * 4 + 1])
+            if current < encoded:
+                low = middle + 1
+            elif current > encoded:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def __getitem__(self, key: str) -> str:
+        if key in self.extra:
+            return self.extra[key]
+        if key in self.decoded:
+            return self.decoded[key]
+        position = self.find(key)
+        if position == -1:
+            raise KeyError(key)
+        offset, length = self.index[position * 4 + 2], self.index[position * 4 + 3]
+        value = self.string(offset, length).decode("utf-8")
+        self.decoded[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        return key in self.extra or (isinstance(key, str) and self.find(key) != -1)
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self.count):
+            key = self.string(self.index[position * 4], self.index[position * 4 + 1])
+            decoded = key.decode("utf-8")
+            if decoded not in self.extra:
+                yield decoded
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return self.count + len([x for x in self.extra if self.find(x) == -1])
+
+
+def read_doc_tables(path: str) -> Dict[str, DocTable]:
+    # The file is read instead of memory mapped so it can still be replaced while
+    # sublime is running, which the plugin's git auto update needs on windows.
+    with open(path, "rb") as file:
+        data = file.read()
+
+    magic, version, table_count, strings_offset = header_format.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} documentation table file")
+
+    tables = dict()
+    for position in range(table_count):
+        name_offset, name_length, count, index_offset = table_format.unpack_from(
+            data, header_format.size + position * table_format.size
+        )
+        start = strings_offset + name_offset
+        name = data[start : start + name_length].decode("utf-8")
+        tables[name] = DocTable(data, strings_offset, index_offset, count)
+    return tables
+
+
+def write_doc_tables(path: str, tables: Dict[str, Dict[str, str]]):
+    strings = bytearray()
+    interned: Dict[bytes, Tuple[int, int]] = dict()
+
+    def intern(string: str) -> Tuple[int, int]:
+        encoded = string.encode("utf-8")
+        if encoded not in interned:
+            interned[encoded] = (len(strings), len(encoded))
+            strings.extend(encoded)
+        return interned[encoded]
+
+    indexes = list()
+    for table in tables.values():
+        entries = sorted((key.encode("utf-8"), key, table[key]) for key in table)
+        index = list()
+        for _, key, value in entries:
+            index.extend(intern(key))
+            index.extend(intern(value))
+        indexes.append(index)
+
+    index_offset = header_format.size + len(tables) * table_format.size
+    strings_offset = index_offset + sum(len(x) * 4 for x in indexes)
+
+    with open(path, "wb") as file:
+        file.write(header_format.pack(MAGIC, VERSION, len(tables), strings_offset))
+        for name, index in zip(tables, indexes):
+            name_offset, name_length = intern(name)
+            count = len(index) // 4
+            file.write(table_format.pack(name_offset, name_length, count, index_offset))
+            index_offset += len(index) * 4
+        for index in indexes:
+            file.write(struct.pack(f"<{len(index)}I", *index))
+        file.write(strings)
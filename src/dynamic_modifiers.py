@@ -0,0 +1,144 @@
+"""
+Modifier types that the game creates for every object of some types, like
+building_group_<building group>_<pop type>_fertility_mult.
+
+They are described as templates in which {type} stands for any object of that type.
+The syntax highlights them with one pattern per section that is made from the objects
+of each type, so the pattern grows with the number of objects and not with the number
+of combinations. DynamicModifiers checks names against the same patterns, hover uses it
+to tell which section a dynamic modifier belongs to.
+
+This module must not import sublime or JominiTools, worker processes import it.
+"""
+
+import re
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .syntax_patterns import SyntaxSection, reference_pattern
+
+# Syntax section header -> (scope, templates), in the order the sections are written
+modifier_templates: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "Country Modifier Types": (
+        "string.modifier.type",
+        (
+            "country_subsidies_{bgs}",
+            "country_{pop_types}_pol_str_mult",
+            "country_{pop_types}_voting_power_add",
+        ),
+    ),
+    "State Modifier Types": (
+        "string.modifier.type",
+        (
+            "state_{religions}_standard_of_living_add",
+            "state_{cultures}_standard_of_living_add",
+            "country_{institutions}_max_investment_add",
+            "state_{pop_types}_mortality_mult",
+            "state_{pop_types}_dependent_wage_mult",
+            "state_{pop_types}_investment_pool_contribution_add",
+            "state_{pop_types}_investment_pool_efficiency_mult",
+            "state_pop_support_{laws}_add",
+            "state_pop_support_{laws}_mult",
+        ),
+    ),
+    "Interest Group Modifier Types": (
+        "string.modifier.type",
+        (
+            "interest_group_{igs}_pol_str_mult",
+            "interest_group_{igs}_approval_add",
+            "interest_group_{igs}_pop_attraction_mult",
+        ),
+    ),
+    "Building Group Modifier Types": (
+        "string.modifier.type",
+        (
+            "building_group_{bgs}_tax_mult",
+            "building_group_{bgs}_employee_mult",
+            "building_group_{bgs}_throughput_add",
+            "building_group_{bgs}_standard_of_living_add",
+            "building_group_{bgs}_unincorporated_throughput_add",
+            "building_group_{bgs}_fertility_mult",
+            "building_group_{bgs}_mortality_mult",
+            "building_group_{bgs}_{pop_types}_fertility_mult",
+            "building_group_{bgs}_{pop_types}_mortality_mult",
+            "building_group_{bgs}_{pop_types}_standard_of_living_add",
+        ),
+    ),
+    "Building Modifier Types": (
+        "string.modifier.type",
+        (
+            "{buildings}_throughput_add",
+            "building_employment_{pop_types}_add",
+            "building_employment_{pop_types}_mult",
+            "building_{pop_types}_fertility_mult",
+            "building_{pop_types}_mortality_mult",
+            "building_{pop_types}_shares_add",
+            "building_{pop_types}_shares_mult",
+            "{pop_types}_shares_add",
+            "{pop_types}_shares_mult",
+            # "building_output_{goods}_add",
+            # "building_input_{goods}_add",
+            # "building_output_{goods}_mult",
+        ),
+    ),
+    "Character Modifier Types": (
+        "string.modifier.type",
+        (
+            # "character_{battle_conditions}_mult",
+        ),
+    ),
+    "Trade Good Modifier Types": (
+        "string.trade.good.type",
+        (
+            # "goods_input_{goods}_add",
+            # "goods_output_{goods}_add",
+        ),
+    ),
+}
+
+
+def referenced_types() -> List[str]:
+    """The object types the templates are made from"""
+    types = {
+        x[1:-1]
+        for _, templates in modifier_templates.values()
+        for template in templates
+        for x in reference_pattern.findall(template)
+    }
+    return sorted(types)
+
+
+def modifier_sections(objects: Mapping[str, Sequence[str]]) -> List[SyntaxSection]:
+    """The syntax sections of the dynamic modifiers, objects are the keys by type"""
+    sections = list()
+    for header, (scope, templates) in modifier_templates.items():
+        section_objects = {
+            x: objects[x]
+            for x in referenced_types()
+            if any(f"{{{x}}}" in y for y in templates)
+        }
+        sections.append(SyntaxSection(header, scope, (), templates, section_objects))
+    return sections
+
+
+class DynamicModifiers:
+    """Checks whether names are dynamic modifiers of the given objects"""
+
+    def __init__(self, objects: Mapping[str, Sequence[str]]):
+        groups = list()
+        self.headers: Dict[str, str] = dict()
+        for index, section in enumerate(modifier_sections(objects)):
+            pattern = section.pattern()
+            if pattern:
+                self.headers[f"s{index}"] = section.header
+                groups.append(f"(?P<s{index}>{pattern})")
+        self.pattern = re.compile(r"(?:{})\Z".format("|".join(groups) or "(?!)"))
+
+    def section(self, name: str) -> Optional[str]:
+        """Get the section header of a dynamic modifier, None if it isn't one"""
+        match = self.pattern.match(name)
+        if match is None or match.lastgroup is None:
+            return None
+        return self.headers[match.lastgroup]
+
+    def __contains__(self, name: str) -> bool:
+        return self.section(name) is not None
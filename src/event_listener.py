@@ -5,18 +5,26 @@ The init function of the event listener is treated as the main entry point for t
 
 import os
 import re
-import threading
 import time
-from typing import List, Tuple, Union
+from typing import Any, List, Mapping, Optional, Tuple, Union
 
 import sublime
 import sublime_plugin
 
 from JominiTools.src import encoding_check
 from .autocomplete import AutoComplete
+from .dynamic_modifiers import DynamicModifiers, referenced_types
 from .game_data import VictoriaGameData
-from .game_objects import write_data_to_syntax
+from .game_objects import SyntaxWriter, write_data_to_syntax
+from .file_watcher import FileWatcher, create_watcher
 from .game_object_manager import GameObjectManager
+from .object_cache import ObjectCache
+from .lazy_objects import LazyGameObjects
+from .load_priority import OpenFile, prioritized_types
+from .object_loader import ObjectLoader, find_python
+from .object_store import ObjectStore
+from .object_registry import object_types
+from .vanilla_index import VanillaIndex, build_index, game_version, index_path
 from .v3_objects import *
 from .plugin import VictoriaPlugin
 from JominiTools.src.jomini_objects import *
@@ -26,7 +34,6 @@ from JominiTools.src import (
     get_file_name,
     get_syntax_name,
     is_file_in_directory,
-    GameObjectBase,
     Hover,
     JominiEventListener,
 )
@@ -39,6 +46,11 @@ class VictoriaEventListener(
     JominiEventListener,
     sublime_plugin.EventListener,
 ):
+    watcher: Optional[FileWatcher] = None
+    syntax_writer = SyntaxWriter()
+    # The game objects the dynamic modifiers were made from and the modifiers
+    dynamic_modifiers: Optional[Tuple[List[Any], DynamicModifiers]] = None
+
     def write_data_to_syntax(self, game_objects):
         write_data_to_syntax(game_objects)
 
@@ -53,150 +65,149 @@ class VictoriaEventListener(
 
     def create_all_game_objects(self):
         t0 = time.time()
-
-        def load_first():
-            self.game_objects["mods"] = Modifier()
-
-        def load_second():
-            self.game_objects[self.manager.state_regions.name] = StateRegion()
-            self.game_objects[self.manager.scripted_effects.name] = ScriptedEffect(
-                self.mod_files, self.game_files_path
-            )
-            self.game_objects[self.manager.laws.name] = Law()
-            self.game_objects[self.manager.ig_traits.name] = InterestGroupTrait()
-            self.game_objects[self.manager.ai_strats.name] = AiStrategy()
-            self.game_objects[self.manager.pop_types.name] = PopType()
-            self.game_objects[self.manager.parties.name] = Party()
-            self.game_objects[self.manager.subject_types.name] = SubjectType()
-            self.game_objects[self.manager.combat_unit_group.name] = CombatUnitGroup()
-
-        def load_third():
-            self.game_objects[self.manager.countries.name] = Country()
-            self.game_objects[self.manager.canals.name] = Canal()
-            self.game_objects[self.manager.char_template.name] = CharacterTemplate()
-            self.game_objects[self.manager.diplo_cat.name] = DiplomaticCatalyst()
-            self.game_objects[self.manager.terrain_label.name] = TerrainLabel()
-            self.game_objects[self.manager.messages.name] = Message()
-            self.game_objects[self.manager.objectives.name] = Objective()
-            self.game_objects[self.manager.objective_subgoal.name] = ObjectiveSubgoal()
-            self.game_objects[self.manager.political_lobby.name] = PoliticalLobby()
-            self.game_objects[self.manager.political_lobby_appeasement.name] = (
-                PoliticalLobbyAppeasement()
-            )
-            self.game_objects[self.manager.pb_identity.name] = PowerBlocIdentity()
-            self.game_objects[self.manager.pb_principle_group.name] = (
-                PowerBlocPrincipleGroup()
-            )
-            self.game_objects[self.manager.pb_principle.name] = PowerBlocPrinciple()
-            self.game_objects[self.manager.scripted_progress_bar.name] = (
-                ScriptedProgressBar()
-            )
-            self.game_objects[self.manager.pm_groups.name] = ProductionMethodGroup()
-            self.game_objects[self.manager.script_values.name] = ScriptValue(
-                self.mod_files, self.game_files_path
-            )
-            self.game_objects[self.manager.ideologies.name] = Ideology()
-            self.game_objects[self.manager.bgs.name] = BuildingGroup()
-            self.game_objects[self.manager.law_groups.name] = LawGroup()
-            self.game_objects[self.manager.religions.name] = Religion()
-            self.game_objects[self.manager.decrees.name] = Decree()
-            self.game_objects[self.manager.institutions.name] = Institutions()
-            self.game_objects[self.manager.country_types.name] = CountryType()
-            self.game_objects[self.manager.alert_group.name] = AlertGroup()
-
-        def load_fourth():
-            self.game_objects[self.manager.modifier_types.name] = ModifierType()
-            self.game_objects[self.manager.strategic_regions.name] = StrategicRegion()
-            self.game_objects[self.manager.companies.name] = CompanyType()
-            self.game_objects[self.manager.discrimination_traits.name] = (
-                DiscriminationTrait()
-            )
-            self.game_objects[self.manager.diplo_plays.name] = DiplomaticPlay()
-            self.game_objects[self.manager.terrains.name] = Terrain()
-            self.game_objects[self.manager.battle_conditions.name] = BattleCondition()
-            self.game_objects[self.manager.pop_needs.name] = PopNeed()
-            self.game_objects[self.manager.country_ranks.name] = CountryRank()
-            self.game_objects[self.manager.scripted_modifiers.name] = ScriptedModifier(
-                self.mod_files, self.game_files_path
+        if isinstance(self.game_objects, LazyGameObjects):
+            # The objects of the previous load aren't loaded in the background anymore
+            self.game_objects.cancel()
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+        cache = ObjectCache(
+            os.path.join(sublime.cache_path(), "Victoria3Tools", "object_cache.json")
+        )
+        cache.load()
+        workers = os.cpu_count() or 1
+        python = None
+        if self.settings.get("ObjectParsingMode") == "processes":
+            python = find_python(str(self.settings.get("PythonExecutable", "")))
+            if python is None:
+                print("Victoria 3: no python interpreter found, parsing in threads")
+        self.syntax_writer.python = None
+        if self.settings.get("SyntaxGenerationMode") == "process":
+            self.syntax_writer.python = find_python(
+                str(self.settings.get("PythonExecutable", ""))
             )
+        type_names = list(object_types)
 
-        def load_fifth():
-            self.game_objects[self.manager.pms.name] = ProductionMethod()
-            self.game_objects[self.manager.cultures.name] = Culture()
-            self.game_objects[self.manager.technologies.name] = Technology()
-            self.game_objects[self.manager.named_colors.name] = NamedColor(
-                self.mod_files, self.game_files_path
-            )
-            self.game_objects[self.manager.char_traits.name] = CharacterTrait()
-            self.game_objects[self.manager.combat_unit_type.name] = CombatUnitType()
-            self.game_objects[self.manager.commander_orders.name] = CommanderOrder()
-            self.game_objects[self.manager.game_rules.name] = GameRules()
-            self.game_objects[self.manager.commander_ranks.name] = CommanderRank()
-            self.game_objects[self.manager.culture_graphics.name] = CultureGraphics()
-
-        def load_sixth():
-            self.game_objects[self.manager.scripted_triggers.name] = ScriptedTrigger(
-                self.mod_files, self.game_files_path
-            )
-            self.game_objects[self.manager.jes.name] = JournalEntry()
-            self.game_objects[self.manager.state_traits.name] = StateTrait()
-            self.game_objects[self.manager.gov_types.name] = GovernmentType()
-            self.game_objects[self.manager.buildings.name] = Building()
-            self.game_objects[self.manager.goods.name] = Goods()
-            self.game_objects[self.manager.diplo_actions.name] = DiplomaticAction()
-            self.game_objects[self.manager.mobilization_options.name] = (
-                MobilizationOption()
+        version, vanilla = None, None
+        index_directory = os.path.join(
+            sublime.cache_path(), "Victoria3Tools", "vanilla_index"
+        )
+        if self.settings.get("UseVanillaIndex"):
+            version = game_version(self.game_files_path)
+            if version is not None:
+                vanilla = VanillaIndex.load(index_path(index_directory, version))
+        unindexed = [x for x in type_names if vanilla is None or not vanilla.has(x)]
+
+        loader = ObjectLoader(
+            self.game_files_path,
+            self.mod_files,
+            cache,
+            workers,
+            python,
+            vanilla,
+            compact=bool(self.settings.get("CompactObjectStorage")),
+        )
+        self.loader = loader
+
+        def index_game_files():
+            # The game files were loaded like mod files this time, index them so the
+            # next start with this game version only has to load the mods
+            index = VanillaIndex(version)
+            if vanilla is not None:
+                index.types.update(vanilla.types)
+                index.keys.update(vanilla.keys)
+            build_index(self.game_files_path, version, unindexed, cache, index)
+            index.save(index_path(index_directory, version))
+            print(f"Victoria 3: indexed the game files of version {version}")
+
+        def on_all_loaded():
+            if loader is not self.loader:
+                # The objects were reloaded while this load was still running
+                return
+            with loader.lock:
+                cache.save()
+
+            # Write syntax data after creating objects so they actually exist
+            objects = self.game_objects.snapshot().objects
+            self.syntax_writer.request(objects, 0)
+
+            if version is not None and unindexed:
+                sublime.set_timeout_async(index_game_files, 0)
+
+            t1 = time.time()
+            hits = sum(x.hits for x in cache.stats.values())
+            misses = sum(x.misses for x in cache.stats.values())
+            print(
+                "Time taken to create Victoria 3 objects: {:.3f} seconds "
+                "({} cached files, {} parsed files)".format(t1 - t0, hits, misses)
             )
-            self.game_objects[self.manager.proposal_types.name] = ProposalType()
-            self.game_objects[self.manager.igs.name] = InterestGroup()
-            self.game_objects[self.manager.scripted_gui.name] = ScriptedGui(
-                self.mod_files, self.game_files_path
+            print(
+                "    Run 'Victoria 3: Object Loading Report' to see what each object "
+                "type cost"
             )
-            self.game_objects[self.manager.custom_loc.name] = CustomLoc()
-            self.game_objects[self.manager.gui_types.name] = GuiType(
-                self.mod_files, self.game_files_path
+
+            if self.settings.get("WatchObjectFiles"):
+                self.watcher = create_watcher(
+                    loader.watched_directories(),
+                    self.on_object_files_changed,
+                    poll_interval=float(self.settings.get("WatchPollingInterval", 2)),
+                    poll_directories=loader.watched_directories(game_files=False),
+                )
+                self.watcher.start()
+
+        if self.settings.get("LazyObjectLoading"):
+            # Types are loaded when first used and the rest are loaded in the
+            # background, cheapest first so as many types as possible are ready early
+            self.game_objects = LazyGameObjects(loader, loader.by_cost(type_names))
+            self.prioritize_object_loading(
+                [view for window in sublime.windows() for view in window.views()]
             )
-            self.game_objects[self.manager.gui_templates.name] = GuiTemplate(
-                self.mod_files, self.game_files_path
+            self.game_objects.load_in_background(on_all_loaded)
+            return
+
+        # Each type is published as soon as its files are parsed. On a reload the old
+        # objects of a type stay available until the new ones replace them.
+        if not isinstance(self.game_objects, ObjectStore) or isinstance(
+            self.game_objects, LazyGameObjects
+        ):
+            self.game_objects = ObjectStore(type_names=type_names)
+        loader.load_all(
+            type_names, lambda name, objects: self.game_objects.publish({name: objects})
+        )
+        on_all_loaded()
+
+    def prioritize_object_loading(self, views: List[sublime.View]):
+        """Load the game objects that the files in views need before all others"""
+        if not isinstance(self.game_objects, LazyGameObjects):
+            return
+        if self.game_objects.next_pending() is None:
+            return
+
+        open_files = list()
+        for view in views:
+            file_name = view.file_name()
+            syntax_name = get_syntax_name(view)
+            if not file_name or not self.plugin.valid_syntax(syntax_name):
+                continue
+            open_files.append(
+                OpenFile(
+                    file_name,
+                    view.substr(sublime.Region(0, view.size())),
+                    self.plugin.is_data_system_syntax(syntax_name),
+                )
             )
-            self.game_objects[self.manager.gui_templates.name].remove("inside")
-            self.game_objects[self.manager.gui_templates.name].remove("you")
-            self.game_objects[self.manager.gui_templates.name].remove("can")
-            self.game_objects[self.manager.gui_templates.name].remove("but")
-            self.game_objects[self.manager.gui_templates.name].remove("on")
-            self.game_objects[self.manager.gui_templates.name].remove("within")
-            self.game_objects[self.manager.gui_templates.name].remove("names")
-
-        thread1 = threading.Thread(target=load_first)
-        thread2 = threading.Thread(target=load_second)
-        thread3 = threading.Thread(target=load_third)
-        thread4 = threading.Thread(target=load_fourth)
-        thread5 = threading.Thread(target=load_fifth)
-        thread6 = threading.Thread(target=load_sixth)
-        thread1.start()
-        thread2.start()
-        thread3.start()
-        thread4.start()
-        thread5.start()
-        thread6.start()
-        thread1.join()
-        thread2.join()
-        thread3.join()
-        thread4.join()
-        thread5.join()
-        thread6.join()
-
-        # Write syntax data after creating objects so they actually exist when writing
-        sublime.set_timeout_async(lambda: write_data_to_syntax(self.game_objects), 0)
-
-        t1 = time.time()
-        print("Time taken to create Victoria 3 objects: {:.3f} seconds".format(t1 - t0))
+
+        self.game_objects.prioritize(
+            prioritized_types(open_files, self.game_data, self.game_objects.type_names)
+        )
 
     def on_deactivated_async(self, view):
         super().on_deactivated_async(view)
 
     def on_activated_async(self, view):
         super().on_activated_async(view)
+        self.prioritize_object_loading([view])
 
     def on_query_completions(
         self, view: sublime.View, prefix: str, locations: List[int]
@@ -219,13 +230,13 @@ class VictoriaEventListener(
 
         if self.plugin.is_data_system_syntax(syntax_name):
             for flag, completion in self.game_data.data_system_completion_flag_pairs:
-                completion_list = self.create_completion_list(flag, completion)
+                completion_list = self.create_ready_completion_list(flag, completion)
                 if completion_list is not None:
                     return completion_list
             return  # Don't need to check anything else for data system
 
         for flag, completion in self.game_data.completion_flag_pairs:
-            completion_list = self.create_completion_list(flag, completion)
+            completion_list = self.create_ready_completion_list(flag, completion)
             if completion_list is not None:
                 return completion_list
 
@@ -298,8 +309,12 @@ class VictoriaEventListener(
                 ]
             )
         if self.modifier_field or re.search("modifiers", fname):
-            completions = self.game_objects["modifier_types"].keys()
-            completions = sorted(completions)
+            modifier_types = self.game_objects.ready("modifier_types")
+            if modifier_types is None:
+                return self.pending_completion_list(
+                    (sublime.KIND_ID_SNIPPET, "M", "Modifier Type")
+                )
+            completions = sorted(modifier_types.keys())
             return sublime.CompletionList(
                 [
                     sublime.CompletionItem(
@@ -315,6 +330,29 @@ class VictoriaEventListener(
             )
         return None
 
+    def create_ready_completion_list(self, flag: str, completion):
+        """create_completion_list that doesn't wait for types that are still loading"""
+        if not getattr(self, flag, False) or self.game_objects.ready(flag) is not None:
+            return self.create_completion_list(flag, completion)
+        setattr(self, flag, False)
+        return self.pending_completion_list(completion)
+
+    def pending_completion_list(self, completion) -> sublime.CompletionList:
+        """Completions that show the objects for completion are still loading"""
+        return sublime.CompletionList(
+            [
+                sublime.CompletionItem(
+                    trigger=f"{completion[2]} loading...",
+                    completion="",
+                    completion_format=sublime.COMPLETION_FORMAT_TEXT,
+                    kind=completion,
+                    annotation="pending",
+                    details="Still loading, try again in a moment",
+                )
+            ],
+            flags=sublime.INHIBIT_WORD_COMPLETIONS,
+        )
+
     def on_selection_modified_async(self, view: sublime.View):
         if not view:
             return
@@ -360,7 +398,7 @@ class VictoriaEventListener(
         encoding_check(view)
 
         if self.settings.get("UpdateObjectsOnSave"):
-            self.update_saved_game_objects(view, mod_dir)
+            self.update_saved_game_objects(view)
 
     def on_hover(self, view: sublime.View, point: int, hover_zone: sublime.HoverZone):
         if not view:
@@ -396,6 +434,11 @@ class VictoriaEventListener(
         if self.plugin.is_data_system_syntax(syntax_name):
             hover_objects = self.game_data.data_system_hover_objects
 
+        # Objects that are still loading get no hover instead of waiting for them
+        hover_objects = [
+            x for x in hover_objects if self.game_objects.ready(x[0]) is not None
+        ]
+
         # Do everything that requires fetching GameObjects in non-blocking thread
         sublime.set_timeout_async(
             lambda: self.do_hover_async(view, point, hover_objects), 0
@@ -413,7 +456,6 @@ class VictoriaEventListener(
             and self.settings.get("DocsHoverEnabled") is True
         ):
             if view.match_selector(point, "keyword.effect"):
-                self.game_data.game_effects.update(self.game_data.CustomEffectsList)
                 self.show_hover_docs(
                     view,
                     point,
@@ -422,7 +464,6 @@ class VictoriaEventListener(
                     self.settings,
                 )
             elif view.match_selector(point, "string.trigger"):
-                self.game_data.game_triggers.update(self.game_data.CustomTriggersList)
                 self.show_hover_docs(
                     view,
                     point,
@@ -431,7 +472,6 @@ class VictoriaEventListener(
                     self.settings,
                 )
             elif view.match_selector(point, "storage.type.scope"):
-                self.game_data.game_scopes.update(self.game_data.CustomScopesList)
                 self.show_hover_docs(
                     view,
                     point,
@@ -444,7 +484,7 @@ class VictoriaEventListener(
                     view,
                     point,
                     "string.modifier.type",
-                    self.game_data.game_modifiers,
+                    self.modifier_docs(view.substr(view.word(point))),
                     self.settings,
                 )
 
@@ -495,7 +535,8 @@ class VictoriaEventListener(
         if view.match_selector(point, "comment.line"):
             return
 
-        if gtemplate := self.game_objects["gui_templates"].access(word):
+        gui_templates = self.game_objects.ready("gui_templates")
+        if gui_templates and (gtemplate := gui_templates.access(word)):
             self.show_gui_popup(
                 view,
                 point,
@@ -503,7 +544,8 @@ class VictoriaEventListener(
                 "Gui Template",
             )
 
-        if gtype := self.game_objects["gui_types"].access(word):
+        gui_types = self.game_objects.ready("gui_types")
+        if gui_types and (gtype := gui_types.access(word)):
             self.show_gui_popup(
                 view,
                 point,
@@ -511,61 +553,67 @@ class VictoriaEventListener(
                 "Gui Type",
             )
 
-    def update_saved_game_objects(self, view: sublime.View, mod_dir: List[str]):
-        dir_to_game_object_dict = self.manager.get_dir_to_game_object_dict()
+    def modifier_docs(self, word: str) -> Mapping[str, str]:
+        """The modifier docs, with an entry for word if it is a dynamic modifier"""
+        modifiers = self.game_data.game_modifiers
+        if word in modifiers:
+            return modifiers
+
+        type_names = referenced_types()
+        sources = [self.game_objects.ready(x) for x in type_names]
+        if any(x is None for x in sources):
+            return modifiers
+        if self.dynamic_modifiers is None or any(
+            x is not y for x, y in zip(self.dynamic_modifiers[0], sources)
+        ):
+            # Made again only when one of the types it is made from changed
+            objects = {x: list(y.keys()) for x, y in zip(type_names, sources)}
+            self.dynamic_modifiers = (sources, DynamicModifiers(objects))
+
+        section = self.dynamic_modifiers[1].section(word)
+        if section is None:
+            return modifiers
+        description = f"Dynamic {section.lower().rstrip('s')}"
+        return modifiers.with_entries({word: description})
+
+    def update_saved_game_objects(self, view: sublime.View):
+        """Parse only the saved file again and patch its objects into game_objects"""
         filename = get_file_name(view)
-        if not filename:
-            return
-        relative_path = filename.replace(mod_dir[-1], "")[1:]
-        directory_path = os.path.dirname(relative_path)
-        if directory_path not in dir_to_game_object_dict:
-            return
+        if filename:
+            self.update_object_files([filename])
+
+    def on_object_files_changed(self, paths: List[str]):
+        """Called from the file watcher thread with files changed outside of sublime"""
+        with self.loader.lock:
+            self.update_object_files(paths)
+            self.loader.cache.save()
+
+    def update_object_files(self, paths: List[str]):
+        names_changed = False
+        # The watcher thread and saves update objects at the same time, the loader's
+        # lock keeps each reparse and its publish together
+        with self.loader.lock:
+            published = self.game_objects.snapshot().objects
+            changed = dict()
+            for path in paths:
+                for type_name, changes in self.loader.reparse_file(path).items():
+                    names_changed |= bool(changes.added or changes.removed)
+                    # Each changed type that is loaded is copied with the changes of
+                    # the file, types that aren't loaded yet will read the new objects
+                    # from the cache when they are loaded
+                    game_object = changed.get(type_name, published.get(type_name))
+                    if game_object is not None:
+                        changed[type_name] = self.loader.apply_changes(
+                            type_name, game_object, changes
+                        )
+            self.game_objects.publish(changed)
 
-        write_syntax: bool = self.settings.get("UpdateSyntaxOnNewObjectCreation")  # type: ignore
-        if write_syntax:
-            changed_objects_set = self.jomini_game_object.check_mod_for_changes(
-                self.mod_files,
-                self.manager.get_dir_to_game_object_dict(),
-                self.manager.get_game_object_dirs(),
-            )
-        else:
-            changed_objects_set = self.jomini_game_object.check_mod_for_changes(
-                self.mod_files,
-                self.manager.get_dir_to_game_object_dict(),
-                self.manager.get_game_object_dirs(),
-            )
-        if changed_objects_set:
-            # This checks if an object has actually been added in this save
-
-            game_object_to_check = dir_to_game_object_dict[directory_path]
-            game_objects = self.game_objects[game_object_to_check].keys()
-            game_objects_in_file = set()
-
-            view_lines = view.lines(sublime.Region(0, len(view)))
-
-            level_1_dirs = {}  # game objects parsed from level 1
-            level_2_dirs = {}  # game objects parsed from level 2
-            if relative_path in level_1_dirs:
-                base_object = GameObjectBase(level=1)
-            elif relative_path in level_2_dirs:
-                base_object = GameObjectBase(level=2)
-            else:
-                base_object = GameObjectBase()
-            for line in view_lines:
-                line = view.substr(line)
-                if base_object.should_read(line):
-                    found_item = (
-                        line.split("=").pop(0).replace(" ", "").replace("\t", "")
-                    )
-                    if not found_item:
-                        continue
-                    game_objects_in_file.add(found_item)
-
-            common_objects = [x in game_objects for x in game_objects_in_file]
-
-            # If the loaded objects from this file are not the same as the objects in the cache a new object has been added.
-            if not all(common_objects):
-                self.load_changed_objects(
-                    changed_objects_set,
-                    write_syntax,
-                )
+        if (
+            names_changed
+            and self.settings.get("UpdateSyntaxOnNewObjectCreation")
+            and not self.game_objects.pending()
+        ):
+            # Saves in quick succession, like a replace in many files, are written
+            # to the syntax together. The snapshot doesn't change while it is written,
+            # while types are still loading the syntax is written once they are done
+            self.syntax_writer.request(self.game_objects.snapshot().objects)
@@ -0,0 +1,69 @@
+"""
+Single pass directory scanner for the game and mod files.
+
+Every root is walked once with os.scandir, only descending into the directories that
+hold game objects, and each file is stat'ed once no matter how many object types read
+it. Mod files override game files with the same path relative to their directory.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SourceFile = Tuple[str, int, int]  # (path, size, mtime in nanoseconds)
+
+
+class FileScanner:
+    def __init__(self, roots: List[str]):
+        """Roots are scanned in order, files in later roots override earlier ones"""
+        self.roots = roots
+
+    def scan(self, directories: Iterable[str]) -> Dict[str, List[SourceFile]]:
+        """
+        Get the files in every directory (relative to the roots), sorted by their path
+        relative to the directory, which is the order the game reads them in.
+        """
+        self.directories = set(directories)
+        self.ancestors: Set[str] = set()
+        for directory in self.directories:
+            parent = os.path.dirname(directory)
+            while parent:
+                self.ancestors.add(parent)
+                parent = os.path.dirname(parent)
+
+        self.found: Dict[str, Dict[str, SourceFile]] = {
+            x: dict() for x in self.directories
+        }
+        for root in self.roots:
+            self.walk(root, "", None)
+
+        return {
+            directory: [files[x] for x in sorted(files)]
+            for directory, files in self.found.items()
+        }
+
+    def walk(self, root: str, relative: str, directory: Optional[str]):
+        try:
+            entries = os.scandir(os.path.join(root, relative) if relative else root)
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                child = os.path.join(relative, entry.name) if relative else entry.name
+                try:
+                    if entry.is_dir():
+                        if directory is not None:
+                            self.walk(root, child, directory)
+                        elif child in self.directories:
+                            self.walk(root, child, child)
+                        elif child in self.ancestors:
+                            self.walk(root, child, None)
+                    elif directory is not None and entry.is_file():
+                        stat = entry.stat()
+                        self.found[directory][child[len(directory) + 1 :]] = (
+                            entry.path,
+                            stat.st_size,
+                            stat.st_mtime_ns,
+                        )
+                except OSError:
+                    continue
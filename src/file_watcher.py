@@ -0,0 +1,264 @@
+"""
+Background watchers that report changed game object files, so files changed outside
+of sublime (git checkouts, tiger fixes, generators) are parsed again without a restart.
+
+On linux directories are watched with inotify, everywhere else they are polled.
+Changes are batched, a batch is only reported once no new change was seen for the
+debounce time so a checkout touching hundreds of files is handled in one go.
+
+Watched directories don't have to exist, a mod can create a new common/ folder while
+sublime is running. Polling finds them on its next pass, inotify watches the closest
+parent directory that exists until they are created.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+ChangeCallback = Callable[[List[str]], None]
+
+
+class FileWatcher(ABC):
+    def __init__(
+        self,
+        directories: Iterable[str],
+        on_change: ChangeCallback,
+        debounce: float = 0.5,
+    ):
+        """on_change is called from the watcher thread with the changed file paths"""
+        self.directories = list(directories)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.pending: Set[str] = set()
+        self.last_change = 0.0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+
+    def is_watched(self, path: str) -> bool:
+        """Whether path is in one of the watched directories"""
+        return any(path == x or path.startswith(x + os.sep) for x in self.directories)
+
+    def add_changes(self, paths: Iterable[str]):
+        count = len(self.pending)
+        self.pending.update(paths)
+        if len(self.pending) != count:
+            self.last_change = time.monotonic()
+
+    def flush(self):
+        """Report the pending changes if nothing changed for the debounce time"""
+        if not self.pending or time.monotonic() - self.last_change < self.debounce:
+            return
+        paths = sorted(self.pending)
+        self.pending.clear()
+        try:
+            self.on_change(paths)
+        except Exception as e:
+            print(f"Victoria 3 file watcher failed to update objects: {e}")
+
+    @abstractmethod
+    def run(self):
+        """Watch until stopped, from the watcher thread"""
+
+
+def walk_files(directory: str) -> Dict[str, Tuple[int, int]]:
+    """Get the size and modification time of every file below directory"""
+    files = dict()
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files[path] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+class PollingWatcher(FileWatcher):
+    def __init__(
+        self,
+        directories: Iterable[str],
+        on_change: ChangeCallback,
+        debounce: float = 0.5,
+        interval: float = 2.0,
+    ):
+        super().__init__(directories, on_change, debounce)
+        self.interval = interval
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        files = dict()
+        for directory in self.directories:
+            files.update(walk_files(directory))
+        return files
+
+    def run(self):
+        files = self.snapshot()
+        while not self.stopped.wait(self.interval):
+            current = self.snapshot()
+            changed = [x for x in current if files.get(x) != current[x]]
+            changed.extend(x for x in files if x not in current)
+            files = current
+            self.add_changes(changed)
+            self.flush()
+
+
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+watch_mask = (
+    IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+event_header = struct.Struct("iIII")
+
+
+class InotifyWatcher(FileWatcher):
+    def __init__(
+        self,
+        directories: Iterable[str],
+        on_change: ChangeCallback,
+        debounce: float = 0.5,
+    ):
+        super().__init__(directories, on_change, debounce)
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = dict()
+        self.watch_directories()
+
+    def add_watch(self, directory: str):
+        watch = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), watch_mask)
+        if watch >= 0:
+            self.watches[watch] = directory
+
+    def watch_tree(self, directory: str) -> List[str]:
+        """Watch directory and every directory below it, returns the files in them"""
+        files = list()
+        for root, _, names in os.walk(directory):
+            self.add_watch(root)
+            files.extend(os.path.join(root, x) for x in names)
+        return files
+
+    def watch_directories(self) -> List[str]:
+        """
+        Watch the watched directories that aren't watched yet, returns the files in
+        them. A directory that doesn't exist yet is waited for by watching the closest
+        parent that does.
+        """
+        watched = set(self.watches.values())
+        files = list()
+        for directory in self.directories:
+            if directory in watched:
+                continue
+            if os.path.isdir(directory):
+                files.extend(self.watch_tree(directory))
+                watched.add(directory)
+                continue
+            parent = os.path.dirname(directory)
+            while parent != os.path.dirname(parent) and not os.path.isdir(parent):
+                parent = os.path.dirname(parent)
+            if parent not in watched and os.path.isdir(parent):
+                self.add_watch(parent)
+                watched.add(parent)
+        return files
+
+    def read_events(self) -> List[str]:
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return list()
+
+        changed = list()
+        offset = 0
+        while offset < len(data):
+            watch, mask, _, length = event_header.unpack_from(data, offset)
+            offset += event_header.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost, report every watched file
+                for directory in self.directories:
+                    changed.extend(walk_files(directory))
+                continue
+            if mask & (IN_IGNORED | IN_DELETE_SELF):
+                self.watches.pop(watch, None)
+                # Wait for the directory to be created again
+                changed.extend(self.watch_directories())
+                continue
+            if watch not in self.watches or not name:
+                continue
+
+            path = os.path.join(self.watches[watch], name)
+            if mask & IN_ISDIR:
+                if not mask & (IN_CREATE | IN_MOVED_TO):
+                    continue
+                if self.is_watched(path):
+                    changed.extend(self.watch_tree(path))
+                else:
+                    # Possibly a parent of a watched directory that didn't exist
+                    changed.extend(self.watch_directories())
+                continue
+            if self.is_watched(path):
+                changed.append(path)
+        return changed
+
+    def run(self):
+        try:
+            while not self.stopped.is_set():
+                timeout = self.debounce if self.pending else 1.0
+                readable, _, _ = select.select([self.fd], [], [], timeout)
+                if readable:
+                    self.add_changes(self.read_events())
+                self.flush()
+        finally:
+            os.close(self.fd)
+
+
+def create_watcher(
+    directories: Iterable[str],
+    on_change: ChangeCallback,
+    debounce: float = 0.5,
+    poll_interval: float = 2.0,
+    poll_directories: Optional[Iterable[str]] = None,
+) -> FileWatcher:
+    """
+    Watch with inotify when it is available and fall back to polling. Polling walks
+    every directory each interval, poll_directories limits it to the directories that
+    are worth that cost, by default it polls all directories.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories, on_change, debounce)
+        except (OSError, AttributeError, TypeError) as e:
+            print(f"Victoria 3 file watcher can't use inotify, polling instead: {e}")
+    if poll_directories is not None:
+        directories = poll_directories
+    return PollingWatcher(directories, on_change, debounce, poll_interval)
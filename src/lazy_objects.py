@@ -0,0 +1,93 @@
+"""
+Lazy loading of game objects, each object type is parsed the first time it is used.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .object_loader import LoadedGameObject, ObjectLoader
+from .object_store import ObjectStore
+
+# Pause between object types loaded in the background so hover, completion and
+# everything else running in the plugin host get a turn at the GIL.
+background_pause = 0.01
+
+
+class LazyGameObjects(ObjectStore):
+    """
+    A game object store that loads an object type when it is first accessed.
+    Types that are never accessed are loaded one at a time by a background thread.
+    Iterating gives the names of all types without loading any of them, so only
+    getting a type, which values() and items() also do, waits for it to load.
+    """
+
+    def __init__(self, loader: ObjectLoader, type_names: List[str]):
+        super().__init__(type_names=type_names)
+        self.loader = loader
+        self.load_order = self.type_names
+        self.type_locks: Dict[str, threading.Lock] = {
+            x: threading.Lock() for x in self.type_names
+        }
+        self.background: Optional[threading.Thread] = None
+        # Set when the objects are reloaded, the background thread stops loading
+        self.cancelled = threading.Event()
+
+    def __getitem__(self, type_name: str) -> LoadedGameObject:
+        try:
+            return self.current.objects[type_name]
+        except KeyError:
+            return self.load(type_name)
+
+    def load(self, type_name: str) -> LoadedGameObject:
+        if type_name not in self.type_locks:
+            raise KeyError(type_name)
+
+        with self.type_locks[type_name]:
+            if self.is_loaded(type_name):
+                return self.current.objects[type_name]
+            game_object = self.loader.load(type_name)
+            self.publish({type_name: game_object})
+            return game_object
+
+    def prioritize(self, type_names: List[str]):
+        """Change the order the background thread loads types in"""
+        self.load_order = [x for x in type_names if x in self.type_locks]
+
+    def request(self, type_name: str):
+        if type_name in self.type_locks and not self.is_loaded(type_name):
+            self.load_order = [type_name] + [
+                x for x in self.load_order if x != type_name
+            ]
+
+    def next_pending(self) -> Optional[str]:
+        for type_name in self.load_order:
+            if not self.is_loaded(type_name):
+                return type_name
+        return None
+
+    def cancel(self):
+        """Stop the background thread after the type it is loading, on_done isn't called"""
+        self.cancelled.set()
+
+    def load_in_background(self, on_done: Optional[Callable[[], None]] = None):
+        def run():
+            type_name = self.next_pending()
+            while type_name is not None and not self.cancelled.is_set():
+                self.load(type_name)
+                time.sleep(background_pause)
+                type_name = self.next_pending()
+            if on_done is not None and not self.cancelled.is_set():
+                on_done()
+
+        self.background = threading.Thread(target=run, daemon=True)
+        self.background.start()
+
+    def __contains__(self, type_name) -> bool:
+        return type_name in self.type_locks or self.is_loaded(type_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.type_names)
+
+    def __len__(self) -> int:
+        return len(self.type_names)
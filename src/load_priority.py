@@ -0,0 +1,76 @@
+"""
+Decide which game object types to load first based on the files that are open.
+"""
+
+import os
+import re
+from typing import Dict, List, NamedTuple, Set
+
+from .object_registry import object_types
+
+scope_prefix_pattern = re.compile(r"\b(\w+:)")
+assignment_pattern = re.compile(r"\b(\w+)\s*[=<>!]")
+
+
+class OpenFile(NamedTuple):
+    path: str
+    text: str
+    is_data_system: bool  # gui and localization files
+
+
+def types_in_directory(path: str) -> List[str]:
+    """Get the object types defined in the directory of path"""
+    return [
+        type_name
+        for type_name, object_type in object_types.items()
+        if f"{os.sep}{object_type.directory}{os.sep}" in path
+    ]
+
+
+def referenced_types(text: str, game_data) -> Set[str]:
+    """Get the object types that the completion tables say are used in text"""
+    prefixes: Dict[str, str] = dict(
+        game_data.simple_completion_scope_pattern_flag_pairs
+    )
+    keywords: Dict[str, str] = dict()
+    for words, type_name in game_data.simple_completion_pattern_flag_pairs:
+        for word in words:
+            keywords[word] = type_name
+
+    found = {prefixes[x] for x in scope_prefix_pattern.findall(text) if x in prefixes}
+    found.update(keywords[x] for x in assignment_pattern.findall(text) if x in keywords)
+    return found
+
+
+def prioritized_types(
+    open_files: List[OpenFile], game_data, type_names: List[str]
+) -> List[str]:
+    """
+    Order type_names so the types open files need come first:
+    1. Types defined in the same directories as the open files
+    2. Types the open files reference through scope prefixes or keywords
+    3. Types used for completion and hover in the kinds of files that are open
+    4. Everything else, in the original order
+    """
+    first: List[str] = list()
+    referenced: Set[str] = set()
+    script_open = any(not x.is_data_system for x in open_files)
+    data_system_open = any(x.is_data_system for x in open_files)
+
+    for open_file in open_files:
+        first.extend(types_in_directory(open_file.path))
+        if not open_file.is_data_system:
+            referenced.update(referenced_types(open_file.text, game_data))
+
+    used: Set[str] = set()
+    if script_open:
+        used.update(x[0] for x in game_data.completion_flag_pairs)
+        used.update(x[0] for x in game_data.script_hover_objects)
+    if data_system_open:
+        used.update(x[0] for x in game_data.data_system_completion_flag_pairs)
+        used.update(x[0] for x in game_data.data_system_hover_objects)
+
+    ordered = first + [x for x in type_names if x in referenced]
+    ordered += [x for x in type_names if x in used]
+    ordered += type_names
+    return [x for x in dict.fromkeys(ordered) if x in type_names]
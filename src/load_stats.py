@@ -0,0 +1,148 @@
+"""
+Per object type statistics of how the game objects were loaded, shown by the
+v3_object_load_report command.
+"""
+
+import gc
+import sys
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class TypeStats:
+    def __init__(self, type_name: str, directory: str):
+        self.type_name = type_name
+        self.directory = directory
+        self.files = 0
+        self.bytes = 0
+        self.parsed_files = 0  # The rest were read from the object cache
+        self.parse_time = 0.0
+        self.objects = 0
+        self.memory = 0  # Approximate bytes retained by the loaded objects
+        self.workers: Set[str] = set()
+        # The latest game object of the type, measured when the report is shown
+        self.loaded: Optional[weakref.ref] = None
+
+
+# Report columns that can be sorted by, largest first except for names
+sort_keys: Dict[str, Callable[[TypeStats], object]] = {
+    "parse time": lambda x: -x.parse_time,
+    "size": lambda x: -x.bytes,
+    "files": lambda x: -x.files,
+    "parsed files": lambda x: -x.parsed_files,
+    "objects": lambda x: -x.objects,
+    "memory": lambda x: -x.memory,
+    "name": lambda x: x.type_name,
+    "directory": lambda x: (x.directory, x.type_name),
+}
+
+
+def retained_size(records: Iterable[Any]) -> int:
+    """
+    Estimate the memory used by the loaded objects of a type. Counts every object
+    record with its instance dict, if it has one, and its name. Paths are shared
+    between the objects of a file so each is counted once.
+    """
+    size = 0
+    paths = set()
+    for record in records:
+        size += sys.getsizeof(record) + sys.getsizeof(record.key)
+        # Looking at the referents doesn't create a dict for objects without one
+        for referent in gc.get_referents(record):
+            if type(referent) is dict:
+                size += sys.getsizeof(referent)
+        path = record.path
+        if path not in paths:
+            paths.add(path)
+            size += sys.getsizeof(path)
+    return size
+
+
+class LoadStats:
+    # The statistics of the most recently created ObjectLoader
+    latest: Optional["LoadStats"] = None
+
+    def __init__(self):
+        self.types: Dict[str, TypeStats] = dict()
+        self.scan_time = 0.0
+        self.lock = threading.Lock()
+
+    def get(self, type_name: str, directory: str = "") -> TypeStats:
+        with self.lock:
+            if type_name not in self.types:
+                self.types[type_name] = TypeStats(type_name, directory)
+            return self.types[type_name]
+
+    def add_parse(self, type_name: str, seconds: float, worker: str):
+        type_stats = self.get(type_name)
+        with self.lock:
+            type_stats.parsed_files += 1
+            type_stats.parse_time += seconds
+            type_stats.workers.add(worker)
+
+    def set_loaded(self, type_name: str, game_object: Any):
+        self.get(type_name).loaded = weakref.ref(game_object)
+
+    def measure(self):
+        """Measure the memory of the loaded game objects, too slow to do on every load"""
+        with self.lock:
+            types = list(self.types.values())
+        for x in types:
+            game_object = x.loaded() if x.loaded is not None else None
+            if game_object is not None:
+                x.memory = retained_size(game_object.records.values())
+
+    def report(self, sort_by: str = "parse time") -> str:
+        self.measure()
+        with self.lock:
+            types = sorted(self.types.values(), key=sort_keys[sort_by])
+
+        header = (
+            "Type",
+            "Directory",
+            "Files",
+            "Parsed",
+            "Size KB",
+            "Parse ms",
+            "Objects",
+            "Memory KB",
+            "Parsed by",
+        )
+        rows: List[Tuple[str, ...]] = [header]
+        for x in types:
+            rows.append(
+                (
+                    x.type_name,
+                    x.directory,
+                    str(x.files),
+                    str(x.parsed_files),
+                    str(round(x.bytes / 1024)),
+                    str(round(x.parse_time * 1000)),
+                    str(x.objects),
+                    str(round(x.memory / 1024)),
+                    ", ".join(sorted(x.workers)) or ("cache" if x.files else ""),
+                )
+            )
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                value.rjust(width) if 2 <= i < len(header) - 1 else value.ljust(width)
+                for i, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        ]
+        lines.insert(1, "-" * len(lines[0]))
+
+        total_time = sum(x.parse_time for x in types)
+        total_bytes = sum(x.bytes for x in types)
+        lines.append("")
+        lines.append(
+            f"{len(types)} types, {sum(x.files for x in types)} files, "
+            f"{round(total_bytes / 1024)} KB, "
+            f"{round(total_time * 1000)} ms parsing (summed over all workers), "
+            f"{round(self.scan_time * 1000)} ms scanning directories"
+        )
+        lines.append(f"Sorted by {sort_by}")
+        return "\n".join(lines) + "\n"
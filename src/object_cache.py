@@ -0,0 +1,171 @@
+"""
+Persistent on-disk cache of parsed game object files.
+
+Every cached file is stored under the object type that parsed it and is validated by
+its size and modification time, so only files that changed since the last start have
+to be parsed again. The parsed objects are kept in a data file next to the cache and
+are read back when a type is built, see object_data.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from .object_data import (
+    ObjectData,
+    StoredObjects,
+    data_path,
+    remove_data,
+    resolve,
+    write_objects,
+)
+from .object_parser import ParsedObject
+
+# Bump this whenever the format of the cache or the parser output changes
+CACHE_VERSION = 3
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+
+class ObjectCache:
+    def __init__(self, path: str):
+        self.path = path
+        # type name -> path -> [size, mtime, objects], objects are only in memory
+        # until the cache is saved, after that they are StoredObjects
+        self.types: Dict[str, Dict[str, list]] = dict()
+        self.stats: Dict[str, CacheStats] = dict()
+        # Total size in bytes of the files each type was last loaded from
+        self.costs: Dict[str, int] = dict()
+        self.dirty = False
+        # The data file the header refers to and the replaced ones that couldn't be
+        # removed yet, a save never removes data files it didn't replace
+        self.data_file: Optional[str] = None
+        self.old_data: List[str] = list()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+
+        if data.get("version") != CACHE_VERSION:
+            # Stale format, everything will be parsed again and the cache rewritten
+            return
+
+        directory = os.path.dirname(self.path)
+        stored = ObjectData(os.path.join(directory, data.get("data", "")))
+        try:
+            stored.map()
+        except (OSError, ValueError):
+            return
+
+        self.types = {
+            type_name: {
+                path: [size, mtime, StoredObjects(stored, offset, length)]
+                for path, (size, mtime, offset, length) in cached_files.items()
+            }
+            for type_name, cached_files in data.get("types", dict()).items()
+        }
+        self.costs = data.get("costs", dict())
+        self.data_file = stored.path
+
+    def save(self):
+        if not self.dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        types = {
+            type_name: {path: [x[0], x[1]] for path, x in cached_files.items()}
+            for type_name, cached_files in self.types.items()
+        }
+        entries = [x for y in self.types.values() for x in y.values()]
+        new_data_path = data_path(self.path)
+        stored = write_objects(new_data_path, [x[2] for x in entries])
+        for header, stored_objects in zip(
+            [x for y in types.values() for x in y.values()], stored
+        ):
+            header.extend((stored_objects.offset, stored_objects.length))
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "data": os.path.basename(new_data_path),
+                    "types": types,
+                    "costs": self.costs,
+                },
+                file,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, self.path)
+
+        # The parsed objects are read from the new data file from now on
+        for entry, stored_objects in zip(entries, stored):
+            entry[2] = stored_objects
+        if self.data_file is not None:
+            self.old_data.append(self.data_file)
+        self.data_file = new_data_path
+        self.old_data = remove_data(self.old_data)
+        self.dirty = False
+
+    def get_stats(self, type_name: str) -> CacheStats:
+        if type_name not in self.stats:
+            self.stats[type_name] = CacheStats()
+        return self.stats[type_name]
+
+    def has(self, type_name: str, path: str, size: int, mtime: int) -> bool:
+        """Is the file cached with this size and mtime, without reading its objects"""
+        entry = self.types.get(type_name, dict()).get(path)
+        stats = self.get_stats(type_name)
+        if entry is None or entry[0] != size or entry[1] != mtime:
+            stats.misses += 1
+            return False
+
+        stats.hits += 1
+        return True
+
+    def objects(
+        self, type_name: str, path: str, keep: bool = True
+    ) -> Optional[List[ParsedObject]]:
+        """Get the cached objects of a file, None if it isn't cached or can't be read"""
+        entry = self.types.get(type_name, dict()).get(path)
+        return None if entry is None else resolve(entry[2], keep)
+
+    def put(
+        self,
+        type_name: str,
+        path: str,
+        size: int,
+        mtime: int,
+        objects: List[ParsedObject],
+    ):
+        self.types.setdefault(type_name, dict())[path] = [size, mtime, objects]
+        self.dirty = True
+
+    def remove(self, type_name: str, path: str):
+        cached_files = self.types.get(type_name)
+        if cached_files and path in cached_files:
+            del cached_files[path]
+            self.dirty = True
+
+    def set_cost(self, type_name: str, cost: int):
+        if self.costs.get(type_name) != cost:
+            self.costs[type_name] = cost
+            self.dirty = True
+
+    def prune(self, type_name: str, live_paths: List[str]):
+        """Drop cached files of type_name that no longer exist or are overridden"""
+        cached_files = self.types.get(type_name)
+        if not cached_files:
+            return
+
+        live = set(live_paths)
+        for path in [x for x in cached_files if x not in live]:
+            del cached_files[path]
+            self.dirty = True
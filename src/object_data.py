@@ -0,0 +1,142 @@
+"""
+Parsed objects of files kept on disk instead of in memory.
+
+The object cache and the vanilla index only keep the size and modification time of
+each file in memory. The objects parsed from a file are stored as json in a data file
+next to them, and only the byte range of each file's objects is kept. They are read
+back through a memory map when a type is built. The most recently read files are
+kept in a small LRU for the reparse of saved files, building a type reads all of its
+files once without going through it so a type with more files than the LRU holds
+doesn't evict it.
+
+Data files are never changed once written, every save writes a new one so readers of
+the previous file are never affected. A save only removes the data file it replaces, and
+data files are mapped as soon as they are loaded or written so they stay readable when
+another process sharing the directory replaces them.
+
+This module must not import sublime or JominiTools, worker processes import it.
+"""
+
+import json
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from .object_parser import ParsedObject
+
+# Number of files whose objects are kept after they were read
+recent_files = 128
+
+
+class ObjectData:
+    """A data file of parsed objects, mapped into memory the first time it is read"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.mapped: Optional[mmap.mmap] = None
+        self.recent: "OrderedDict[int, List[ParsedObject]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def map(self):
+        """Map the file, it stays readable when another save removes it afterwards"""
+        if self.mapped is None:
+            with open(self.path, "rb") as file:
+                self.mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read_bytes(self, offset: int, length: int) -> bytes:
+        self.map()
+        if offset + length > len(self.mapped):
+            raise ValueError(f"{self.path} is shorter than expected")
+        return self.mapped[offset : offset + length]
+
+    def read(self, offset: int, length: int, keep: bool = True) -> List[ParsedObject]:
+        """Without keep the objects aren't added to the recently read files"""
+        with self.lock:
+            objects = self.recent.get(offset)
+            if objects is not None:
+                self.recent.move_to_end(offset)
+                return objects
+
+            objects = json.loads(self.read_bytes(offset, length))
+            if not keep:
+                return objects
+            self.recent[offset] = objects
+            if len(self.recent) > recent_files:
+                self.recent.popitem(last=False)
+            return objects
+
+    def raw(self, offset: int, length: int) -> bytes:
+        with self.lock:
+            return self.read_bytes(offset, length)
+
+
+class StoredObjects(NamedTuple):
+    """The objects of a file stored in a data file"""
+
+    data: ObjectData
+    offset: int
+    length: int
+
+    def read(self, keep: bool = True) -> List[ParsedObject]:
+        return self.data.read(self.offset, self.length, keep)
+
+
+Objects = Union[List[ParsedObject], StoredObjects]
+
+
+def resolve(objects: Objects, keep: bool = True) -> Optional[List[ParsedObject]]:
+    """
+    Get objects that may be stored, None if they can't be read anymore. Reading every
+    file of a type would only evict the recently read files, it reads without keep.
+    """
+    if not isinstance(objects, StoredObjects):
+        return objects
+    try:
+        return objects.read(keep)
+    except (OSError, ValueError) as e:
+        print(f"Victoria 3 failed to read stored objects from {objects.data.path}: {e}")
+        return None
+
+
+def data_path(path: str) -> str:
+    """Get the path of a new data file for the json file at path"""
+    return f"{os.path.splitext(path)[0]}.{time.time_ns()}.data"
+
+
+def write_objects(path: str, files: Sequence[Objects]) -> List[StoredObjects]:
+    """
+    Write the objects of files to a new data file at path, objects that are already
+    stored are copied from their data file without decoding them.
+    """
+    data = ObjectData(path)
+    stored = list()
+    offset = 0
+    with open(path, "wb") as file:
+        for objects in files:
+            if isinstance(objects, StoredObjects):
+                raw = objects.data.raw(objects.offset, objects.length)
+            else:
+                raw = json.dumps(objects, separators=(",", ":")).encode()
+            file.write(raw)
+            stored.append(StoredObjects(data, offset, len(raw)))
+            offset += len(raw)
+    if offset:
+        data.map()
+    return stored
+
+
+def remove_data(paths: Sequence[str]) -> List[str]:
+    """Remove replaced data files, returns the ones that can't be removed yet"""
+    kept = list()
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            # Still mapped by this process on windows, removed by a later save
+            kept.append(path)
+    return kept
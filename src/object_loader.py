@@ -0,0 +1,600 @@
+"""
+Loading of game objects from the game and mod files, backed by the on-disk object cache.
+Files that are not cached are parsed either in threads or in worker processes.
+With a vanilla index the objects of the game files are read from the index and only the
+mod files are scanned.
+"""
+
+import heapq
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from JominiTools.src import GameObjectBase, PdxScriptObject
+from .file_scanner import FileScanner, SourceFile
+from .load_stats import LoadStats
+from .object_cache import ObjectCache
+from .object_parser import ParsedObject, parse_file_together
+from .object_registry import object_types
+from .vanilla_index import VanillaIndex
+
+
+# Parsing less than this many bytes isn't worth the cost of starting worker processes
+min_process_parse_bytes = 4 * 1024 * 1024
+
+worker_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+
+
+class ParseJob(NamedTuple):
+    type_name: str
+    path: str
+    size: int
+    mtime: int
+
+
+# The jobs of every type that reads the same file, the file is parsed once for them
+FileJobs = List[ParseJob]
+
+ParsedCallback = Callable[[ParseJob, Optional[List[ParsedObject]]], None]
+
+
+class FileChanges(NamedTuple):
+    added: List[str]
+    removed: List[str]
+    # Every version of the file in the game and mods, the one that is read now and
+    # the objects it defines
+    versions: List[str]
+    live: Optional[str]
+    objects: List[ParsedObject]
+
+
+def by_file(jobs: List[ParseJob]) -> List[FileJobs]:
+    files: Dict[str, FileJobs] = dict()
+    for job in jobs:
+        files.setdefault(job.path, list()).append(job)
+    return list(files.values())
+
+
+def schedule(files: List[FileJobs], workers: int) -> List[List[FileJobs]]:
+    """
+    Split files into at most workers groups with a roughly equal amount of bytes to
+    parse. The largest files are handed out first, each to the least loaded group.
+    """
+    workers = max(1, min(workers, len(files)))
+    groups: List[List[FileJobs]] = [list() for _ in range(workers)]
+    loads = [(0, x) for x in range(workers)]
+    for file_jobs in sorted(files, key=lambda x: x[0].size, reverse=True):
+        load, index = heapq.heappop(loads)
+        groups[index].append(file_jobs)
+        heapq.heappush(loads, (load + file_jobs[0].size, index))
+    return [x for x in groups if x]
+
+
+def find_python(python: str = "") -> Optional[str]:
+    """Get the python interpreter worker processes should be started with"""
+    if python:
+        return python if os.path.exists(python) else shutil.which(python)
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        # Running outside of sublime
+        return sys.executable
+    return shutil.which("python3") or shutil.which("python")
+
+
+LoadedCallback = Callable[[str, "LoadedGameObject"], None]
+
+
+class PathTable:
+    """Files game objects were loaded from, compact objects refer to them by index"""
+
+    def __init__(self):
+        self.paths: List[str] = list()
+        self.indexes: Dict[str, int] = dict()
+        self.lock = threading.Lock()
+
+    def index(self, path: str) -> int:
+        index = self.indexes.get(path)
+        if index is None:
+            with self.lock:
+                index = self.indexes.get(path)
+                if index is None:
+                    index = len(self.paths)
+                    self.paths.append(sys.intern(path))
+                    self.indexes[self.paths[index]] = index
+        return index
+
+
+path_table = PathTable()
+
+
+class CompactScriptObject(PdxScriptObject):
+    """
+    A PdxScriptObject whose attributes are stored in slots. PdxScriptObject has no
+    __slots__, so these objects still have a __dict__, but it is only allocated if
+    something reads it or sets another attribute. The path is stored as an index into
+    path_table. The name isn't interned, it already is the same string as the one in
+    the cached parse results.
+
+    This saves memory in sublime's python 3.8 plugin host, where every plain object
+    allocates its dict. Python 3.11 and later store the attributes of plain objects
+    without a dict as well, so there the records are about the same size.
+    """
+
+    __slots__ = ("key", "file", "line")
+
+    def __init__(self, key: str, path: str, line: int):
+        self.key = key
+        self.file = path_table.index(path)
+        self.line = line
+
+    @property
+    def path(self) -> str:  # type: ignore
+        return path_table.paths[self.file]
+
+
+class LoadedGameObject(GameObjectBase):
+    """A GameObjectBase filled from already parsed objects instead of get_data"""
+
+    def __init__(
+        self,
+        mod_files: List[str],
+        game_files_path: str,
+        records: Iterable[PdxScriptObject],
+    ):
+        super().__init__(mod_files, game_files_path)
+        # name -> the record that defines it, a later file overrides an earlier one.
+        # A changed file is applied to a copy of it, see ObjectLoader.apply_changes
+        self.records: Dict[str, PdxScriptObject] = dict()
+        for record in records:
+            self.main.add(record)
+            self.records[record.key] = record
+
+
+class ObjectLoader:
+    def __init__(
+        self,
+        game_files_path: str,
+        mod_files: List[str],
+        cache: ObjectCache,
+        workers: int = 1,
+        python: Optional[str] = None,
+        vanilla: Optional[VanillaIndex] = None,
+        compact: bool = False,
+    ):
+        """
+        workers is the number of threads or processes files are parsed with,
+        if python is set the workers are processes started with that interpreter.
+        The game files of the types in vanilla are neither scanned nor parsed.
+        With compact the loaded objects are CompactScriptObjects.
+        """
+        self.game_files_path = game_files_path
+        self.mod_files = mod_files
+        self.cache = cache
+        self.workers = workers
+        self.python = python
+        self.vanilla = vanilla
+        self.compact = compact
+        self.stats = LoadStats()
+        LoadStats.latest = self.stats
+        # The files each loaded type was read from, in the order they are read in
+        self.type_paths: Dict[str, List[str]] = dict()
+        # Serializes every change to the cache and type_paths. Loading threads, the
+        # file watcher and saves all reparse files, hold it from the reparse until the
+        # new objects are published so an older reparse can't publish over a newer one
+        self.lock = threading.RLock()
+
+    def source_files(self, type_names: List[str]) -> Dict[str, List[SourceFile]]:
+        """Get the files that define objects of each type with one scan of all roots"""
+        t0 = time.perf_counter()
+        indexed = {x for x in type_names if self.vanilla and self.vanilla.has(x)}
+        scanner = FileScanner([self.game_files_path] + self.mod_files)
+        scanned = scanner.scan(
+            {object_types[x].directory for x in type_names if x not in indexed}
+        )
+        scanned_mods: Dict[str, List[SourceFile]] = dict()
+        if indexed:
+            scanner = FileScanner(self.mod_files)
+            scanned_mods = scanner.scan({object_types[x].directory for x in indexed})
+        self.stats.scan_time += time.perf_counter() - t0
+
+        files = dict()
+        for type_name in type_names:
+            object_type = object_types[type_name]
+            if type_name in indexed:
+                type_files = self.merge_indexed(
+                    type_name, scanned_mods[object_type.directory]
+                )
+            else:
+                type_files = scanned[object_type.directory]
+            files[type_name] = [
+                x
+                for x in type_files
+                if object_type.options.accepts(os.path.basename(x[0]))
+            ]
+            size = sum(x[1] for x in files[type_name])
+            self.cache.set_cost(type_name, size)
+            type_stats = self.stats.get(type_name, object_type.directory)
+            type_stats.files = len(files[type_name])
+            type_stats.bytes = size
+        return files
+
+    def merge_indexed(
+        self, type_name: str, mod_files: List[SourceFile]
+    ) -> List[SourceFile]:
+        """Merge the indexed game files of a type with the mod files overriding them"""
+        files = {
+            relative: (os.path.join(self.game_files_path, relative), size, mtime)
+            for relative, (size, mtime, _) in self.vanilla.types[type_name].items()
+        }
+        for mod_file in mod_files:
+            files[self.relative_path(mod_file[0])] = mod_file
+        return [files[x] for x in sorted(files)]
+
+    def indexed_path(self, type_name: str, path: str) -> Optional[str]:
+        """Get the path of a game file in the vanilla index, None if it isn't indexed"""
+        if self.vanilla is None or not self.vanilla.has(type_name):
+            return None
+        root = self.game_files_path.rstrip("\\/")
+        if not path.startswith(root + os.sep):
+            return None
+        relative = path[len(root) + 1 :]
+        return relative if self.vanilla.contains(type_name, relative) else None
+
+    def vanilla_objects(
+        self, type_name: str, path: str, keep: bool = True
+    ) -> Optional[List[ParsedObject]]:
+        """Get the indexed objects of a game file, None if it isn't indexed"""
+        relative = self.indexed_path(type_name, path)
+        if relative is None:
+            return None
+        return self.vanilla.objects(type_name, relative, keep)  # type: ignore
+
+    def load_cost(self, type_name: str) -> int:
+        """Size of the files the type was last loaded from, or the registry estimate"""
+        cost = self.cache.costs.get(type_name)
+        if cost is None:
+            cost = object_types[type_name].load_cost * 1024
+        return cost
+
+    def by_cost(self, type_names: List[str]) -> List[str]:
+        """Order type_names from cheapest to most expensive to load"""
+        return sorted(type_names, key=self.load_cost)
+
+    def relative_path(self, path: str) -> str:
+        """Get the path of a file relative to the game or mod root it is in"""
+        for root in [self.game_files_path] + self.mod_files:
+            root = root.rstrip("\\/")
+            if path.startswith(root + os.sep):
+                return path[len(root) + 1 :]
+        return ""
+
+    def types_of_file(self, relative: str) -> List[str]:
+        """Get the object types that are loaded from the file at a relative path"""
+        return [
+            type_name
+            for type_name, object_type in object_types.items()
+            if relative.startswith(object_type.directory + os.sep)
+            and object_type.options.accepts(os.path.basename(relative))
+        ]
+
+    def reparse_file(self, path: str) -> Dict[str, FileChanges]:
+        """
+        Parse a single changed or deleted file again without scanning or reading any
+        other file. Only the cache is updated, call apply_changes to get the new game
+        objects of the types that changed.
+
+        Files with the same relative path in the game and mods override each other, so
+        the version of the file in the last root that has it is the one that is read.
+        Deleting a mod file makes the game file it overrode visible again. Indexed game
+        files are read from the vanilla index instead of being parsed.
+        """
+        with self.lock:
+            relative = self.relative_path(path)
+            if not relative:
+                return dict()
+
+            versions = [
+                os.path.join(x, relative)
+                for x in [self.game_files_path] + self.mod_files
+            ]
+            live, stat = None, None
+            for version in reversed(versions):
+                try:
+                    stat = os.stat(version)
+                except OSError:
+                    continue
+                live = version
+                break
+
+            changes = dict()
+            type_names = self.types_of_file(relative)
+            # The live file is parsed once for every type that reads it
+            parsed: Dict[str, List[ParsedObject]] = dict()
+            for type_name in type_names:
+                cached_files = self.cache.types.get(type_name, dict())
+                indexed = self.vanilla_objects(type_name, live) if live else None
+                stale = [
+                    x
+                    for x in versions
+                    if (x != live or indexed is not None) and x in cached_files
+                ]
+                cached = cached_files.get(live) if live and indexed is None else None
+                if not stale and (
+                    indexed is not None
+                    or stat is not None
+                    and cached is not None
+                    and cached[0] == stat.st_size
+                    and cached[1] == stat.st_mtime_ns
+                ):
+                    # Already up to date, for example a save that was also seen by the
+                    # file watcher
+                    continue
+
+                old_versions = stale + ([live] if cached is not None else [])
+                old_names = {
+                    x[0]
+                    for y in old_versions
+                    for x in self.cache.objects(type_name, y) or ()
+                }
+                if not old_versions:
+                    # Nothing was cached, the game file was read from the vanilla index
+                    vanilla = self.vanilla_objects(type_name, versions[0])
+                    old_names = {x[0] for x in vanilla or ()}
+                for version in stale:
+                    self.cache.remove(type_name, version)
+
+                objects: List[ParsedObject] = list()
+                if indexed is not None:
+                    objects = indexed
+                elif live is not None and stat is not None:
+                    if not parsed:
+                        options = [object_types[x].options for x in type_names]
+                        try:
+                            parsed = dict(
+                                zip(type_names, parse_file_together(live, options))
+                            )
+                        except OSError:
+                            continue
+                    objects = parsed[type_name]
+                    self.cache.put(
+                        type_name, live, stat.st_size, stat.st_mtime_ns, objects
+                    )
+
+                names = {x[0] for x in objects}
+                changes[type_name] = FileChanges(
+                    sorted(names - old_names),
+                    sorted(old_names - names),
+                    versions,
+                    live,
+                    objects,
+                )
+
+                if type_name in self.type_paths:
+                    paths = [x for x in self.type_paths[type_name] if x not in versions]
+                    if live is not None:
+                        paths.append(live)
+                        paths.sort(key=self.relative_path)
+                    self.type_paths[type_name] = paths
+            return changes
+
+    def apply_changes(
+        self, type_name: str, game_object: LoadedGameObject, changes: FileChanges
+    ) -> LoadedGameObject:
+        """
+        Create a new game object from a published one with the changes reparse_file
+        found in one file. Only the objects of that file are read, other files of the
+        type are read only for names the file no longer defines, to find the file that
+        defines them now.
+        """
+        record = CompactScriptObject if self.compact else PdxScriptObject
+        records = dict(game_object.records)
+        versions = set(changes.versions)
+        restored = set()
+        for name in changes.removed:
+            current = records.get(name)
+            if current is not None and current.path in versions:
+                del records[name]
+                restored.add(name)
+
+        if changes.live is not None:
+            relative = self.relative_path(changes.live)
+            for name, line in changes.objects:
+                current = records.get(name)
+                # A later file that defines the same name still overrides this one
+                if (
+                    current is None
+                    or current.path in versions
+                    or self.relative_path(current.path) < relative
+                ):
+                    records[name] = record(name, changes.live, line)
+
+        if restored:
+            with self.lock:
+                for path in self.type_paths.get(type_name, ()):
+                    if path in versions:
+                        continue
+                    parsed = self.vanilla_objects(type_name, path, keep=False)
+                    if parsed is None:
+                        parsed = self.cache.objects(type_name, path, keep=False)
+                    for name, line in parsed or ():
+                        if name in restored:
+                            records[name] = record(name, path, line)
+
+        type_stats = self.stats.get(type_name)
+        type_stats.objects += len(records) - len(game_object.records)
+        updated = LoadedGameObject(
+            self.mod_files, self.game_files_path, records.values()
+        )
+        self.stats.set_loaded(type_name, updated)
+        return updated
+
+    def watched_directories(self, game_files: bool = True) -> List[str]:
+        """
+        Get the object directories of the mods, and of the game unless game_files is
+        False. Directories that don't exist yet are included, mods can create them.
+        """
+        directories = {x.directory for x in object_types.values()}
+        roots = self.mod_files
+        if game_files and self.vanilla is None:
+            # With an index the game files only change with a new game version
+            roots = [self.game_files_path] + self.mod_files
+        return [
+            os.path.join(root, directory)
+            for root in roots
+            for directory in sorted(directories)
+        ]
+
+    def load(self, type_name: str) -> LoadedGameObject:
+        return self.load_all([type_name])[type_name]
+
+    def load_all(
+        self, type_names: List[str], on_loaded: Optional[LoadedCallback] = None
+    ) -> Dict[str, LoadedGameObject]:
+        """
+        on_loaded is called with each type as soon as all of its files are parsed,
+        from the thread that parsed its last file. Types that only have cached files
+        are ready before anything is parsed.
+        """
+        files = self.source_files(type_names)
+
+        jobs = list()
+        with self.lock:
+            for type_name, type_files in files.items():
+                self.type_paths[type_name] = [x[0] for x in type_files]
+                # Indexed game files don't need to be cached as well
+                type_files = [
+                    x for x in type_files if self.indexed_path(type_name, x[0]) is None
+                ]
+                self.cache.prune(type_name, [x[0] for x in type_files])
+                for path, size, mtime in type_files:
+                    if not self.cache.has(type_name, path, size, mtime):
+                        jobs.append(ParseJob(type_name, path, size, mtime))
+
+        remaining = Counter(x.type_name for x in jobs)
+        game_objects = dict()
+        lock = threading.Lock()
+
+        def finish(type_name: str):
+            game_object = self.build(type_name)
+            with lock:
+                game_objects[type_name] = game_object
+            if on_loaded is not None:
+                on_loaded(type_name, game_object)
+
+        def on_parsed(job: ParseJob, objects: Optional[List[ParsedObject]]):
+            with self.lock, lock:
+                if objects is not None:
+                    self.cache.put(
+                        job.type_name, job.path, job.size, job.mtime, objects
+                    )
+                remaining[job.type_name] -= 1
+                done = remaining[job.type_name] == 0
+            if done:
+                finish(job.type_name)
+
+        for type_name in files:
+            if not remaining[type_name]:
+                finish(type_name)
+        self.parse(jobs, on_parsed)
+        return game_objects
+
+    def build(self, type_name: str) -> LoadedGameObject:
+        """
+        Create the game object of a type from all of its cached files when it is
+        loaded. Published game objects are never changed, apply_changes creates a new
+        one when a file of the type changes.
+        """
+        record = CompactScriptObject if self.compact else PdxScriptObject
+        records = list()
+        with self.lock:
+            for path in self.type_paths.get(type_name, ()):
+                # Every file of the type is read once, they aren't kept
+                parsed = self.vanilla_objects(type_name, path, keep=False)
+                if parsed is None:
+                    parsed = self.cache.objects(type_name, path, keep=False)
+                if parsed:
+                    records.extend(record(name, path, line) for name, line in parsed)
+        type_stats = self.stats.get(type_name)
+        type_stats.objects = len(records)
+        game_object = LoadedGameObject(self.mod_files, self.game_files_path, records)
+        self.stats.set_loaded(type_name, game_object)
+        return game_object
+
+    def parse(self, jobs: List[ParseJob], on_parsed: ParsedCallback):
+        """Parse jobs, on_parsed gets the objects of each file or None if it failed"""
+        if not jobs:
+            return
+
+        files = by_file(jobs)
+        parse_group = self.parse_in_thread
+        if self.python and sum(x[0].size for x in files) >= min_process_parse_bytes:
+            parse_group = self.parse_in_process
+
+        groups = schedule(files, self.workers)
+        if len(groups) == 1:
+            parse_group(groups[0], 1, on_parsed)
+            return
+
+        with ThreadPoolExecutor(len(groups)) as executor:
+            futures = [
+                executor.submit(parse_group, group, index + 1, on_parsed)
+                for index, group in enumerate(groups)
+            ]
+            for future in futures:
+                future.result()
+
+    def parse_in_thread(
+        self, files: List[FileJobs], worker: int, on_parsed: ParsedCallback
+    ):
+        for file_jobs in files:
+            options = [object_types[x.type_name].options for x in file_jobs]
+            t0 = time.perf_counter()
+            try:
+                parsed = parse_file_together(file_jobs[0].path, options)
+            except OSError:
+                for job in file_jobs:
+                    on_parsed(job, None)
+                continue
+            seconds = (time.perf_counter() - t0) / len(file_jobs)
+            for job, objects in zip(file_jobs, parsed):
+                self.stats.add_parse(job.type_name, seconds, f"thread {worker}")
+                on_parsed(job, objects)
+
+    def parse_in_process(
+        self, files: List[FileJobs], worker: int, on_parsed: ParsedCallback
+    ):
+        data = {
+            "jobs": [
+                [x[0].path, [object_types[y.type_name].options for y in x]]
+                for x in files
+            ]
+        }
+        try:
+            output = subprocess.run(
+                [str(self.python), worker_script, "parse"],
+                input=json.dumps(data).encode(),
+                stdout=subprocess.PIPE,
+                check=True,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            ).stdout
+            parsed = json.loads(output)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            print(f"Victoria 3 parse worker failed, parsing in thread instead: {e}")
+            self.parse_in_thread(files, worker, on_parsed)
+            return
+
+        for file_jobs, (file_objects, seconds) in zip(files, parsed):
+            if file_objects is None:
+                for job in file_jobs:
+                    on_parsed(job, None)
+                continue
+            seconds /= len(file_jobs)
+            for job, objects in zip(file_jobs, file_objects):
+                self.stats.add_parse(job.type_name, seconds, f"process {worker}")
+                on_parsed(job, [tuple(x) for x in objects])  # type: ignore
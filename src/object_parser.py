@@ -0,0 +1,166 @@
+"""
+Block aware parser that finds the game objects defined in a single file.
+
+This module must not import sublime or JominiTools, it only depends on the standard
+library so that it can be used outside of the plugin host.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Kinds of object definitions the parser knows how to find
+BLOCK = "block"  # name = { ... }, { can be on the next line
+VALUE = "value"  # name = <anything>, script values can be plain numbers
+GUI_TYPE = "gui_type"  # type name = widget { ... } inside of a types block
+GUI_TEMPLATE = "gui_template"  # template name { ... }, { can be on the next line
+
+# Kinds whose name can end its line, they are kept if the next line opens a block
+split_kinds = (BLOCK, GUI_TEMPLATE)
+
+# Read definitions at any block depth
+ANY_LEVEL = -1
+
+block_pattern = re.compile(r"\s*([\w.\-]+)\s*=\s*(?:(?:rgb|hsv|hsv360)\s*)?(?:\{|$)")
+value_pattern = re.compile(r"\s*([\w.\-]+)\s*=")
+gui_type_pattern = re.compile(r"\s*type\s+([\w.\-]+)\s*=")
+gui_template_pattern = re.compile(r"\s*template\s+([\w.\-]+)\s*(?:\{|$)")
+string_pattern = re.compile(r'"[^"]*"')
+
+kind_patterns = {
+    BLOCK: block_pattern,
+    VALUE: value_pattern,
+    GUI_TYPE: gui_type_pattern,
+    GUI_TEMPLATE: gui_template_pattern,
+}
+
+ParsedObject = Tuple[str, int]  # (name, line number)
+
+
+class ParseOptions(NamedTuple):
+    kind: str = BLOCK
+    level: int = 0
+    extensions: Tuple[str, ...] = (".txt",)
+    ignored_files: Tuple[str, ...] = ()
+
+    def accepts(self, file_name: str) -> bool:
+        return (
+            file_name.endswith(self.extensions) and file_name not in self.ignored_files
+        )
+
+
+def strip_comment(line: str) -> str:
+    index = line.find("#")
+    if index == -1:
+        return line
+    if '"' not in line[:index]:
+        return line[:index]
+
+    # A '#' inside of a string does not start a comment
+    in_string = False
+    for index, char in enumerate(line):
+        if char == '"':
+            in_string = not in_string
+        elif char == "#" and not in_string:
+            return line[:index]
+    return line
+
+
+def parse_lines(lines: Iterable[str], options: ParseOptions) -> List[ParsedObject]:
+    """Find every object defined at options.level in lines"""
+    pattern = kind_patterns[options.kind]
+    level = options.level
+    split = options.kind in split_kinds
+    objects = []
+    # A definition whose name ended its line, it is kept if the next line opens it
+    waiting: Optional[ParsedObject] = None
+    depth = 0
+
+    for line_number, line in enumerate(lines, start=1):
+        code = strip_comment(line)
+        if not code or code.isspace():
+            continue
+
+        if waiting is not None:
+            if code.lstrip().startswith("{"):
+                objects.append(waiting)
+            waiting = None
+
+        if depth == level or level == ANY_LEVEL:
+            match = pattern.match(code)
+            if match:
+                if split and not match.group(0).endswith("{"):
+                    waiting = (match.group(1), line_number)
+                else:
+                    objects.append((match.group(1), line_number))
+
+        if "{" in code or "}" in code:
+            if '"' in code:
+                code = string_pattern.sub("", code)
+            depth += code.count("{") - code.count("}")
+            if depth < 0:
+                # Malformed file, recover instead of skipping everything after this
+                depth = 0
+
+    return objects
+
+
+def parse_lines_together(
+    lines: Iterable[str], options_list: Sequence[ParseOptions]
+) -> List[List[ParsedObject]]:
+    """
+    Find the objects of every options in options_list with one pass over lines, for
+    types that are defined in the same files like the gui types and templates. Does
+    the same as parse_lines for each options.
+    """
+    if len(options_list) == 1:
+        return [parse_lines(lines, options_list[0])]
+
+    patterns = [kind_patterns[x.kind] for x in options_list]
+    levels = [x.level for x in options_list]
+    splits = [x.kind in split_kinds for x in options_list]
+    results: List[List[ParsedObject]] = [list() for _ in options_list]
+    waiting: List[Optional[ParsedObject]] = [None for _ in options_list]
+    readers = range(len(options_list))
+    depth = 0
+
+    for line_number, line in enumerate(lines, start=1):
+        code = strip_comment(line)
+        if not code or code.isspace():
+            continue
+
+        for index in readers:
+            if waiting[index] is not None:
+                if code.lstrip().startswith("{"):
+                    results[index].append(waiting[index])  # type: ignore
+                waiting[index] = None
+
+            level = levels[index]
+            if depth == level or level == ANY_LEVEL:
+                match = patterns[index].match(code)
+                if match:
+                    parsed = (match.group(1), line_number)
+                    if splits[index] and not match.group(0).endswith("{"):
+                        waiting[index] = parsed
+                    else:
+                        results[index].append(parsed)
+
+        if "{" in code or "}" in code:
+            if '"' in code:
+                code = string_pattern.sub("", code)
+            depth += code.count("{") - code.count("}")
+            if depth < 0:
+                depth = 0
+
+    return results
+
+
+def parse_file(path: str, options: ParseOptions) -> List[ParsedObject]:
+    with open(path, "r", encoding="utf-8-sig", errors="ignore") as file:
+        return parse_lines(file, options)
+
+
+def parse_file_together(
+    path: str, options_list: Sequence[ParseOptions]
+) -> List[List[ParsedObject]]:
+    with open(path, "r", encoding="utf-8-sig", errors="ignore") as file:
+        return parse_lines_together(file, options_list)
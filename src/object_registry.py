@@ -0,0 +1,1145 @@
+"""
+Registry of every game object type the plugin knows about.
+
+Each type is declared once here with where its objects are defined, how to parse them,
+how they are highlighted in the syntax and how completion and hover use them. The
+GameObjectManager, the object loader, the syntax writer and the completion and hover
+tables in game_data.py are all generated from this table.
+
+Adding a new object type:
+1. Add a class for it to v3_objects.py
+2. Add an ObjectType for it below
+
+This module must not import sublime, worker processes import it.
+"""
+
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .object_parser import ANY_LEVEL, GUI_TEMPLATE, GUI_TYPE, VALUE, ParseOptions
+
+# Completion kinds, the names of sublime's KIND_ID_* constants
+FUNCTION = "function"
+MARKUP = "markup"
+NAMESPACE = "namespace"
+NAVIGATION = "navigation"
+SNIPPET = "snippet"
+TYPE = "type"
+VARIABLE = "variable"
+
+Completion = Tuple[str, str, str]  # (kind, letter, description)
+
+gui_extensions = (".gui",)
+
+
+class ObjectType(NamedTuple):
+    name: str
+    class_name: str  # Class in v3_objects.py or jomini_objects
+    directory: str  # Relative to the game and mod roots
+    options: ParseOptions = ParseOptions()
+    syntax: Optional[Tuple[str, str]] = None  # (header, scope) of the syntax section
+    hover: str = ""  # Hover label in script files
+    completion: Optional[Completion] = None  # Completion in script files
+    keywords: Tuple[str, ...] = ()  # Keys whose value is an object of this type
+    scope_prefixes: Tuple[str, ...] = ()  # Prefixes followed by an object of this type
+    data_system_completion: Optional[Completion] = None
+    data_system_functions: Tuple[str, ...] = ()
+    data_system_hover: str = ""
+    auto_complete_field: bool = False
+    # Rough cost of loading the type, in kilobytes of vanilla files to parse. Only
+    # used until the cost has been measured, see ObjectCache.costs
+    load_cost: int = 50
+
+
+def common(directory: str) -> str:
+    return f"common{os.sep}{directory}"
+
+
+# In the order the syntax sections are written in
+type_list: List[ObjectType] = [
+    ObjectType(
+        name="scripted_triggers",
+        class_name="ScriptedTrigger",
+        directory=common("scripted_triggers"),
+        syntax=("Scripted Triggers", "string.scripted.trigger"),
+        hover="Scripted Trigger",
+        load_cost=800,
+    ),
+    ObjectType(
+        name="scripted_effects",
+        class_name="ScriptedEffect",
+        directory=common("scripted_effects"),
+        syntax=("Scripted Effects", "keyword.scripted.effect"),
+        hover="Scripted Effect",
+        load_cost=800,
+    ),
+    ObjectType(
+        name="script_values",
+        class_name="ScriptValue",
+        directory=common("script_values"),
+        options=ParseOptions(VALUE),
+        syntax=("Scripted Values", "storage.type.script.value"),
+        hover="Script Value",
+        data_system_completion=(NAMESPACE, "S", "Script Value"),
+        data_system_functions=("ScriptValue",),
+        data_system_hover="Script Value",
+        load_cost=600,
+    ),
+    ObjectType(
+        name="ai_strats",
+        class_name="AiStrategy",
+        directory=common("ai_strategies"),
+        syntax=("Ai Strategies", "entity.name.ai.strat"),
+        hover="Ai Strategies",
+        completion=(MARKUP, "A", "Ai Strategy"),
+        keywords=("has_strategy", "set_strategy"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="bgs",
+        class_name="BuildingGroup",
+        directory=common("building_groups"),
+        syntax=("Building Groups", "entity.name.bg"),
+        hover="Building Group",
+        completion=(VARIABLE, "B", "Building Group"),
+        keywords=(
+            "force_resource_depletion",
+            "force_resource_discovery",
+            "pop_employment_building_group",
+            "is_building_group",
+            "has_potential_resource",
+            "building_group",
+        ),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="buildings",
+        class_name="Building",
+        directory=common("buildings"),
+        syntax=("Buildings", "entity.name.building"),
+        hover="Building",
+        completion=(VARIABLE, "B", "Building"),
+        keywords=(
+            "start_building_construction",
+            "remove_building",
+            "activate_building",
+            "deactivate_building",
+            "start_privately_funded_building_construction",
+            "building",
+            "building_type",
+            "has_building",
+            "is_building_type",
+            "pop_employment_building",
+            "has_active_building",
+            "set_available_for_autonomous_investment",
+            "unset_available_for_autonomous_investment",
+        ),
+        scope_prefixes=("b:", "bt:"),
+        data_system_completion=(VARIABLE, "B", "Buildings"),
+        data_system_functions=("GetBuildingType",),
+        data_system_hover="Building",
+        auto_complete_field=True,
+        load_cost=500,
+    ),
+    ObjectType(
+        name="char_traits",
+        class_name="CharacterTrait",
+        directory=common("character_traits"),
+        syntax=("Character Traits", "entity.name.character.trait"),
+        hover="Character Trait",
+        completion=(VARIABLE, "C", "Character Trait"),
+        keywords=("add_trait", "remove_trait", "has_trait"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="cultures",
+        class_name="Culture",
+        directory=common("cultures"),
+        syntax=("Cultures", "entity.name.culture"),
+        hover="Culture",
+        completion=(NAMESPACE, "C", "Culture"),
+        keywords=(
+            "has_culture_graphics",
+            "country_has_primary_culture",
+            "has_pop_culture",
+            "is_homeland",
+            "add_homeland",
+            "remove_homeland",
+            "culture",
+        ),
+        scope_prefixes=("cu:",),
+        data_system_completion=(VARIABLE, "C", "Cultures"),
+        data_system_functions=("GetCulture",),
+        data_system_hover="Culture",
+        auto_complete_field=True,
+        load_cost=300,
+    ),
+    ObjectType(
+        name="mods",
+        class_name="Modifier",
+        # The directory Modifier reads, the old manager entry said common/modifiers
+        directory=common("static_modifiers"),
+        options=ParseOptions(
+            ignored_files=("00_code_static_modifiers.txt",),
+        ),
+        syntax=("Modifiers", "entity.name.modifier"),
+        hover="Modifier",
+        completion=(SNIPPET, "M", "Modifier"),
+        keywords=("has_modifier", "remove_modifier"),
+        data_system_completion=(VARIABLE, "M", "Mods"),
+        data_system_functions=("GetStaticModifier",),
+        data_system_hover="Modifier",
+        auto_complete_field=True,
+        load_cost=600,
+    ),
+    ObjectType(
+        name="modifier_types",
+        class_name="ModifierType",
+        # The directory ModifierType reads, the old manager entry said
+        # common/modifier_types
+        directory=common("modifier_type_definitions"),
+        syntax=("Modifier Type", "string.modifier.type"),
+        load_cost=400,
+    ),
+    ObjectType(
+        name="decrees",
+        class_name="Decree",
+        directory=common("decrees"),
+        syntax=("Decrees", "entity.name.decree"),
+        hover="Decree",
+        completion=(MARKUP, "D", "Decree"),
+        keywords=("has_decree",),
+        scope_prefixes=("decree_cost:",),
+        data_system_completion=(VARIABLE, "D", "Decrees"),
+        data_system_functions=("GetDecreeType",),
+        data_system_hover="Decree",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="diplo_actions",
+        class_name="DiplomaticAction",
+        directory=common("diplomatic_actions"),
+        syntax=("Diplomatic Actions", "entity.name.diplo.action"),
+        hover="Diplomatic Action",
+        completion=(SNIPPET, "D", "Diplomatic Action"),
+        keywords=("is_diplomatic_action_type", "has_map_interaction_diplomatic_action"),
+        data_system_completion=(VARIABLE, "D", "Diplo Actions"),
+        data_system_functions=("GetDiplomaticActionType",),
+        data_system_hover="Diplo_Action",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="diplo_plays",
+        class_name="DiplomaticPlay",
+        directory=common("diplomatic_plays"),
+        syntax=("Diplomatic Plays", "entity.name.diplo.play"),
+        hover="Diplomatic Play",
+        completion=(SNIPPET, "D", "Diplomatic Play"),
+        keywords=("is_diplomatic_play_type",),
+        scope_prefixes=("play_type:",),
+        data_system_completion=(VARIABLE, "D", "Diplo Plays"),
+        data_system_functions=("GetDiplomaticPlayType",),
+        data_system_hover="Diplo Play",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="game_rules",
+        class_name="GameRules",
+        directory=common("game_rules"),
+        syntax=("Game Rules", "entity.name.game.rule"),
+        hover="Game Rule",
+        completion=(FUNCTION, "G", "Game Rule"),
+        keywords=("has_game_rule",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="goods",
+        class_name="Goods",
+        directory=common("goods"),
+        syntax=("Trade Goods", "entity.name.trade.good"),
+        hover="Trade Good",
+        completion=(NAMESPACE, "G", "Trade Good"),
+        keywords=(
+            "add_cultural_obsession",
+            "remove_cultural_obsession",
+            "is_taxing_goods",
+            "has_cultural_obsession",
+            "is_banning_goods",
+        ),
+        scope_prefixes=("goods:", "g:"),
+        data_system_completion=(VARIABLE, "G", "Goods"),
+        data_system_functions=("GetGoods",),
+        data_system_hover="Goods",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="gov_types",
+        class_name="GovernmentType",
+        directory=common("government_types"),
+        syntax=("Gov Types", "entity.name.gov.type"),
+        hover="Government Type",
+        completion=(SNIPPET, "G", "Government Type"),
+        keywords=("has_government_type",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="ideologies",
+        class_name="Ideology",
+        directory=common("ideologies"),
+        syntax=("Ideologies", "entity.name.ideology"),
+        hover="Ideology",
+        completion=(NAVIGATION, "I", "Ideology"),
+        keywords=("add_ideology", "remove_ideology", "ideology"),
+        scope_prefixes=("ideology:",),
+        data_system_completion=(VARIABLE, "I", "Ideologies"),
+        data_system_functions=("GetIdeology",),
+        data_system_hover="Ideology",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="institutions",
+        class_name="Institutions",
+        directory=common("institutions"),
+        syntax=("Institutions", "entity.name.institution"),
+        hover="Institution",
+        completion=(NAVIGATION, "I", "Institution"),
+        keywords=("expanding_institution", "has_institution", "institution"),
+        scope_prefixes=("institution:",),
+        data_system_completion=(VARIABLE, "I", "Institutions"),
+        data_system_functions=("GetInstitutionType",),
+        data_system_hover="Institution",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="ig_traits",
+        class_name="InterestGroupTrait",
+        directory=common("interest_group_traits"),
+        syntax=("Ig Traits", "entity.name.ig.trait"),
+        hover="Group Traits",
+    ),
+    ObjectType(
+        name="igs",
+        class_name="InterestGroup",
+        directory=common("interest_groups"),
+        syntax=("Interest Groups", "entity.name.interest.group"),
+        hover="Interest Group",
+        completion=(MARKUP, "I", "Interest Group"),
+        keywords=(
+            "has_ruling_interest_group",
+            "is_interest_group_type",
+            "law_approved_by",
+            "interest_group",
+        ),
+        scope_prefixes=("ig:", "interest_group:"),
+        data_system_completion=(VARIABLE, "I", "Name"),
+        data_system_functions=("GetInterestGroupVariant",),
+        data_system_hover="Interest Group",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="jes",
+        class_name="JournalEntry",
+        directory=common("journal_entries"),
+        syntax=("Journal Entries", "entity.name.journal.entry"),
+        hover="Journal Entry",
+        completion=(TYPE, "J", "Journal Entry"),
+        keywords=("has_journal_entry",),
+        scope_prefixes=("je:",),
+        auto_complete_field=True,
+        load_cost=1500,
+    ),
+    ObjectType(
+        name="law_groups",
+        class_name="LawGroup",
+        directory=common("law_groups"),
+        syntax=("Law Groups", "entity.name.law.group"),
+        hover="Law Group",
+        completion=(VARIABLE, "L", "Law Group"),
+        scope_prefixes=("active_law:",),
+        data_system_completion=(VARIABLE, "L", "Law Groups"),
+        data_system_functions=("GetLawGroup",),
+        data_system_hover="Law Group",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="laws",
+        class_name="Law",
+        directory=common("laws"),
+        syntax=("Laws", "entity.name.law"),
+        hover="Law",
+        completion=(VARIABLE, "L", "Law"),
+        scope_prefixes=("law_type:",),
+        data_system_completion=(VARIABLE, "L", "Laws"),
+        data_system_functions=("GetLawType",),
+        data_system_hover="Law",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="mobilization_options",
+        class_name="MobilizationOption",
+        directory=common("mobilization_options"),
+        syntax=("Mobilization Options", "entity.name.mobilization.option"),
+        hover="Mobilization Options",
+        completion=(VARIABLE, "M", "Mobilization Options"),
+        scope_prefixes=("mobilization_option:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="parties",
+        class_name="Party",
+        directory=common("parties"),
+        syntax=("Parties", "entity.name.party"),
+        hover="Party",
+        completion=(TYPE, "P", "Political Party"),
+        keywords=("is_party_type",),
+        scope_prefixes=("py:", "party:"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="pop_needs",
+        class_name="PopNeed",
+        directory=common("pop_needs"),
+        syntax=("Pop Needs", "entity.name.pop.need"),
+        hover="Pop Need",
+    ),
+    ObjectType(
+        name="pop_types",
+        class_name="PopType",
+        directory=common("pop_types"),
+        syntax=("Pop Types", "entity.name.pop.type"),
+        hover="Pop Type",
+        completion=(VARIABLE, "P", "Pop Type"),
+        keywords=("is_pop_type", "pop_type"),
+        scope_prefixes=("pop_type:",),
+        data_system_completion=(VARIABLE, "P", "Pop Types"),
+        data_system_functions=("GetPopType",),
+        data_system_hover="Pop Type",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="pm_groups",
+        class_name="ProductionMethodGroup",
+        directory=common("production_method_groups"),
+        syntax=("Production Method Groups", "entity.name.pm.groups"),
+        hover="Method Group",
+    ),
+    ObjectType(
+        name="pms",
+        class_name="ProductionMethod",
+        directory=common("production_methods"),
+        syntax=("Production Methods", "entity.name.pm"),
+        hover="Production Method",
+        completion=(NAVIGATION, "P", "Production Method"),
+        keywords=("has_active_production_method", "production_method"),
+        auto_complete_field=True,
+        load_cost=700,
+    ),
+    ObjectType(
+        name="religions",
+        class_name="Religion",
+        directory=common("religions"),
+        syntax=("Religions", "entity.name.religion"),
+        hover="Religion",
+        completion=(NAMESPACE, "R", "Religion"),
+        keywords=("has_pop_religion", "religion"),
+        scope_prefixes=("rel:", "religion:"),
+        data_system_completion=(VARIABLE, "R", "Religions"),
+        data_system_functions=("GetReligion",),
+        data_system_hover="Religion",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="state_traits",
+        class_name="StateTrait",
+        directory=common("state_traits"),
+        syntax=("State Traits", "entity.name.state.trait"),
+        hover="State Trait",
+        completion=(VARIABLE, "S", "State Trait"),
+        keywords=("has_state_trait", "remove_state_trait", "add_state_trait"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="strategic_regions",
+        class_name="StrategicRegion",
+        directory=common("strategic_regions"),
+        syntax=("Strategic Regions", "entity.name.strategic.region"),
+        hover="Strategic Region",
+        completion=(SNIPPET, "S", "Strategic Region"),
+        keywords=("add_declared_interest", "has_interest_marker_in_region", "hq"),
+        scope_prefixes=("sr:",),
+        auto_complete_field=True,
+        load_cost=100,
+    ),
+    ObjectType(
+        name="subject_types",
+        class_name="SubjectType",
+        directory=common("subject_types"),
+        syntax=("Subject Types", "entity.name.subject.type"),
+        hover="Subject Types",
+        completion=(TYPE, "S", "Subject Type"),
+        keywords=("is_subject_type", "change_subject_type"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="technologies",
+        class_name="Technology",
+        directory=common("technology"),
+        syntax=("Technologies", "entity.name.tech"),
+        hover="Technology",
+        completion=(VARIABLE, "T", "Technology"),
+        keywords=(
+            "technology",
+            "add_technology_researched",
+            "can_research",
+            "has_technology_progress",
+            "has_technology_researched",
+            "is_researching_technology",
+            "is_researching_technology_category",
+        ),
+        auto_complete_field=True,
+        load_cost=400,
+    ),
+    ObjectType(
+        name="terrains",
+        class_name="Terrain",
+        directory=common("terrain"),
+        syntax=("Terrains", "entity.name.terrain"),
+        hover="Terrain",
+        completion=(NAVIGATION, "T", "Terrain"),
+        keywords=("has_terrain",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="state_regions",
+        class_name="StateRegion",
+        directory=f"map_data{os.sep}state_regions",
+        syntax=("State Regions", "entity.name.state.region"),
+        hover="State Region",
+        completion=(NAMESPACE, "S", "State Region"),
+        keywords=(
+            "set_capital",
+            "set_market_capital",
+            "country_or_subject_owns_entire_state_region",
+            "has_state_in_state_region",
+            "owns_entire_state_region",
+            "owns_treaty_port_in",
+        ),
+        scope_prefixes=("s:",),
+        auto_complete_field=True,
+        load_cost=2000,
+    ),
+    ObjectType(
+        name="countries",
+        class_name="Country",
+        directory=common("country_definitions"),
+        syntax=("Countries", "entity.name.countries"),
+        hover="Country",
+        completion=(NAMESPACE, "C", "Country"),
+        scope_prefixes=("c:",),
+        auto_complete_field=True,
+        load_cost=300,
+    ),
+    ObjectType(
+        name="country_ranks",
+        class_name="CountryRank",
+        directory=common("country_ranks"),
+        syntax=("Country Ranks", "entity.name.country.ranks"),
+        hover="Country Rank",
+        completion=(NAMESPACE, "C", "Country Ranks"),
+        scope_prefixes=("rank_value:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="country_types",
+        class_name="CountryType",
+        directory=common("country_types"),
+        syntax=("Country Types", "entity.name.country.types"),
+        hover="Country Type",
+        completion=(NAMESPACE, "C", "Country Types"),
+        keywords=("is_country_type", "country_type"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="culture_graphics",
+        class_name="CultureGraphics",
+        directory=common("culture_graphics"),
+        syntax=("Culture Graphics", "entity.name.culture.graphics"),
+        hover="Culture Graphic",
+        completion=(NAMESPACE, "C", "Culture Graphics"),
+        keywords=("has_culture_graphics", "graphics"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="named_colors",
+        class_name="NamedColor",
+        directory=common("named_colors"),
+        options=ParseOptions(level=1),
+        syntax=("Named Colors", "entity.name.named.colors"),
+        hover="Named Color",
+        completion=(VARIABLE, "C", "Named Color"),
+        keywords=("color", "color1", "color2", "color3", "color4", "color5"),
+        auto_complete_field=True,
+        load_cost=100,
+    ),
+    ObjectType(
+        name="battle_conditions",
+        class_name="BattleCondition",
+        directory=common("battle_conditions"),
+        syntax=("Battle Conditions", "entity.name.battle.conditions"),
+        hover="Battle Condition",
+        completion=(VARIABLE, "B", "Battle Condition"),
+        keywords=("commander_rank",),
+        data_system_completion=(VARIABLE, "B", "Battle Conditions"),
+        data_system_functions=("GetBattleCondition",),
+        data_system_hover="Battle Condition",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="commander_ranks",
+        class_name="CommanderRank",
+        directory=common("commander_ranks"),
+        syntax=("Commander Ranks", "entity.name.commander.ranks"),
+        hover="Commander Rank",
+        completion=(VARIABLE, "C", "Commander Rank"),
+        keywords=("has_commander_order",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="commander_orders",
+        class_name="CommanderOrder",
+        directory=common("commander_orders"),
+        syntax=("Commander Orders", "entity.name.commander.orders"),
+        hover="Commander Order",
+        completion=(VARIABLE, "C", "Commander Order"),
+        keywords=("has_battle_condition",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="proposal_types",
+        class_name="ProposalType",
+        directory=common("proposal_types"),
+        syntax=("Proposal Types", "entity.name.proposal.type"),
+        hover="Proposal Type",
+        completion=(VARIABLE, "P", "Proposal Type"),
+        keywords=("post_proposal",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="companies",
+        class_name="CompanyType",
+        directory=common("company_types"),
+        syntax=("Companies", "entity.name.company"),
+        hover="Company",
+        completion=(VARIABLE, "C", "Company"),
+        scope_prefixes=("company_type:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="discrimination_traits",
+        class_name="DiscriminationTrait",
+        directory=common("discrimination_traits"),
+        syntax=("Discrimination Traits", "entity.name.discrimination.trait"),
+        hover="Discrimination Trait",
+        completion=(VARIABLE, "D", "Discrimination Traits"),
+        keywords=("has_discrimination_trait",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="combat_unit_group",
+        class_name="CombatUnitGroup",
+        directory=common("combat_unit_groups"),
+        syntax=("Combat Unit Group", "entity.name.combat.unit.group"),
+        hover="Combat Unit Group",
+        data_system_completion=(VARIABLE, "C", "Combat Unit Group"),
+        data_system_functions=("GetCombatUnitGroup",),
+        data_system_hover="Combat Unit Group",
+    ),
+    ObjectType(
+        name="combat_unit_type",
+        class_name="CombatUnitType",
+        directory=common("combat_unit_types"),
+        syntax=("Combat Unit Type", "entity.name.combat.unit.type"),
+        hover="Combat Unit Type",
+        completion=(NAMESPACE, "C", "Combat Unit Type"),
+        scope_prefixes=("unit_type:",),
+        data_system_completion=(VARIABLE, "C", "Combat Unit Type"),
+        data_system_functions=("GetCombatUnitType",),
+        data_system_hover="Combat Unit Type",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="scripted_gui",
+        class_name="ScriptedGui",
+        directory=common("scripted_guis"),
+        syntax=("Scripted Gui", "entity.name.scripted.gui"),
+        data_system_completion=(VARIABLE, "S", "Scripted Gui"),
+        data_system_functions=("GetScriptedGui",),
+        data_system_hover="Scripted Gui",
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="custom_loc",
+        class_name="CustomLoc",
+        directory=common("customizable_localization"),
+        options=ParseOptions(
+            ignored_files=(
+                "99_ru_custom_loc.txt",
+                "99_de_custom_loc.txt",
+                "99_pl_custom_loc.txt",
+                "99_fr_custom_loc.txt",
+                "99_es_custom_loc.txt",
+                "99_br_custom_loc.txt",
+            ),
+        ),
+        syntax=("Customizable Localization", "entity.name.custom.loc"),
+        data_system_completion=(VARIABLE, "C", "Customizable Localization"),
+        data_system_functions=("Custom", "GetCustom"),
+        data_system_hover="Customizable Localization",
+        auto_complete_field=True,
+        load_cost=300,
+    ),
+    ObjectType(
+        name="alert_group",
+        class_name="AlertGroup",
+        directory=common("alert_groups"),
+        syntax=("Alert Group", "entity.name.alert.group"),
+        hover="Alert Group",
+        completion=(MARKUP, "A", "Alert Group"),
+        keywords=("alert_group", "canal"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="canals",
+        class_name="Canal",
+        directory=common("canals"),
+        syntax=("Canal", "entity.name.canal"),
+        hover="Canal",
+        completion=(MARKUP, "C", "Canal"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="char_template",
+        class_name="CharacterTemplate",
+        directory=common("character_templates"),
+        syntax=("Character Template", "entity.name.char.template"),
+        hover="Character Template",
+        completion=(MARKUP, "C", "Character Template"),
+        keywords=("template", "has_template"),
+        auto_complete_field=True,
+        load_cost=600,
+    ),
+    ObjectType(
+        name="diplo_cat",
+        class_name="DiplomaticCatalyst",
+        directory=common("diplomatic_catalysts"),
+        syntax=("Diplomatic Catalyst", "entity.name.diplo.catalyst"),
+        hover="Diplomatic Catalyst",
+        completion=(VARIABLE, "D", "Diplomatic Catalyst"),
+        keywords=("is_diplomatic_catalyst_type",),
+        scope_prefixes=("catalyst_type:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="terrain_label",
+        class_name="TerrainLabel",
+        directory=common("labels"),
+        syntax=("Terrain Label", "entity.name.terrain.label"),
+        hover="Terrain Label",
+        completion=(VARIABLE, "T", "Terrain Label"),
+        keywords=("label", "has_label"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="messages",
+        class_name="Message",
+        directory=common("messages"),
+        syntax=("Messages", "entity.name.message"),
+        hover="Message",
+        completion=(VARIABLE, "M", "Message"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="objectives",
+        class_name="Objective",
+        directory=common("objectives"),
+        syntax=("Objectives", "entity.name.objective"),
+        hover="Objective",
+        completion=(VARIABLE, "O", "Objectives"),
+        keywords=("has_objective",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="objective_subgoal",
+        class_name="ObjectiveSubgoal",
+        directory=common("objective_subgoals"),
+        syntax=("Objective Subgoal", "entity.name.objective.subgoal"),
+        hover="Objective Subgoal",
+        completion=(VARIABLE, "O", "Objective Subgoal"),
+        keywords=(
+            "remove_active_objective_subgoal",
+            "objective_subgoal",
+            "has_completed_subgoal",
+            "final_subgoal",
+        ),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="political_lobby",
+        class_name="PoliticalLobby",
+        directory=common("political_lobbies"),
+        syntax=("Political Lobby", "entity.name.political.lobby"),
+        hover="Political Lobby",
+        completion=(VARIABLE, "P", "Political Lobby"),
+        keywords=("swap_type_on_failed", "is_political_lobby_type"),
+        scope_prefixes=("lobby_type:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="political_lobby_appeasement",
+        class_name="PoliticalLobbyAppeasement",
+        directory=common("political_lobby_appeasement"),
+        syntax=(
+            "Political Lobby Appeasement",
+            "entity.name.political.lobby.appeasement",
+        ),
+        hover="Political Lobby Appeasement",
+        completion=(VARIABLE, "P", "Political Lobby Appeasement"),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="pb_identity",
+        class_name="PowerBlocIdentity",
+        directory=common("power_bloc_identities"),
+        syntax=("Power Block Identity", "entity.name.power.bloc.identiy"),
+        hover="Power Bloc Identity",
+        completion=(VARIABLE, "P", "Power Bloc Indentity"),
+        keywords=(
+            "primary_for_identity",
+            "unlocking_identity",
+            "blocking_identity",
+            "identity",
+        ),
+        scope_prefixes=("identity:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="pb_principle_group",
+        class_name="PowerBlocPrincipleGroup",
+        directory=common("power_bloc_principle_groups"),
+        syntax=(
+            "Power Block Principle Group",
+            "entity.name.power.bloc.principle.group",
+        ),
+        hover="Power Bloc Principle Group",
+        completion=(VARIABLE, "P", "Power Bloc Principle Group"),
+        scope_prefixes=("principle_group:",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="pb_principle",
+        class_name="PowerBlocPrinciple",
+        directory=common("power_bloc_principles"),
+        syntax=("Power Block Principle", "entity.name.power.bloc.principle"),
+        hover="Power Bloc Principle",
+        completion=(VARIABLE, "P", "Power Bloc Principle"),
+        keywords=("principle", "add_principle"),
+        scope_prefixes=("principle:", "scripted_bar_progress("),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="scripted_progress_bar",
+        class_name="ScriptedProgressBar",
+        directory=common("scripted_progress_bars"),
+        syntax=("Scripted Progress Bars", "entity.name.scripted.progress.bar"),
+        hover="Scripted Progress Bar",
+        completion=(VARIABLE, "S", "Scripted Progress Bar"),
+        keywords=("scripted_progress_bar",),
+        auto_complete_field=True,
+    ),
+    ObjectType(
+        name="gui_templates",
+        class_name="GuiTemplate",
+        directory="gui",
+        options=ParseOptions(GUI_TEMPLATE, ANY_LEVEL, gui_extensions),
+        load_cost=5000,
+    ),
+    ObjectType(
+        name="gui_types",
+        class_name="GuiType",
+        directory="gui",
+        options=ParseOptions(GUI_TYPE, 1, gui_extensions),
+        load_cost=5000,
+    ),
+    ObjectType(
+        name="scripted_modifiers",
+        class_name="ScriptedModifier",
+        directory=common("scripted_modifiers"),
+        hover="Scripted Modifer",
+    ),
+]
+
+object_types: Dict[str, ObjectType] = {x.name: x for x in type_list}
+
+
+# Completion and hover go through the types in these orders and use the first type that
+# has a name, so names that several types share resolve the way they did in the hand
+# written tables the registry replaced. Types that aren't listed come after the listed
+# ones, in the order of type_list.
+
+# Completion of the values of keywords
+keyword_order: Tuple[str, ...] = (
+    "ai_strats",
+    "buildings",
+    "bgs",
+    "char_traits",
+    "cultures",
+    "decrees",
+    "diplo_actions",
+    "diplo_cat",
+    "diplo_plays",
+    "game_rules",
+    "goods",
+    "gov_types",
+    "ideologies",
+    "institutions",
+    "igs",
+    "jes",
+    "mods",
+    "parties",
+    "pop_types",
+    "pms",
+    "religions",
+    "state_traits",
+    "strategic_regions",
+    "subject_types",
+    "technologies",
+    "terrains",
+    "state_regions",
+    "country_types",
+    "culture_graphics",
+    "named_colors",
+    "battle_conditions",
+    "commander_ranks",
+    "commander_orders",
+    "proposal_types",
+    "discrimination_traits",
+    "alert_group",
+    "char_template",
+    "terrain_label",
+    "objectives",
+    "objective_subgoal",
+    "political_lobby",
+    "pb_identity",
+    "pb_principle",
+    "scripted_progress_bar",
+)
+
+# Completion after scope prefixes like b: and cu:
+scope_prefix_order: Tuple[str, ...] = (
+    "buildings",
+    "cultures",
+    "decrees",
+    "goods",
+    "institutions",
+    "igs",
+    "ideologies",
+    "jes",
+    "law_groups",
+    "laws",
+    "parties",
+    "pop_types",
+    "religions",
+    "strategic_regions",
+    "state_regions",
+    "countries",
+    "combat_unit_type",
+    "country_ranks",
+    "companies",
+    "mobilization_options",
+    "diplo_cat",
+    "diplo_plays",
+    "political_lobby",
+    "pb_identity",
+    "pb_principle_group",
+    "pb_principle",
+)
+
+# Completion and functions in gui and localization files
+data_system_completion_order: Tuple[str, ...] = (
+    "battle_conditions",
+    "buildings",
+    "combat_unit_group",
+    "combat_unit_type",
+    "cultures",
+    "decrees",
+    "diplo_actions",
+    "diplo_plays",
+    "goods",
+    "ideologies",
+    "institutions",
+    "igs",
+    "law_groups",
+    "laws",
+    "pop_types",
+    "religions",
+    "mods",
+    "custom_loc",
+    "scripted_gui",
+    "script_values",
+)
+
+# Completion in script files
+completion_order: Tuple[str, ...] = (
+    "ai_strats",
+    "alert_group",
+    "buildings",
+    "bgs",
+    "canals",
+    "char_template",
+    "char_traits",
+    "cultures",
+    "decrees",
+    "diplo_actions",
+    "diplo_plays",
+    "game_rules",
+    "goods",
+    "gov_types",
+    "ideologies",
+    "institutions",
+    "igs",
+    "jes",
+    "law_groups",
+    "mobilization_options",
+    "laws",
+    "mods",
+    "parties",
+    "pop_types",
+    "pms",
+    "religions",
+    "state_traits",
+    "strategic_regions",
+    "subject_types",
+    "technologies",
+    "terrains",
+    "state_regions",
+    "countries",
+    "country_ranks",
+    "country_types",
+    "culture_graphics",
+    "named_colors",
+    "battle_conditions",
+    "commander_ranks",
+    "commander_orders",
+    "combat_unit_type",
+    "proposal_types",
+    "companies",
+    "diplo_cat",
+    "discrimination_traits",
+    "terrain_label",
+    "messages",
+    "objectives",
+    "objective_subgoal",
+    "political_lobby",
+    "political_lobby_appeasement",
+    "pb_identity",
+    "pb_principle_group",
+    "pb_principle",
+    "scripted_progress_bar",
+)
+
+# Hover in script files
+hover_order: Tuple[str, ...] = (
+    "ai_strats",
+    "alert_group",
+    "bgs",
+    "buildings",
+    "canals",
+    "char_traits",
+    "cultures",
+    "decrees",
+    "diplo_actions",
+    "diplo_plays",
+    "game_rules",
+    "goods",
+    "gov_types",
+    "ideologies",
+    "institutions",
+    "ig_traits",
+    "igs",
+    "jes",
+    "law_groups",
+    "laws",
+    "mods",
+    "parties",
+    "pop_needs",
+    "pop_types",
+    "pm_groups",
+    "pms",
+    "religions",
+    "script_values",
+    "scripted_effects",
+    "scripted_modifiers",
+    "scripted_triggers",
+    "state_traits",
+    "strategic_regions",
+    "subject_types",
+    "technologies",
+    "terrains",
+    "state_regions",
+    "countries",
+    "country_ranks",
+    "companies",
+    "country_types",
+    "culture_graphics",
+    "named_colors",
+    "battle_conditions",
+    "commander_ranks",
+    "commander_orders",
+    "proposal_types",
+    "discrimination_traits",
+    "combat_unit_group",
+    "combat_unit_type",
+    "mobilization_options",
+    "char_template",
+    "diplo_cat",
+    "terrain_label",
+    "messages",
+    "objectives",
+    "objective_subgoal",
+    "political_lobby",
+    "political_lobby_appeasement",
+    "pb_identity",
+    "pb_principle_group",
+    "pb_principle",
+    "scripted_progress_bar",
+)
+
+# Hover in gui and localization files
+data_system_hover_order: Tuple[str, ...] = (
+    "battle_conditions",
+    "buildings",
+    "combat_unit_group",
+    "combat_unit_type",
+    "cultures",
+    "custom_loc",
+    "decrees",
+    "diplo_actions",
+    "diplo_plays",
+    "goods",
+    "ideologies",
+    "institutions",
+    "igs",
+    "law_groups",
+    "laws",
+    "scripted_gui",
+    "pop_types",
+    "religions",
+    "mods",
+    "script_values",
+)
+
+
+def ordered(order: Sequence[str]) -> List[ObjectType]:
+    """Every type, those in order first and in that order, the rest as registered"""
+    rank = {x: index for index, x in enumerate(order)}
+    return sorted(type_list, key=lambda x: rank.get(x.name, len(rank)))
@@ -0,0 +1,95 @@
+"""
+Copy-on-write store for the loaded game objects.
+
+Readers never take a lock: every lookup goes through the current snapshot, an
+immutable mapping that is replaced as a whole. Writers build the game objects that
+changed off to the side and publish them together as a new snapshot, so a reader
+either sees all of a reload or none of it. Game objects are never mutated once they
+are published.
+
+The store also knows every type that will be published, so while objects are still
+loading features can use the types that are ready and treat the rest as pending.
+"""
+
+import threading
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional
+
+
+class Snapshot(NamedTuple):
+    version: int
+    objects: Mapping[str, Any]  # type name -> GameObjectBase
+
+
+class ObjectStore(MutableMapping):
+    def __init__(
+        self,
+        objects: Mapping[str, Any] = MappingProxyType({}),
+        type_names: Iterable[str] = (),
+    ):
+        """type_names are all types that will be published, by default objects' types"""
+        self.current = Snapshot(0, MappingProxyType(dict(objects)))
+        self.type_names = list(type_names) or list(objects)
+        self.write_lock = threading.Lock()
+
+    def snapshot(self) -> Snapshot:
+        """Get the current snapshot, it stays consistent while it is used"""
+        return self.current
+
+    def publish(self, changes: Mapping[str, Any]) -> Snapshot:
+        """Replace the current snapshot with one that also holds changes"""
+        if not changes:
+            return self.current
+        with self.write_lock:
+            objects = dict(self.current.objects)
+            objects.update(changes)
+            # A single attribute assignment, readers see the old or the new snapshot
+            self.current = Snapshot(self.current.version + 1, MappingProxyType(objects))
+            return self.current
+
+    def is_loaded(self, type_name: str) -> bool:
+        return type_name in self.current.objects
+
+    def readiness(self) -> Dict[str, bool]:
+        objects = self.current.objects
+        return {x: x in objects for x in self.type_names}
+
+    def pending(self) -> List[str]:
+        objects = self.current.objects
+        return [x for x in self.type_names if x not in objects]
+
+    def ready(self, type_name: str) -> Optional[Any]:
+        """Get a type without waiting for it, None while it is still pending"""
+        game_object = self.current.objects.get(type_name)
+        if game_object is None:
+            self.request(type_name)
+        return game_object
+
+    def request(self, type_name: str):
+        """Ask for a pending type to be loaded as soon as possible"""
+
+    def __getitem__(self, type_name: str):
+        return self.current.objects[type_name]
+
+    def __setitem__(self, type_name: str, game_object):
+        self.publish({type_name: game_object})
+
+    def __delitem__(self, type_name: str):
+        with self.write_lock:
+            objects = dict(self.current.objects)
+            del objects[type_name]
+            self.current = Snapshot(self.current.version + 1, MappingProxyType(objects))
+
+    def update(self, other=(), **kwargs):  # type: ignore
+        changes: Dict[str, Any] = dict(other, **kwargs)
+        self.publish(changes)
+
+    def __contains__(self, type_name) -> bool:
+        return type_name in self.current.objects
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.current.objects)
+
+    def __len__(self) -> int:
+        return len(self.current.objects)
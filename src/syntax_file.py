@@ -0,0 +1,138 @@
+"""
+Writing of the plugin's part of the script syntax from the names of the game objects.
+
+The plugin's part of the syntax is made of one section per object type and dynamic
+modifier group. A hash of the objects in each section is kept next to the object
+cache, so a section is only generated again when its objects changed, and nothing is
+read or written when no section changed.
+
+This module must not import sublime or JominiTools, the syntax can be written by a
+worker process.
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Mapping, Optional, Sequence
+
+from .dynamic_modifiers import modifier_sections, referenced_types
+from .object_registry import object_types
+from .syntax_patterns import SyntaxSection
+
+# Bump this whenever the format of the state or the output of SyntaxSection changes
+SYNTAX_STATE_VERSION = 3
+
+# Object names by type
+ObjectNames = Mapping[str, Sequence[str]]
+
+
+def syntax_types() -> List[str]:
+    """The object types whose names are used in the syntax"""
+    types = [x.name for x in object_types.values() if x.syntax is not None]
+    return types + [x for x in referenced_types() if x not in types]
+
+
+def syntax_sections(objects: ObjectNames) -> List[SyntaxSection]:
+    """Get the sections the plugin adds to the syntax, in the order they are written"""
+    sections = list()
+    for object_type in object_types.values():
+        if object_type.syntax is not None:
+            header, scope = object_type.syntax
+            sections.append(SyntaxSection(header, scope, objects[object_type.name]))
+    return sections + modifier_sections(objects)
+
+
+def file_stamp(path: str) -> Optional[list]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_syntax_state(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return dict()
+    return state if state.get("version") == SYNTAX_STATE_VERSION else dict()
+
+
+def write_atomic(path: str, text: str):
+    """Write through a temporary file so the file is never seen half written"""
+    temp_path = path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_path, path)
+
+
+def write_syntax_file(
+    objects: ObjectNames,
+    fake_syntax_path: str,
+    real_syntax_path: str,
+    state_path: str,
+    superseded: Callable[[], bool] = lambda: False,
+) -> bool:
+    """
+    Write the syntax for objects if it changed, returns whether it was written.
+    superseded is checked before writing, a write that is no longer wanted stops.
+    """
+    sections = syntax_sections(objects)
+    digests = [x.digest() for x in sections]
+    state = load_syntax_state(state_path)
+    fake_stamp = file_stamp(fake_syntax_path)
+    real_stamp = file_stamp(real_syntax_path)
+    unchanged = (
+        real_stamp is not None
+        and state.get("fake") == fake_stamp
+        and state.get("real") == real_stamp
+    )
+    if unchanged and state.get("digests") == digests:
+        # The syntax file is still the one that was written for these objects
+        return False
+
+    with open(fake_syntax_path, "r") as file:
+        fake_lines = file.read()
+
+    old_texts: Dict[str, str] = state.get("texts", dict())
+    old_digests = dict(zip(state.get("headers", ()), state.get("digests", ())))
+    if unchanged:
+        # The syntax file is what was written last time, no need to read it back
+        real_lines: Optional[str] = fake_lines + "".join(
+            old_texts[x] for x in state["headers"]
+        )
+    else:
+        try:
+            with open(real_syntax_path, "r") as file:
+                real_lines = file.read()
+        except OSError:
+            real_lines = None
+
+    # Sections whose objects didn't change are reused as they were written
+    texts = dict()
+    for section, digest in zip(sections, digests):
+        if old_digests.get(section.header) == digest and section.header in old_texts:
+            texts[section.header] = old_texts[section.header]
+        else:
+            texts[section.header] = section.text()
+
+    # Append all other matches to auto-generated-content section
+    lines = fake_lines + "".join(texts[x.header] for x in sections)
+
+    if superseded():
+        return False
+    written = real_lines != lines
+    if written:
+        write_atomic(real_syntax_path, lines)
+
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    state = {
+        "version": SYNTAX_STATE_VERSION,
+        "fake": fake_stamp,
+        "real": file_stamp(real_syntax_path),
+        "headers": [x.header for x in sections],
+        "digests": digests,
+        "texts": texts,
+    }
+    write_atomic(state_path, json.dumps(state, separators=(",", ":")))
+    return written
@@ -0,0 +1,141 @@
+"""
+Keyword patterns of the generated syntax sections.
+
+A flat alternation of thousands of keywords is tried one keyword after the other at
+every word of every line. The keywords are compiled into a trie instead, so the
+pattern only follows the branches that match what is in the text, e.g.
+state_region_a, state_region_b and state_x become state_(?:region_[ab]|x).
+
+Sections can also be made of templates like building_group_{bgs}_{pop_types}_tax_mult,
+where each {type} stands for any object of that type. Each type becomes the pattern of
+its own keywords instead of writing out every combination, so the pattern grows with
+the number of objects and not with the number of combinations.
+
+This module must not import sublime or JominiTools, worker processes import it.
+"""
+
+import hashlib
+import itertools
+import re
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+# Marks the end of a keyword in the trie
+END = ""
+
+# Keys of the trie are single characters, or a {type} of a template
+Trie = Dict[str, "Trie"]
+
+reference_pattern = re.compile(r"(\{\w+\})")
+
+
+def build_trie(keys: Iterable[Sequence[str]]) -> Trie:
+    trie: Trie = dict()
+    for key in keys:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, dict())
+        node[END] = dict()
+    return trie
+
+
+def trie_pattern(node: Trie, references: Optional[Mapping[str, str]] = None) -> str:
+    """The pattern of a trie, references has the pattern of each {type} in it"""
+    optional = END in node
+    branches = sorted(x for x in node if x != END)
+    if not branches:
+        return ""
+
+    def token(x: str) -> str:
+        return references[x] if len(x) > 1 and references else re.escape(x)
+
+    # Whether body is a single character, group or class that ? can follow
+    atom = True
+    ends = [x for x in branches if list(node[x]) == [END] and len(x) == 1]
+    if len(branches) > 1 and len(ends) == len(branches):
+        # Keywords that only differ in their last character
+        body = "[{}]".format("".join(re.escape(x) for x in branches))
+    elif len(branches) == 1:
+        body = token(branches[0]) + trie_pattern(node[branches[0]], references)
+        # A single character that ends a keyword, otherwise a sequence
+        atom = bool(ends)
+    else:
+        body = "(?:{})".format(
+            "|".join(token(x) + trie_pattern(node[x], references) for x in branches)
+        )
+
+    if not optional:
+        return body
+    return body + "?" if atom else f"(?:{body})?"
+
+
+def keyword_pattern(keys: Iterable[str]) -> str:
+    """A pattern that matches exactly the keys, factored by their common prefixes"""
+    return trie_pattern(build_trie(x for x in keys if x))
+
+
+def template_tokens(template: str) -> List[str]:
+    """Split a template into its characters and {type} references"""
+    tokens: List[str] = list()
+    for part in reference_pattern.split(template):
+        if reference_pattern.fullmatch(part):
+            tokens.append(part)
+        else:
+            tokens.extend(part)
+    return tokens
+
+
+def template_pattern(
+    templates: Iterable[str], objects: Mapping[str, Sequence[str]]
+) -> str:
+    """A pattern that matches every name the templates make with objects, by type"""
+    references = {f"{{{k}}}": keyword_pattern(v) for k, v in objects.items()}
+    tokens = [template_tokens(x) for x in templates]
+    # Templates that refer to a type without objects don't make any names
+    tokens = [x for x in tokens if all(references.get(y) for y in x if len(y) > 1)]
+    return trie_pattern(build_trie(tokens), references)
+
+
+def expand_template(template: str, objects: Mapping[str, Sequence[str]]) -> List[str]:
+    """Every name a template makes with objects, by type"""
+    parts = reference_pattern.split(template)
+    choices = [objects[x[1:-1]] if x.startswith("{") else (x,) for x in parts]
+    return ["".join(x) for x in itertools.product(*choices)]
+
+
+class SyntaxSection(NamedTuple):
+    header: str
+    scope: str
+    keys: Sequence[str] = ()
+    # Templates of names and the objects they refer to, by type
+    templates: Sequence[str] = ()
+    objects: Mapping[str, Sequence[str]] = dict()
+
+    def pattern(self) -> str:
+        if self.templates:
+            return template_pattern(self.templates, self.objects)
+        return keyword_pattern(self.keys)
+
+    def names(self) -> List[str]:
+        """Every name the section matches"""
+        names = list(self.keys)
+        for template in self.templates:
+            names.extend(expand_template(template, self.objects))
+        return names
+
+    def text(self) -> str:
+        """The section in the format of JominiTools' write_syntax"""
+        return (
+            f"    # Generated {self.header}\n"
+            f"    - match: \\b({self.pattern()})\\b\n"
+            f"      scope: {self.scope}\n"
+        )
+
+    def digest(self) -> str:
+        data = hashlib.sha1(f"{self.header}\0{self.scope}\0".encode())
+        data.update("\n".join(self.keys).encode())
+        for template in self.templates:
+            data.update(f"\0{template}".encode())
+        for type_name in sorted(self.objects):
+            data.update(f"\0{type_name}\0".encode())
+            data.update("\n".join(self.objects[type_name]).encode())
+        return data.hexdigest()
@@ -0,0 +1,208 @@
+"""
+Prebuilt index of the game objects defined in the vanilla game files.
+
+The game files only change when Victoria 3 is patched, so they are parsed once per
+game version into an index that is stored next to the object cache. When an index
+exists for the installed version the loader reads the game's objects from it and only
+scans and parses the mod files. Like the object cache, the parsed objects are kept
+in a data file next to the index and are read back when a type is built.
+
+This module must not import sublime or JominiTools, indexes can be built outside of
+the plugin host.
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from .file_scanner import FileScanner
+from .object_cache import ObjectCache
+from .object_data import (
+    ObjectData,
+    Objects,
+    StoredObjects,
+    data_path,
+    remove_data,
+    resolve,
+    write_objects,
+)
+from .object_parser import ParsedObject, parse_file_together
+from .object_registry import ObjectType, object_types
+
+# Bump this whenever the format of the index or the parser output changes
+INDEX_VERSION = 3
+
+
+def game_version(game_files_path: str) -> Optional[str]:
+    """Get the installed game version from the launcher settings next to the game"""
+    install_path = os.path.dirname(game_files_path.rstrip("\\/"))
+    settings_path = os.path.join(install_path, "launcher", "launcher-settings.json")
+    try:
+        with open(settings_path, "r", encoding="utf-8-sig") as file:
+            settings = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    version = settings.get("rawVersion") or settings.get("version")
+    return str(version) if version else None
+
+
+def index_path(directory: str, version: str) -> str:
+    return os.path.join(directory, re.sub(r"[^\w.\-]", "_", version) + ".json")
+
+
+def type_key(object_type: ObjectType) -> list:
+    """What an indexed type was read with, the index is only valid while it matches"""
+    return json.loads(json.dumps([object_type.directory, object_type.options]))
+
+
+class VanillaIndex:
+    def __init__(self, version: str):
+        self.version = version
+        # type name -> path relative to the game root -> [size, mtime, objects],
+        # objects are StoredObjects once the index is saved or loaded
+        self.types: Dict[str, Dict[str, list]] = dict()
+        self.keys: Dict[str, list] = dict()
+        # Data file of the loaded or saved index, and replaced ones still to remove
+        self.data_file: Optional[str] = None
+        self.old_data: List[str] = list()
+
+    def has(self, type_name: str) -> bool:
+        """Is the type indexed with its current directory and parse options"""
+        return type_name in self.types and self.keys.get(type_name) == type_key(
+            object_types[type_name]
+        )
+
+    def add_type(self, type_name: str):
+        self.types[type_name] = dict()
+        self.keys[type_name] = type_key(object_types[type_name])
+
+    def add(
+        self,
+        type_name: str,
+        relative: str,
+        size: int,
+        mtime: int,
+        objects: Objects,
+    ):
+        self.types[type_name][relative] = [size, mtime, objects]
+
+    def contains(self, type_name: str, relative: str) -> bool:
+        return relative in self.types.get(type_name, ())
+
+    def objects(
+        self, type_name: str, relative: str, keep: bool = True
+    ) -> Optional[List[ParsedObject]]:
+        entry = self.types.get(type_name, dict()).get(relative)
+        return None if entry is None else resolve(entry[2], keep)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["VanillaIndex"]:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != INDEX_VERSION:
+            return None
+
+        stored = ObjectData(os.path.join(os.path.dirname(path), data.get("data", "")))
+        try:
+            stored.map()
+        except (OSError, ValueError):
+            return None
+
+        index = cls(data.get("game_version", ""))
+        index.types = {
+            type_name: {
+                relative: [size, mtime, StoredObjects(stored, offset, length)]
+                for relative, (size, mtime, offset, length) in indexed_files.items()
+            }
+            for type_name, indexed_files in data.get("types", dict()).items()
+        }
+        index.keys = data.get("keys", dict())
+        index.data_file = stored.path
+        return index
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        types = {
+            type_name: {relative: [x[0], x[1]] for relative, x in indexed_files.items()}
+            for type_name, indexed_files in self.types.items()
+        }
+        entries = [x for y in self.types.values() for x in y.values()]
+        new_data_path = data_path(path)
+        stored = write_objects(new_data_path, [x[2] for x in entries])
+        for header, stored_objects in zip(
+            [x for y in types.values() for x in y.values()], stored
+        ):
+            header.extend((stored_objects.offset, stored_objects.length))
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "game_version": self.version,
+                    "data": os.path.basename(new_data_path),
+                    "keys": self.keys,
+                    "types": types,
+                },
+                file,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, path)
+
+        for entry, stored_objects in zip(entries, stored):
+            entry[2] = stored_objects
+        if self.data_file is not None:
+            self.old_data.append(self.data_file)
+        self.data_file = new_data_path
+        self.old_data = remove_data(self.old_data)
+
+
+def build_index(
+    game_files_path: str,
+    version: str,
+    type_names: List[str],
+    cache: Optional[ObjectCache] = None,
+    index: Optional[VanillaIndex] = None,
+) -> VanillaIndex:
+    """
+    Index every game file of type_names, into index if it is given. Files that are
+    still valid in cache are taken from it, the rest are parsed once for all of the
+    types that read them.
+    """
+    root = game_files_path.rstrip("\\/")
+    scanner = FileScanner([root])
+    scanned = scanner.scan({object_types[x].directory for x in type_names})
+
+    if index is None:
+        index = VanillaIndex(version)
+    # path -> [size, mtime, the types that have to parse it]
+    unparsed: Dict[str, list] = dict()
+    for type_name in type_names:
+        object_type = object_types[type_name]
+        index.add_type(type_name)
+        cached_files = cache.types.get(type_name, dict()) if cache else dict()
+        for path, size, mtime in scanned[object_type.directory]:
+            if not object_type.options.accepts(os.path.basename(path)):
+                continue
+            entry = cached_files.get(path)
+            if entry is not None and entry[0] == size and entry[1] == mtime:
+                # Stored objects are copied to the index without decoding them
+                index.add(type_name, path[len(root) + 1 :], size, mtime, entry[2])
+            else:
+                unparsed.setdefault(path, [size, mtime, list()])[2].append(type_name)
+
+    for path, (size, mtime, parse_types) in unparsed.items():
+        options = [object_types[x].options for x in parse_types]
+        try:
+            parsed = parse_file_together(path, options)
+        except OSError:
+            continue
+        for type_name, objects in zip(parse_types, parsed):
+            index.add(type_name, path[len(root) + 1 :], size, mtime, objects)
+    return index
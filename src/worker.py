@@ -0,0 +1,66 @@
+"""
+Entry point for the plugin's worker processes, run as: python worker.py <task>
+
+The input of a task is read from stdin as json and its result is written to stdout as
+json. Workers run outside of sublime's plugin host so they can only use modules that
+don't import sublime or JominiTools.
+"""
+
+import importlib
+import json
+import os
+import sys
+import time
+import types
+
+package_name = "victoria3tools_worker"
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Make the modules in this directory importable as a package without running
+        # __init__.py, which imports the sublime API.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.dirname(os.path.abspath(__file__))]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
+
+
+def parse_task(data):
+    object_parser = import_module("object_parser")
+    results = list()
+    for path, options_list in data["jobs"]:
+        options_list = [object_parser.ParseOptions(*x) for x in options_list]
+        t0 = time.perf_counter()
+        try:
+            objects = object_parser.parse_file_together(path, options_list)
+        except OSError:
+            objects = None
+        results.append([objects, time.perf_counter() - t0])
+    return results
+
+
+def syntax_task(data):
+    syntax_file = import_module("syntax_file")
+    return syntax_file.write_syntax_file(
+        data["objects"],
+        data["fake_syntax_path"],
+        data["real_syntax_path"],
+        data["state_path"],
+    )
+
+
+tasks = {
+    "parse": parse_task,
+    "syntax": syntax_task,
+}
+
+
+def main():
+    task = tasks[sys.argv[1]]
+    data = json.load(sys.stdin)
+    json.dump(task(data), sys.stdout, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
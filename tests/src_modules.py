@@ -0,0 +1,25 @@
+"""
+Imports the modules in src that don't need sublime, so they can be tested with a
+plain python. Run the tests from the package directory with:
+
+    python -m unittest discover tests
+"""
+
+import importlib
+import os
+import sys
+import types
+
+tests_path = os.path.dirname(os.path.abspath(__file__))
+package_path = os.path.dirname(tests_path)
+package_name = "victoria3tools_tests"
+
+
+def import_module(name: str):
+    if package_name not in sys.modules:
+        # Import the modules in src as a package without running its __init__.py,
+        # which imports the sublime API.
+        package = types.ModuleType(package_name)
+        package.__path__ = [os.path.join(package_path, "src")]  # type: ignore
+        sys.modules[package_name] = package
+    return importlib.import_module(f"{package_name}.{name}")
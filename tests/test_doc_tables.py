@@ -0,0 +1,75 @@
+import os
+import struct
+import tempfile
+import unittest
+
+from src_modules import import_module
+
+doc_tables = import_module("doc_tables")
+
+tables = {
+    "effects": {
+        "add_modifier": "<b>add_modifier</b> adds a modifier",
+        "remove_modifier": "Removes a modifier",
+        "ünïcode_key": "ünïcode value",
+    },
+    "triggers": {
+        "has_modifier": "Removes a modifier",
+        "always": "",
+    },
+    "empty": {},
+}
+
+
+class DocTablesTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "game_docs.bin")
+        doc_tables.write_doc_tables(self.path, tables)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        read = doc_tables.read_doc_tables(self.path)
+        self.assertEqual(list(read), list(tables))
+        for name, table in tables.items():
+            self.assertEqual(dict(read[name]), table)
+            self.assertEqual(len(read[name]), len(table))
+
+    def test_lookup(self):
+        effects = doc_tables.read_doc_tables(self.path)["effects"]
+        self.assertEqual(effects["ünïcode_key"], "ünïcode value")
+        self.assertIn("add_modifier", effects)
+        self.assertNotIn("add", effects)
+        self.assertNotIn(None, effects)
+        self.assertIsNone(effects.get("missing"))
+        with self.assertRaises(KeyError):
+            effects["zzz"]
+
+    def test_strings_are_stored_once(self):
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self.assertEqual(data.count(b"Removes a modifier"), 1)
+
+    def test_with_entries(self):
+        effects = doc_tables.read_doc_tables(self.path)["effects"]
+        extended = effects.with_entries({"custom": "Custom", "add_modifier": "New"})
+        self.assertEqual(extended["custom"], "Custom")
+        self.assertEqual(extended["add_modifier"], "New")
+        self.assertEqual(len(extended), len(effects) + 1)
+        self.assertEqual(sorted(extended), sorted([*tables["effects"], "custom"]))
+        # The table it was made from is unchanged
+        self.assertNotIn("custom", effects)
+        self.assertEqual(effects["add_modifier"], tables["effects"]["add_modifier"])
+
+    def test_wrong_version(self):
+        with open(self.path, "r+b") as file:
+            file.seek(4)
+            file.write(struct.pack("<I", doc_tables.VERSION + 1))
+        with self.assertRaises(ValueError):
+            doc_tables.read_doc_tables(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+
+from src_modules import import_module
+
+dynamic_modifiers = import_module("dynamic_modifiers")
+
+objects = {
+    "bgs": ["bg_mining", "bg_manufacturing", "bg_mine"],
+    "buildings": ["building_coal_mine", "building_iron_mine"],
+    "cultures": ["french", "yankee"],
+    "igs": ["ig_landowners", "ig_rural_folk"],
+    "institutions": ["institution_schools", "institution_police"],
+    "laws": ["law_monarchy", "law_council_republic"],
+    "pop_types": ["laborers", "clerks", "clergy"],
+    "religions": ["catholic", "protestant"],
+}
+
+
+def baseline_modifiers(objects: dict) -> dict:
+    """The dynamic modifiers write_data_to_syntax enumerated, by syntax section"""
+    country, state, ig, bg, building = list(), list(), list(), list(), list()
+    for i in objects["igs"]:
+        ig.append(f"interest_group_{i}_pol_str_mult")
+        ig.append(f"interest_group_{i}_approval_add")
+        ig.append(f"interest_group_{i}_pop_attraction_mult")
+    for i in objects["bgs"]:
+        bg.append(f"building_group_{i}_tax_mult")
+        bg.append(f"building_group_{i}_employee_mult")
+        bg.append(f"building_group_{i}_throughput_add")
+        bg.append(f"building_group_{i}_standard_of_living_add")
+        bg.append(f"building_group_{i}_unincorporated_throughput_add")
+        bg.append(f"building_group_{i}_fertility_mult")
+        bg.append(f"building_group_{i}_mortality_mult")
+        country.append(f"country_subsidies_{i}")
+        for j in objects["pop_types"]:
+            bg.append(f"building_group_{i}_{j}_fertility_mult")
+            bg.append(f"building_group_{i}_{j}_mortality_mult")
+            bg.append(f"building_group_{i}_{j}_standard_of_living_add")
+    for i in objects["buildings"]:
+        building.append(f"{i}_throughput_add")
+    for i in objects["religions"]:
+        state.append(f"state_{i}_standard_of_living_add")
+    for i in objects["cultures"]:
+        state.append(f"state_{i}_standard_of_living_add")
+    for i in objects["institutions"]:
+        state.append(f"country_{i}_max_investment_add")
+    for i in objects["pop_types"]:
+        country.append(f"country_{i}_pol_str_mult")
+        country.append(f"country_{i}_voting_power_add")
+        state.append(f"state_{i}_mortality_mult")
+        state.append(f"state_{i}_dependent_wage_mult")
+        building.append(f"building_employment_{i}_add")
+        building.append(f"building_employment_{i}_mult")
+        building.append(f"building_{i}_fertility_mult")
+        building.append(f"building_{i}_mortality_mult")
+        building.append(f"building_{i}_shares_add")
+        building.append(f"building_{i}_shares_mult")
+        state.append(f"state_{i}_investment_pool_contribution_add")
+        state.append(f"state_{i}_investment_pool_efficiency_mult")
+        building.append(f"{i}_shares_add")
+        building.append(f"{i}_shares_mult")
+    for i in objects["laws"]:
+        state.append(f"state_pop_support_{i}_add")
+        state.append(f"state_pop_support_{i}_mult")
+    return {
+        "Country Modifier Types": country,
+        "State Modifier Types": state,
+        "Interest Group Modifier Types": ig,
+        "Building Group Modifier Types": bg,
+        "Building Modifier Types": building,
+    }
+
+
+class DynamicModifiersTest(unittest.TestCase):
+    def setUp(self):
+        self.modifiers = dynamic_modifiers.DynamicModifiers(objects)
+
+    def test_baseline_names(self):
+        for header, names in baseline_modifiers(objects).items():
+            for name in names:
+                self.assertEqual(self.modifiers.section(name), header, name)
+
+    def test_other_names(self):
+        names = {x for y in baseline_modifiers(objects).values() for x in y}
+        others = [
+            "building_group_bg_tax_mult",
+            "building_group_bg_mining_farmers_fertility_mult",
+            "country_subsidies_",
+            "country_subsidies_bg_minin",
+            "interest_group_ig_landowners_pol_str_mult_add",
+            "xbuilding_coal_mine_throughput_add",
+            "state_pop_support_law_monarchy",
+            "",
+        ]
+        others.extend(x + "_" for x in names)
+        others.extend(x[1:] for x in names)
+        for name in others:
+            if name in names:
+                continue
+            self.assertNotIn(name, self.modifiers)
+            self.assertIsNone(self.modifiers.section(name), name)
+
+    def test_sections_match_names(self):
+        sections = dynamic_modifiers.modifier_sections(objects)
+        baseline = baseline_modifiers(objects)
+        for section in sections:
+            self.assertEqual(
+                sorted(set(section.names())),
+                sorted(set(baseline.get(section.header, ()))),
+            )
+
+    def test_no_objects(self):
+        modifiers = dynamic_modifiers.DynamicModifiers({x: [] for x in objects})
+        self.assertNotIn("country_subsidies_bg_mining", modifiers)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src_modules import import_module
+
+object_cache = import_module("object_cache")
+ObjectCache = object_cache.ObjectCache
+
+
+class ObjectCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def data_files(self) -> list:
+        return sorted(x for x in os.listdir(self.directory.name) if x.endswith(".data"))
+
+    def test_round_trip(self):
+        cache = ObjectCache(self.path)
+        cache.put("buildings", "a.txt", 10, 20, [["building_a", 1]])
+        cache.put("buildings", "b.txt", 30, 40, [["building_b", 3]])
+        cache.put("goods", "c.txt", 50, 60, [])
+        cache.set_cost("buildings", 40)
+        cache.save()
+
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertTrue(loaded.has("buildings", "a.txt", 10, 20))
+        self.assertFalse(loaded.has("buildings", "a.txt", 10, 21))
+        self.assertFalse(loaded.has("goods", "a.txt", 10, 20))
+        self.assertEqual(loaded.objects("buildings", "a.txt"), [["building_a", 1]])
+        self.assertEqual(loaded.objects("buildings", "b.txt"), [["building_b", 3]])
+        self.assertEqual(loaded.objects("goods", "c.txt"), [])
+        self.assertIsNone(loaded.objects("goods", "missing.txt"))
+        self.assertEqual(loaded.costs, {"buildings": 40})
+        self.assertEqual(loaded.get_stats("buildings").hits, 1)
+        self.assertEqual(loaded.get_stats("buildings").misses, 1)
+
+    def test_remove_and_prune(self):
+        cache = ObjectCache(self.path)
+        cache.put("buildings", "a.txt", 1, 1, [["a", 1]])
+        cache.put("buildings", "b.txt", 1, 1, [["b", 1]])
+        cache.put("buildings", "c.txt", 1, 1, [["c", 1]])
+        cache.save()
+
+        cache.remove("buildings", "a.txt")
+        cache.prune("buildings", ["b.txt"])
+        self.assertTrue(cache.dirty)
+        cache.save()
+
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertEqual(list(loaded.types["buildings"]), ["b.txt"])
+        self.assertEqual(loaded.objects("buildings", "b.txt"), [["b", 1]])
+
+    def test_save_keeps_unchanged_objects(self):
+        cache = ObjectCache(self.path)
+        cache.put("buildings", "a.txt", 1, 1, [["a", 1]])
+        cache.save()
+        cache.put("buildings", "b.txt", 1, 1, [["b", 1]])
+        cache.save()
+
+        # Stored objects are copied to the new data file, the old one is removed
+        self.assertEqual(len(self.data_files()), 1)
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertEqual(loaded.objects("buildings", "a.txt"), [["a", 1]])
+        self.assertEqual(cache.objects("buildings", "b.txt"), [["b", 1]])
+
+    def test_shared_directory(self):
+        first = ObjectCache(self.path)
+        first.put("buildings", "a.txt", 1, 1, [["a", 1]])
+        first.save()
+
+        second = ObjectCache(self.path)
+        second.load()
+        second.put("buildings", "b.txt", 1, 1, [["b", 1]])
+        second.save()
+        first.put("buildings", "c.txt", 1, 1, [["c", 1]])
+        first.save()
+
+        # Each save only removed the data file it replaced
+        self.assertEqual(len(self.data_files()), 2)
+        self.assertEqual(second.objects("buildings", "a.txt"), [["a", 1]])
+        self.assertEqual(second.objects("buildings", "b.txt"), [["b", 1]])
+
+    def test_more_files_than_recently_read(self):
+        object_data = import_module("object_data")
+        count = object_data.recent_files + 10
+        cache = ObjectCache(self.path)
+        for index in range(count):
+            cache.put("buildings", f"{index}.txt", 1, 1, [[f"b_{index}", index]])
+        cache.save()
+
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertEqual(loaded.objects("buildings", "0.txt"), [["b_0", 0]])
+        # Building the type reads every file without evicting the recently read ones
+        for _ in range(2):
+            for index in range(count):
+                self.assertEqual(
+                    loaded.objects("buildings", f"{index}.txt", keep=False),
+                    [[f"b_{index}", index]],
+                )
+        data = loaded.types["buildings"]["0.txt"][2].data
+        self.assertEqual(list(data.recent), [0])
+
+        for index in range(count):
+            loaded.objects("buildings", f"{index}.txt")
+        self.assertEqual(len(data.recent), object_data.recent_files)
+        self.assertEqual(loaded.objects("buildings", "0.txt"), [["b_0", 0]])
+
+    def rewrite_header(self, **changes):
+        with open(self.path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        data.update(changes)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
+    def test_stale_version(self):
+        cache = ObjectCache(self.path)
+        cache.put("buildings", "a.txt", 1, 1, [["a", 1]])
+        cache.save()
+        self.rewrite_header(version=object_cache.CACHE_VERSION - 1)
+
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertEqual(loaded.types, {})
+
+    def test_missing_data_file(self):
+        cache = ObjectCache(self.path)
+        cache.put("buildings", "a.txt", 1, 1, [["a", 1]])
+        cache.save()
+        self.rewrite_header(data="cache.0.data")
+
+        loaded = ObjectCache(self.path)
+        loaded.load()
+        self.assertEqual(loaded.types, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
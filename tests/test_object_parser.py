@@ -0,0 +1,100 @@
+import unittest
+
+from src_modules import import_module
+
+object_parser = import_module("object_parser")
+ParseOptions = object_parser.ParseOptions
+
+
+def parse(text: str, **options) -> list:
+    return object_parser.parse_lines(text.splitlines(), ParseOptions(**options))
+
+
+class ParseLinesTest(unittest.TestCase):
+    def test_top_level_blocks(self):
+        text = "first = {\n\tinner = { a = b }\n}\nsecond = {\n}\n"
+        self.assertEqual(parse(text), [("first", 1), ("second", 4)])
+
+    def test_brace_on_the_next_line(self):
+        text = "first =\n{\n}\n\nsecond = # comment\n\n\t{ a = b }\n"
+        self.assertEqual(parse(text), [("first", 1), ("second", 5)])
+
+    def test_name_without_a_block(self):
+        # Only a { on the next line makes it a block
+        text = "@value = 5\nfirst =\nsecond = {\n}\n"
+        self.assertEqual(parse(text), [("second", 3)])
+
+    def test_colors(self):
+        text = "red = rgb { 255 0 0 }\nblue = hsv{ 0.6 1 1 }\n"
+        self.assertEqual(parse(text), [("red", 1), ("blue", 2)])
+
+    def test_comments_and_strings(self):
+        text = (
+            "# hidden = {\n"
+            'first = { name = "{ # }" }\n'
+            'second = { desc = "}}" } # third = {\n'
+        )
+        self.assertEqual(parse(text), [("first", 2), ("second", 3)])
+
+    def test_level(self):
+        text = "outer = {\n\tinner = {\n\t\tdeep = { }\n\t}\n\tvalue = 1\n}\n"
+        self.assertEqual(parse(text, level=1), [("inner", 2)])
+        self.assertEqual(
+            parse(text, level=object_parser.ANY_LEVEL),
+            [("outer", 1), ("inner", 2), ("deep", 3)],
+        )
+
+    def test_values(self):
+        text = "plain = 5\nformula = {\n\tvalue = 1\n}\n"
+        self.assertEqual(
+            parse(text, kind=object_parser.VALUE), [("plain", 1), ("formula", 2)]
+        )
+
+    def test_unbalanced_braces(self):
+        text = "}\nfirst = {\n}\n"
+        self.assertEqual(parse(text), [("first", 2)])
+
+    def test_gui(self):
+        text = (
+            "types Widgets {\n"
+            "\ttype my_button = button {\n\t}\n"
+            "}\n"
+            "template my_template\n"
+            "{\n}\n"
+            "template other { }\n"
+        )
+        self.assertEqual(
+            parse(text, kind=object_parser.GUI_TYPE, level=1), [("my_button", 2)]
+        )
+        self.assertEqual(
+            parse(text, kind=object_parser.GUI_TEMPLATE),
+            [("my_template", 5), ("other", 8)],
+        )
+
+    def test_together_matches_separate_passes(self):
+        text = (
+            "types Widgets {\n"
+            "\ttype my_button = button {\n\t}\n"
+            "}\n"
+            "template my_template\n"
+            "{\n}\n"
+        )
+        options_list = [
+            ParseOptions(kind=object_parser.GUI_TYPE, level=1),
+            ParseOptions(kind=object_parser.GUI_TEMPLATE),
+        ]
+        lines = text.splitlines()
+        self.assertEqual(
+            object_parser.parse_lines_together(lines, options_list),
+            [object_parser.parse_lines(lines, x) for x in options_list],
+        )
+
+    def test_accepts(self):
+        options = ParseOptions(ignored_files=("readme.txt",))
+        self.assertTrue(options.accepts("buildings.txt"))
+        self.assertFalse(options.accepts("readme.txt"))
+        self.assertFalse(options.accepts("buildings.gui"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import threading
+import unittest
+
+from src_modules import import_module
+
+object_store = import_module("object_store")
+ObjectStore = object_store.ObjectStore
+
+
+class ObjectStoreTest(unittest.TestCase):
+    def test_snapshots_are_immutable(self):
+        store = ObjectStore({"buildings": 1}, ["buildings", "goods"])
+        snapshot = store.snapshot()
+        with self.assertRaises(TypeError):
+            snapshot.objects["goods"] = 2  # type: ignore
+
+        store.publish({"goods": 2, "buildings": 3})
+        # The old snapshot still holds what was published before
+        self.assertEqual(dict(snapshot.objects), {"buildings": 1})
+        self.assertEqual(dict(store.snapshot().objects), {"buildings": 3, "goods": 2})
+        self.assertEqual(store.snapshot().version, snapshot.version + 1)
+
+    def test_publish_nothing(self):
+        store = ObjectStore({"buildings": 1})
+        snapshot = store.snapshot()
+        self.assertIs(store.publish({}), snapshot)
+
+    def test_mapping(self):
+        store = ObjectStore()
+        store["buildings"] = 1
+        store.update(goods=2)
+        self.assertEqual(store["buildings"], 1)
+        self.assertIn("goods", store)
+        self.assertEqual(sorted(store), ["buildings", "goods"])
+        self.assertEqual(len(store), 2)
+
+        snapshot = store.snapshot()
+        del store["buildings"]
+        self.assertNotIn("buildings", store)
+        self.assertIn("buildings", snapshot.objects)
+        with self.assertRaises(KeyError):
+            store["buildings"]
+
+    def test_pending_types(self):
+        store = ObjectStore(type_names=["buildings", "goods", "laws"])
+        store.publish({"goods": 2})
+        self.assertTrue(store.is_loaded("goods"))
+        self.assertEqual(store.pending(), ["buildings", "laws"])
+        self.assertEqual(
+            store.readiness(), {"buildings": False, "goods": True, "laws": False}
+        )
+        self.assertIsNone(store.ready("buildings"))
+        self.assertEqual(store.ready("goods"), 2)
+
+    def test_ready_requests_pending_types(self):
+        requested = list()
+
+        class RequestingStore(ObjectStore):
+            def request(self, type_name: str):
+                requested.append(type_name)
+
+        store = RequestingStore({"goods": 2}, ["buildings", "goods"])
+        store.ready("goods")
+        store.ready("buildings")
+        self.assertEqual(requested, ["buildings"])
+
+    def test_concurrent_publish(self):
+        store = ObjectStore()
+
+        def publish(index: int):
+            for count in range(200):
+                store.publish({f"type_{index}_{count}": count})
+
+        threads = [threading.Thread(target=publish, args=(x,)) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # No publish was lost to another one made at the same time
+        self.assertEqual(len(store), 800)
+        self.assertEqual(store.snapshot().version, 800)
+
+
+if __name__ == "__main__":
+    unittest.main()
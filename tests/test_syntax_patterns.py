@@ -0,0 +1,152 @@
+import random
+import re
+import unittest
+
+from src_modules import import_module
+
+syntax_patterns = import_module("syntax_patterns")
+SyntaxSection = syntax_patterns.SyntaxSection
+
+
+def write_syntax(names: list, header: str, scope: str) -> str:
+    """The flat alternation JominiTools' write_syntax generates"""
+    return (
+        f"    # Generated {header}\n"
+        "    - match: \\b(" + "|".join(names) + ")\\b\n"
+        f"      scope: {scope}\n"
+    )
+
+
+def section_pattern(text: str) -> str:
+    return re.search(r"- match: (.*)\n", text).group(1)
+
+
+def candidates(names: list) -> list:
+    """Words around names, including their prefixes and names that extend them"""
+    words = set(names)
+    for name in names:
+        words.update(name[:x] for x in range(1, len(name)))
+        words.update((name + "_x", name + "s", "x_" + name, name.upper()))
+    return sorted(words)
+
+
+class KeywordPatternTest(unittest.TestCase):
+    def assert_same_matches(self, names: list):
+        section = SyntaxSection("Buildings", "entity.name.building", names)
+        text = section.text()
+        flat = write_syntax(names, "Buildings", "entity.name.building")
+        self.assertEqual(
+            text.replace(section_pattern(text), ""),
+            flat.replace(section_pattern(flat), ""),
+        )
+
+        pattern = re.compile(section_pattern(text))
+        flat_pattern = re.compile(section_pattern(flat))
+        words = candidates(names)
+        for word in words:
+            self.assertEqual(
+                bool(pattern.fullmatch(word)),
+                bool(flat_pattern.fullmatch(word)),
+                word,
+            )
+        line = " ".join(words) + f" a.{names[0]}=b"
+        self.assertEqual(pattern.findall(line), flat_pattern.findall(line))
+
+    def test_shared_prefixes(self):
+        self.assert_same_matches(
+            ["state_region_a", "state_region_b", "state_x", "state", "stat", "other"]
+        )
+
+    def test_single_keyword(self):
+        self.assert_same_matches(["building_steel_mills"])
+
+    def test_keywords_ending_in_one_character(self):
+        self.assert_same_matches(["law_a", "law_b", "law_c", "law_", "law_ab"])
+
+    def test_random_names(self):
+        rng = random.Random(3)
+        parts = ["building", "group", "bg", "a", "ab", "mine", "mines", "_", "1"]
+        names = sorted(
+            {
+                "".join(rng.choice(parts) for _ in range(rng.randint(1, 4)))
+                for _ in range(300)
+            }
+        )
+        self.assert_same_matches(names)
+
+    def test_empty_keys_are_skipped(self):
+        self.assertEqual(syntax_patterns.keyword_pattern(["", "a"]), "a")
+        self.assertEqual(syntax_patterns.keyword_pattern([]), "")
+
+    def test_factored(self):
+        self.assertEqual(
+            syntax_patterns.keyword_pattern(
+                ["state_region_a", "state_region_b", "state_x"]
+            ),
+            "state_(?:region_[ab]|x)",
+        )
+
+    def test_digest(self):
+        first = SyntaxSection("Buildings", "entity.name.building", ["a", "b"])
+        self.assertEqual(
+            first.digest(),
+            SyntaxSection("Buildings", "entity.name.building", ["a", "b"]).digest(),
+        )
+        self.assertNotEqual(
+            first.digest(),
+            SyntaxSection("Buildings", "entity.name.building", ["a", "c"]).digest(),
+        )
+        self.assertNotEqual(
+            first.digest(),
+            SyntaxSection("Buildings", "other.scope", ["a", "b"]).digest(),
+        )
+
+
+template_objects = {
+    "bgs": ["bg_mining", "bg_farming", "bg_mine"],
+    "pop_types": ["laborers", "clerks", "clergy"],
+    "goods": [],
+}
+templates = [
+    "building_group_{bgs}_{pop_types}_tax_mult",
+    "building_group_{bgs}_throughput_add",
+    "goods_{goods}_output_mult",
+    "country_{pop_types}_pol_str_mult",
+]
+
+
+class TemplatePatternTest(unittest.TestCase):
+    def test_matches_every_combination(self):
+        section = SyntaxSection(
+            "Modifiers", "entity.name.modifier", (), templates, template_objects
+        )
+        names = section.names()
+        # Every bg with every pop type, every bg, no goods and every pop type
+        self.assertEqual(len(names), 3 * 3 + 3 + 0 + 3)
+        self.assertIn("building_group_bg_mine_clerks_tax_mult", names)
+
+        pattern = re.compile(section_pattern(section.text()))
+        flat_pattern = re.compile(section_pattern(write_syntax(names, "", "")))
+        for word in candidates(names):
+            self.assertEqual(
+                bool(pattern.fullmatch(word)), bool(flat_pattern.fullmatch(word)), word
+            )
+
+    def test_expand_template(self):
+        self.assertEqual(
+            syntax_patterns.expand_template("{bgs}_{goods}", template_objects), []
+        )
+        self.assertEqual(
+            syntax_patterns.expand_template("x_{bgs}", {"bgs": ["a", "b"]}),
+            ["x_a", "x_b"],
+        )
+
+    def test_type_without_objects(self):
+        self.assertEqual(
+            syntax_patterns.template_pattern(["goods_{goods}_mult"], template_objects),
+            "",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()